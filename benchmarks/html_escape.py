@@ -0,0 +1,74 @@
+from http_server.utils import HtmlUtils
+
+from typing import Callable, Dict, Tuple
+import timeit
+
+PAYLOADS: Dict[str, str] = {
+    "short clean": "Hello, world",
+    "long clean": "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 100,
+    "short markup": "<b class=\"name\">Tom & Jerry's</b>",
+    "traceback": (
+        "Traceback (most recent call last):\n"
+        + '  File "server.py", line 42, in handle\n'
+        + "\traise HttpError(<StatusCode.NOT_FOUND: 404>)\n"
+    )
+    * 20,
+    "html document": "<div class='row'><a href=\"/?a=1&b=2\">link</a></div>\n" * 100,
+}
+NUMBER = 5000
+
+
+def replace_chain(string: str) -> str:
+    replacements = {
+        "&": "&amp;",
+        "'": "&#39;",
+        '"': "&quot;",
+        "\t": "&emsp;",
+        "<": "&lt;",
+        ">": "&gt;",
+        "\n": "<br>",
+    }
+
+    for escape, html in replacements.items():
+        string = string.replace(escape, html)
+
+    return string
+
+
+REPEAT = 9
+
+
+def measure(function: Callable[[], object], number: int = NUMBER) -> float:
+    return timeit.timeit(function, number=number) / number * 1e6
+
+
+def compare(
+    before: Callable[[], object], after: Callable[[], object]
+) -> Tuple[float, float]:
+    timings = [(measure(before), measure(after)) for _ in range(REPEAT)]
+    return min(timing[0] for timing in timings), min(timing[1] for timing in timings)
+
+
+def main() -> None:
+    print(f"{'payload':<16}{'replace chain':>16}{'string_to_html':>16}{'speedup':>10}")
+    for name, payload in PAYLOADS.items():
+        assert HtmlUtils.string_to_html(payload) == replace_chain(payload)
+        before, after = compare(
+            lambda: replace_chain(payload),
+            lambda: HtmlUtils.string_to_html(payload),
+        )
+        print(f"{name:<16}{before:>13.2f} us{after:>13.2f} us{before / after:>9.1f}x")
+
+    values = [f"user {index} <{index}@example.com>" for index in range(50)]
+    one_by_one, bulk = compare(
+        lambda: [HtmlUtils.escape(value) for value in values],
+        lambda: HtmlUtils.escape_many(values),
+    )
+    print(
+        f"\nescaping {len(values)} values: {one_by_one:.2f} us one by one, "
+        + f"{bulk:.2f} us with escape_many ({one_by_one / bulk:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+from http_server.utils import JsonUtils
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict
+import json
+import timeit
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+@dataclass
+class User:
+    id: int
+    name: str
+    email: str
+    active: bool
+    score: float
+
+
+RECORDS = [
+    {
+        "id": index,
+        "name": f"user {index}",
+        "email": f"user{index}@example.com",
+        "active": index % 3 != 0,
+        "score": index * 1.5,
+        "tags": ["admin", "staff"] if index % 10 == 0 else [],
+    }
+    for index in range(100)
+]
+PAYLOADS: Dict[str, Any] = {
+    "status": {"status": "ok", "count": 3, "next": None},
+    "records": RECORDS,
+    "nested": {
+        "page": {"number": 1, "size": 20, "total": 500},
+        "items": RECORDS[:20],
+        "links": {"self": "/users?page=1", "next": "/users?page=2"},
+    },
+    "dataclasses": [
+        User(
+            id=index,
+            name=f"user {index}",
+            email=f"user{index}@example.com",
+            active=True,
+            score=index * 1.5,
+        )
+        for index in range(100)
+    ],
+}
+NUMBER = 2000
+ENCODER = json.JSONEncoder(
+    ensure_ascii=False, separators=JsonUtils.SEPARATORS, default=JsonUtils.default
+)
+ENCODERS: Dict[str, Callable[[Any], bytes] | None] = {
+    "json.dumps": lambda value: json.dumps(value, default=JsonUtils.default).encode(),
+    "json compact": lambda value: ENCODER.encode(value).encode(),
+    "ujson": (
+        lambda value: ujson.dumps(
+            value,
+            ensure_ascii=False,
+            escape_forward_slashes=False,
+            default=JsonUtils.default,
+        ).encode()
+    )
+    if ujson is not None
+    else None,
+    "orjson": (
+        lambda value: orjson.dumps(
+            value, default=JsonUtils.default, option=orjson.OPT_NON_STR_KEYS
+        )
+    )
+    if orjson is not None
+    else None,
+}
+
+
+def measure(function: Callable[[], object]) -> float:
+    return min(timeit.repeat(function, number=NUMBER, repeat=5)) / NUMBER * 1e6
+
+
+def main() -> None:
+    print(f"JsonUtils backend: {JsonUtils.BACKEND}\n")
+    print(f"{'payload':<14}" + "".join(f"{name:>15}" for name in ENCODERS))
+    for name, payload in PAYLOADS.items():
+        expected = json.loads(ENCODER.encode(payload))
+        cells = []
+        for encoder in ENCODERS.values():
+            if encoder is None:
+                cells.append(f"{'n/a':>15}")
+                continue
+            assert json.loads(encoder(payload)) == expected
+            cells.append(f"{measure(lambda: encoder(payload)):>12.2f} us")
+        print(f"{name:<14}" + "".join(cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -33,11 +33,14 @@ class App:
         self.server.add_route(function=self.add, path="/add")
 
     def index(
-        self, payload: str, headers: Dict[str, str], cookies: Dict[str, Cookie]
+        self,
+        payload: bytes | None,
+        headers: Dict[str, str],
+        cookies: Dict[str, Cookie],
     ) -> bytes:
         return FileUtils.template(
             path="resources/index.html",
-            payload=payload,
+            payload=repr(payload),
             headers=repr(headers),
             cookies=repr(cookies),
         )
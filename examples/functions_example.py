@@ -17,10 +17,12 @@ app.add_file_route(
 
 
 @app.route()
-def index(payload: str, headers: Dict[str, str], cookies: Dict[str, Cookie]) -> bytes:
+def index(
+    payload: bytes | None, headers: Dict[str, str], cookies: Dict[str, Cookie]
+) -> bytes:
     return FileUtils.template(
         path="resources/index.html",
-        payload=payload,
+        payload=repr(payload),
         headers=repr(headers),
         cookies=repr(cookies),
     )
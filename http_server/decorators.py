@@ -1,6 +1,8 @@
 from typing import Callable, Set, Dict
 from .models.cookie import Cookie
+from .models.response_context import ResponseContext
 import inspect
+import types
 
 
 class _InjectedFunction:
@@ -11,20 +13,28 @@ class _InjectedFunction:
         self.__annotations__ = function.__annotations__
         self.__doc__ = function.__doc__
         self.function = function
-        if cookies:
-            self.cookies: Set[Cookie] = set()
-        if headers:
-            self.headers: Dict[str, str] = {}
-        self._instance = None
+        self.injects_cookies = cookies
+        self.injects_headers = headers
         self.__signature__ = inspect.signature(function)
 
+    @property
+    def cookies(self) -> Set[Cookie]:
+        if not self.injects_cookies:
+            raise AttributeError(f"'{self.__name__}' is not injected with cookies.")
+        return ResponseContext.current().cookies
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        if not self.injects_headers:
+            raise AttributeError(f"'{self.__name__}' is not injected with headers.")
+        return ResponseContext.current().headers
+
     def __get__(self, instance, _):
-        self._instance = instance
-        return self
+        if instance is None:
+            return self
+        return types.MethodType(self, instance)
 
     def __call__(self, *args, **kwargs):
-        if self._instance:
-            return self.function(self._instance, *args, **kwargs)
         return self.function(*args, **kwargs)
 
 
@@ -3,3 +3,5 @@ from .header_types import HeaderType
 from .methods import Method
 from .status_codes import StatusCode
 from .cookie_attributes import CookieAttribute
+from .opcodes import Opcode
+from .close_codes import CloseCode
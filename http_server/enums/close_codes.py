@@ -0,0 +1,24 @@
+from enum import IntEnum
+
+
+class CloseCode(IntEnum):
+    NORMAL = 1000
+    GOING_AWAY = 1001
+    PROTOCOL_ERROR = 1002
+    UNSUPPORTED_DATA = 1003
+    NO_STATUS = 1005
+    ABNORMAL = 1006
+    INVALID_PAYLOAD = 1007
+    POLICY_VIOLATION = 1008
+    MESSAGE_TOO_BIG = 1009
+    MANDATORY_EXTENSION = 1010
+    INTERNAL_ERROR = 1011
+
+    @classmethod
+    def is_valid(cls, code: int) -> bool:
+        if 3000 <= code <= 4999:
+            return True
+        return code in cls._value2member_map_ and code not in (
+            cls.NO_STATUS,
+            cls.ABNORMAL,
+        )
@@ -9,3 +9,58 @@ class ContentType(Enum):
     JSON = "application/json"
     WOFF2 = "font/woff2"
     TTF = "font/ttf"
+    WOFF = "font/woff"
+    OTF = "font/otf"
+    PNG = "image/png"
+    GIF = "image/gif"
+    SVG = "image/svg+xml"
+    ICO = "image/x-icon"
+    WEBP = "image/webp"
+    AVIF = "image/avif"
+    TEXT = "text/plain; charset=utf-8"
+    CSV = "text/csv; charset=utf-8"
+    XML = "application/xml"
+    PDF = "application/pdf"
+    ZIP = "application/zip"
+    WASM = "application/wasm"
+    MANIFEST = "application/manifest+json"
+    MP3 = "audio/mpeg"
+    MP4 = "video/mp4"
+    WEBM = "video/webm"
+    EVENT_STREAM = "text/event-stream; charset=utf-8"
+    BINARY = "application/octet-stream"
+    FORM = "application/x-www-form-urlencoded"
+    MULTIPART = "multipart/form-data"
+
+
+EXTENSION_TO_CONTENT_TYPE = {
+    ".html": ContentType.HTML,
+    ".htm": ContentType.HTML,
+    ".jpg": ContentType.IMAGE,
+    ".jpeg": ContentType.IMAGE,
+    ".css": ContentType.CSS,
+    ".js": ContentType.JS,
+    ".mjs": ContentType.JS,
+    ".json": ContentType.JSON,
+    ".map": ContentType.JSON,
+    ".woff2": ContentType.WOFF2,
+    ".ttf": ContentType.TTF,
+    ".woff": ContentType.WOFF,
+    ".otf": ContentType.OTF,
+    ".png": ContentType.PNG,
+    ".gif": ContentType.GIF,
+    ".svg": ContentType.SVG,
+    ".ico": ContentType.ICO,
+    ".webp": ContentType.WEBP,
+    ".avif": ContentType.AVIF,
+    ".txt": ContentType.TEXT,
+    ".csv": ContentType.CSV,
+    ".xml": ContentType.XML,
+    ".pdf": ContentType.PDF,
+    ".zip": ContentType.ZIP,
+    ".wasm": ContentType.WASM,
+    ".webmanifest": ContentType.MANIFEST,
+    ".mp3": ContentType.MP3,
+    ".mp4": ContentType.MP4,
+    ".webm": ContentType.WEBM,
+}
@@ -9,3 +9,26 @@ class HeaderType(Enum):
     COOKIE = "Cookie"
     SET_COOKIE = "Set-Cookie"
     CACHE_CONTROL = "Cache-Control"
+    CONNECTION = "Connection"
+    KEEP_ALIVE = "Keep-Alive"
+    TRANSFER_ENCODING = "Transfer-Encoding"
+    ETAG = "ETag"
+    LAST_MODIFIED = "Last-Modified"
+    IF_NONE_MATCH = "If-None-Match"
+    IF_MODIFIED_SINCE = "If-Modified-Since"
+    VARY = "Vary"
+    ACCEPT_ENCODING = "Accept-Encoding"
+    CONTENT_ENCODING = "Content-Encoding"
+    RANGE = "Range"
+    IF_RANGE = "If-Range"
+    ACCEPT_RANGES = "Accept-Ranges"
+    CONTENT_RANGE = "Content-Range"
+    AUTHORIZATION = "Authorization"
+    EXPECT = "Expect"
+    ALLOW = "Allow"
+    LAST_EVENT_ID = "Last-Event-ID"
+    UPGRADE = "Upgrade"
+    SEC_WEBSOCKET_KEY = "Sec-WebSocket-Key"
+    SEC_WEBSOCKET_ACCEPT = "Sec-WebSocket-Accept"
+    SEC_WEBSOCKET_VERSION = "Sec-WebSocket-Version"
+    SEC_WEBSOCKET_PROTOCOL = "Sec-WebSocket-Protocol"
@@ -9,7 +9,18 @@ class StatusCode(Enum):
     CREATED = (201, "Created")
     MOVED_PERMANENTLY = (301, "Moved Permanently")
     FOUND = (302, "Found")
+    NOT_MODIFIED = (304, "Not Modified")
     FORBIDDEN = (402, "Forbidden")
+    METHOD_NOT_ALLOWED = (405, "Method Not Allowed")
+    SWITCHING_PROTOCOLS = (101, "Switching Protocols")
+    UPGRADE_REQUIRED = (426, "Upgrade Required")
+    NOT_IMPLEMENTED = (501, "Not Implemented")
+    PARTIAL_CONTENT = (206, "Partial Content")
+    RANGE_NOT_SATISFIABLE = (416, "Range Not Satisfiable")
+    PAYLOAD_TOO_LARGE = (413, "Payload Too Large")
+    UNSUPPORTED_MEDIA_TYPE = (415, "Unsupported Media Type")
+    CONTINUE = (100, "Continue")
+    NO_CONTENT = (204, "No Content")
 
     def __init__(self, code: int, message: str):
         self.code = code
@@ -1,2 +1,5 @@
+from .base_handler import BaseHandler
 from .client_handler import ClientHandler
 from .logging_handler import LoggingHandler
+from .async_client_handler import AsyncClientHandler
+from .supervisor_handler import SupervisorHandler
@@ -0,0 +1,524 @@
+from .base_handler import BaseHandler
+from .logging_handler import LoggingHandler
+from ..models import (
+    HttpError,
+    Response,
+    Resource,
+    FileResource,
+    WebSocketResource,
+    WebSocket,
+    WebSocketClosed,
+    Request,
+    RequestBody,
+    Form,
+    ResponseContext,
+)
+from ..utils.router import Router
+from ..utils.file_cache import FileCache, CachedFile
+from ..utils.response_cache import ResponseCache
+from ..utils.compressor import Compressor, StreamCompressor
+from ..utils.socket_writer import SocketWriter
+from ..utils.stream_pump import StreamPump
+from ..utils.websocket_parser import WebSocketParser
+from ..enums import StatusCode, CloseCode
+from ..types import Chunk, Content
+
+from typing import AsyncIterator, Iterator, List, Tuple, Dict, Set, Any
+from concurrent.futures import Executor
+import asyncio
+import contextvars
+import functools
+import inspect
+
+logger = LoggingHandler.create_logger(__name__)
+
+
+class AsyncClientHandler(BaseHandler):
+    READ_SIZE = 65536
+    HEARTBEAT = b": heartbeat\n\n"
+    _revalidations: Set[asyncio.Task] = set()
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        router: Router,
+        error_routes: Dict[StatusCode, Resource],
+        file_cache: FileCache,
+        response_cache: ResponseCache,
+        compressor: Compressor,
+        executor: Executor,
+        timeout: float = 50,
+        keep_alive_timeout: float = 5,
+        max_requests: int = 100,
+        high_water_mark: int = SocketWriter.HIGH_WATER_MARK,
+        max_body_size: int = RequestBody.MAX_SIZE,
+        spool_size: int = RequestBody.SPOOL_SIZE,
+    ) -> None:
+        super().__init__(
+            address=writer.get_extra_info("peername"),
+            router=router,
+            error_routes=error_routes,
+            file_cache=file_cache,
+            response_cache=response_cache,
+            compressor=compressor,
+            timeout=timeout,
+            keep_alive_timeout=keep_alive_timeout,
+            max_requests=max_requests,
+            max_body_size=max_body_size,
+            spool_size=spool_size,
+        )
+        self.reader = reader
+        self.writer = writer
+        self.executor = executor
+        self.loop = asyncio.get_running_loop()
+        self.writer.transport.set_write_buffer_limits(high=high_water_mark)
+
+        logger.debug(f"Initiated {self.__class__.__name__} on {self.address}.")
+
+    async def handle(self) -> None:
+        try:
+            await self._handle()
+            while await self._wait_for_request():
+                await self._handle()
+        except Exception as e:
+            logger.error(repr(e))
+        finally:
+            await self._close()
+
+    async def _close(self) -> None:
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+        logger.debug(f"Closed connection with {self.address}.")
+
+    async def _wait_for_request(self) -> bool:
+        if not self.keep_alive:
+            return False
+
+        if self.parser.has_buffered_data():
+            return True
+
+        try:
+            data = await asyncio.wait_for(
+                self.reader.read(self.READ_SIZE), self.keep_alive_timeout
+            )
+        except (asyncio.TimeoutError, ConnectionError):
+            logger.debug(f"Keep-alive connection with {self.address} timed out.")
+            return False
+
+        self.parser.feed(data)
+        return bool(data)
+
+    async def _handle(self) -> None:
+        self.keep_alive = False
+        self.head = False
+        response = await self._generate_response()
+        self._finish_body()
+        self._prepare_stream(response)
+        self._add_connection_headers(response)
+        self._omit_body(response)
+
+        try:
+            self.writer.writelines(response.to_buffers())
+            await self.writer.drain()
+            logger.debug(f"Sent full response for {self.address} request.")
+
+            if response.upgrade is not None:
+                await response.upgrade()
+            if response.file is not None and response.file.size:
+                await self._send_file(response.file, response.file_parts)
+            if response.stream is not None:
+                await self._send_stream(
+                    response.stream, response.heartbeat, response.compressor
+                )
+        finally:
+            self._release_file(response)
+            self._close_body()
+
+    async def _send_file(
+        self, file: CachedFile, parts: List[bytes | Tuple[int, int]] | None = None
+    ) -> None:
+        for part in parts if parts is not None else [(0, file.size)]:
+            if isinstance(part, bytes):
+                self.writer.write(part)
+            else:
+                await self._send_file_range(file, *part)
+        await self.writer.drain()
+
+    async def _send_file_range(self, file: CachedFile, offset: int, count: int) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.sendfile(
+                self.writer.transport, file.file, offset, count, fallback=False
+            )
+            logger.debug(f"Sent '{file.path}' to {self.address} using sendfile.")
+            return
+        except (asyncio.SendfileNotAvailableError, NotImplementedError):
+            pass
+
+        self.writer.write(file.view()[offset : offset + count])
+        await self.writer.drain()
+        logger.debug(f"Sent '{file.path}' to {self.address} using mmap.")
+
+    async def _send_stream(
+        self,
+        stream: Iterator[Chunk] | AsyncIterator[Chunk],
+        heartbeat: float | None = None,
+        compressor: StreamCompressor | None = None,
+    ) -> None:
+        count = 0
+        batches = self._batches(stream)
+        if heartbeat is not None:
+            batches = self._with_heartbeats(batches, heartbeat)
+        try:
+            async for batch in batches:
+                if data := self._encode_chunks(batch, compressor):
+                    self.writer.write(data)
+                    await self.writer.drain()
+                    count += len(batch)
+            self.writer.write(self._last_chunk(compressor))
+            await self.writer.drain()
+        except Exception:
+            self.keep_alive = False
+            raise
+        finally:
+            await batches.aclose()
+
+        logger.debug(f"Streamed {count} chunks to {self.address}.")
+
+    async def _batches(
+        self, stream: Iterator[Chunk] | AsyncIterator[Chunk]
+    ) -> AsyncIterator[List[Chunk]]:
+        if isinstance(stream, AsyncIterator):
+            try:
+                async for chunk in stream:
+                    yield [chunk]
+            finally:
+                if aclose := getattr(stream, "aclose", None):
+                    await aclose()
+            return
+
+        loop = asyncio.get_running_loop()
+        pump = StreamPump(stream=stream, loop=loop)
+        loop.run_in_executor(self.executor, pump.run)
+        try:
+            async for batch in pump.batches():
+                yield batch
+        finally:
+            pump.close()
+
+    async def _with_heartbeats(
+        self, batches: AsyncIterator[List[Chunk]], interval: float
+    ) -> AsyncIterator[List[Chunk]]:
+        pending = asyncio.ensure_future(anext(batches))
+        disconnect = asyncio.ensure_future(self.reader.read(self.READ_SIZE))
+        try:
+            while True:
+                done, _ = await asyncio.wait(
+                    {pending, disconnect},
+                    timeout=interval,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if disconnect in done:
+                    if disconnect.exception() is not None or not disconnect.result():
+                        raise ConnectionResetError(
+                            f"{self.address} closed the event stream."
+                        )
+                    disconnect = asyncio.ensure_future(
+                        self.reader.read(self.READ_SIZE)
+                    )
+
+                if pending in done:
+                    try:
+                        batch = pending.result()
+                    except StopAsyncIteration:
+                        return
+                    yield batch
+                    pending = asyncio.ensure_future(anext(batches))
+                elif not done:
+                    yield [self.HEARTBEAT]
+        finally:
+            disconnect.cancel()
+            pending.cancel()
+            await asyncio.gather(pending, return_exceptions=True)
+            await batches.aclose()
+
+    def _upgrade(
+        self, resource: WebSocketResource, request: Request, kwargs: Dict[str, Any]
+    ) -> Response:
+        response, subprotocol = self._websocket_handshake(resource, request)
+        response.upgrade = functools.partial(
+            self._run_websocket, resource, request, kwargs, subprotocol
+        )
+        return response
+
+    async def _run_websocket(
+        self,
+        resource: WebSocketResource,
+        request: Request,
+        kwargs: Dict[str, Any],
+        subprotocol: str | None,
+    ) -> None:
+        parser = WebSocketParser(max_message_size=resource.max_message_size)
+        parser.feed(bytes(self.parser.buffer))
+        self.parser.buffer.clear()
+        websocket = WebSocket(
+            reader=self.reader,
+            writer=self.writer,
+            request=request,
+            parser=parser,
+            subprotocol=subprotocol,
+        )
+        logger.debug(f"Upgraded {self.address} connection to WebSocket.")
+
+        code = CloseCode.NORMAL
+        try:
+            await resource.function(**{**kwargs, Request.WEBSOCKET_KEY: websocket})
+        except WebSocketClosed:
+            pass
+        except Exception as error:
+            logger.warning(f"WebSocket handler of {self.address} failed: {repr(error)}")
+            code = CloseCode.INTERNAL_ERROR
+        finally:
+            await websocket.close(code)
+        logger.debug(
+            f"Closed WebSocket with {self.address} ({websocket.close_code})."
+        )
+
+    def _revalidate(
+        self, resource: Resource, request: Request, kwargs: Dict[str, Any]
+    ) -> None:
+        task = asyncio.create_task(self._refresh(resource, request, kwargs))
+        self._revalidations.add(task)
+        task.add_done_callback(self._revalidations.discard)
+
+    async def _refresh(
+        self, resource: Resource, request: Request, kwargs: Dict[str, Any]
+    ) -> None:
+        try:
+            content, context = await self._execute_resource(
+                resource=resource, kwargs=kwargs
+            )
+            self._revalidate_response(
+                resource=resource,
+                request=request,
+                content=content,
+                context=context,
+            )
+        except Exception as error:
+            logger.warning(
+                f"Could not revalidate cached response for {self.address}: "
+                + f"{repr(error)}"
+            )
+        finally:
+            self._end_revalidation(resource=resource, request=request)
+
+    async def _generate_response(self) -> Response:
+        try:
+            request = await self._receive_request()
+            logger.debug(f"Received {self.address} request.")
+
+            resource, path_parameters = self._prepare(request)
+            await self._receive_body(resource, request)
+            kwargs = self._build_kwargs(resource, request, path_parameters)
+            if isinstance(resource, FileResource):
+                return await self._async_file_response(resource, request)
+            if isinstance(resource, WebSocketResource):
+                return self._upgrade(resource, request, kwargs)
+
+            cached, revalidate = self._cached_response(resource, request)
+            if cached is not None:
+                if revalidate:
+                    self._revalidate(resource=resource, request=request, kwargs=kwargs)
+                return cached
+
+            content, context = await self._execute_resource(
+                resource=resource, kwargs=kwargs
+            )
+
+            logger.debug(
+                f"{self.address} request matched function ("
+                + f"{resource.function.__name__}) arguments."
+            )
+
+            response = self._content_to_response(
+                resource=resource,
+                content=content,
+                context=context,
+            )
+            response = self._finalize_response(
+                resource=resource, request=request, response=response
+            )
+            logger.debug(f"Response for {self.address} created.")
+        except Exception as error:
+            logger.warning(
+                f"Couldn't create response for {self.address}, "
+                + f"trying to create error response: {repr(error)}"
+            )
+            response = await self._generate_error_response(error=error)
+            return self._add_error_headers(error=error, response=response)
+        return response
+
+    async def _async_file_response(
+        self, resource: FileResource, request: Request
+    ) -> Response:
+        if self._is_file_serialized(resource, request):
+            return self._file_response(resource, request)
+        return await self.loop.run_in_executor(
+            self.executor, self._file_response, resource, request
+        )
+
+    async def _generate_error_response(
+        self, error: Exception, max_tries: int = 3
+    ) -> Response:
+        status = self._error_status(error)
+
+        if status not in self.error_routes.keys():
+            return Response.from_error(status_code=status, error=error)
+        resource = self.error_routes[status]
+        logger.debug(f"Found '{status}' error resource for {self.address}.")
+
+        try:
+            content, context = await self._execute_resource(resource)
+            logger.debug(f"{self.address} {status} error content created.")
+            response = self._content_to_response(
+                resource=resource,
+                content=content,
+                context=context,
+            )
+            logger.debug(f"{self.address} {status} error response generated.")
+        except (HttpError, Exception) as error:
+            logger.warning(
+                f"Could not create {status} resource for {self.address}"
+                + f" ({max_tries} tries left): {repr(error)}"
+            )
+            if max_tries <= 1:
+                logger.debug(
+                    f"Creating default error for: {self.address}. "
+                    + f"Reason: {repr(error)}"
+                )
+                return Response.from_error(error=error)
+            response = await self._generate_error_response(
+                error=error, max_tries=max_tries - 1
+            )
+        return response
+
+    async def _receive_request(self) -> Request:
+        while (request := self._next_request()) is None:
+            try:
+                data = await asyncio.wait_for(
+                    self.reader.read(self.READ_SIZE), self.timeout
+                )
+            except (asyncio.TimeoutError, ConnectionError):
+                raise self._bad_request(
+                    f"Could not receive data from client at {self.address}."
+                )
+            if not data:
+                raise self._bad_request(
+                    f"No data received from client at {self.address}."
+                )
+            self.parser.feed(data)
+
+        return request
+
+    async def _receive_body(self, resource: Resource, request: Request) -> None:
+        if resource.plan.payload or resource.plan.json_body:
+            chunks = []
+            while chunk := await self._read_body_chunk():
+                chunks.append(chunk)
+            request.payload = b"".join(chunks) or None
+        if resource.plan.json_body:
+            request.json_body = self._decode_json(request)
+        if resource.plan.form:
+            request.form = await self._receive_form(request)
+        if not resource.plan.body:
+            while await self._read_body_chunk():
+                pass
+        elif resource.spool_body:
+            file = self._spool_file()
+            while chunk := await self._read_body_chunk():
+                file.write(chunk)
+            request.body = RequestBody.from_file(file)
+            logger.debug(f"Spooled {self.body_received} body bytes of {self.address}.")
+        else:
+            request.body = RequestBody(
+                read_chunk=self._read_body_chunk_threadsafe,
+                aread_chunk=self._read_body_chunk,
+            )
+        self.body = request.body
+
+    async def _receive_form(self, request: Request) -> Form:
+        parser = self._form_parser(request)
+        try:
+            while chunk := await self._read_body_chunk():
+                parser.feed(chunk)
+            form = parser.finish()
+        except ValueError as error:
+            raise self._form_error(error)
+        logger.debug(f"Parsed {parser.parts} form parts of {self.address}.")
+        return form
+
+    async def _read_body_chunk(self) -> bytes:
+        while not (data := self._read_parsed_body()):
+            if self.parser.body_complete:
+                return b""
+            if self.expect_continue:
+                self.writer.write(self._continue_response())
+            try:
+                data = await asyncio.wait_for(
+                    self.reader.read(self.READ_SIZE), self.timeout
+                )
+            except (asyncio.TimeoutError, ConnectionError):
+                raise self._bad_request(
+                    f"Could not receive request body from {self.address}."
+                )
+            if not data:
+                raise self._bad_request(
+                    f"Connection with {self.address} closed during request body."
+                )
+            self.parser.feed(data)
+
+        return self._count_body(data)
+
+    def _read_body_chunk_threadsafe(self) -> bytes:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run_coroutine_threadsafe(
+                self._read_body_chunk(), self.loop
+            ).result()
+        raise RuntimeError(
+            "Coroutine routes must read the request body with 'async for'."
+        )
+
+    async def _execute_resource(
+        self, resource: Resource, kwargs: Dict[str, Any] | None = None
+    ) -> Tuple[Content, ResponseContext]:
+        kwargs = kwargs if kwargs else {}
+        context = ResponseContext()
+        try:
+            with context.activate():
+                if self._is_coroutine_function(resource.function):
+                    content = await resource.function(**kwargs)
+                else:
+                    loop = asyncio.get_running_loop()
+                    content = await loop.run_in_executor(
+                        self.executor,
+                        contextvars.copy_context().run,
+                        functools.partial(resource.function, **kwargs),
+                    )
+                    if inspect.iscoroutine(content):
+                        content = await content
+        except (TypeError, AttributeError) as error:
+            raise self._execution_error(error)
+
+        return content, context
+
+    @staticmethod
+    def _is_coroutine_function(function: Any) -> bool:
+        return inspect.iscoroutinefunction(function) or inspect.iscoroutinefunction(
+            getattr(function, "function", None)
+        )
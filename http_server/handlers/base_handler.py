@@ -0,0 +1,871 @@
+from .logging_handler import LoggingHandler
+from ..models import (
+    HttpError,
+    Response,
+    Resource,
+    FileResource,
+    EventResource,
+    WebSocketResource,
+    Event,
+    Redirect,
+    Request,
+    RequestBody,
+    Form,
+    ResponseContext,
+    SerializedResponse,
+)
+from ..enums import StatusCode, HeaderType, Method, ContentType
+from ..utils.http_stream_parser import HttpStreamParser
+from ..utils.router import Router
+from ..utils.file_cache import FileCache, FileStat
+from ..utils.compressor import Compressor, StreamCompressor
+from ..utils.file import FileUtils
+from ..utils.response_cache import ResponseCache
+from ..utils.etag import ETagUtils
+from ..utils.date import DateUtils
+from ..utils.byte_range import ByteRangeUtils
+from ..utils.form_parser import FormParser
+from ..utils.json import JsonUtils
+from ..types import Chunk, Content
+
+from typing import AsyncIterator, Hashable, Iterator, List, Tuple, Dict, Any
+import base64
+import binascii
+import hashlib
+import secrets
+import tempfile
+
+logger = LoggingHandler.create_logger(__name__)
+
+
+class BaseHandler:
+    WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+    WEBSOCKET_VERSION = "13"
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        router: Router,
+        error_routes: Dict[StatusCode, Resource],
+        file_cache: FileCache,
+        response_cache: ResponseCache,
+        compressor: Compressor,
+        timeout: float = 50,
+        keep_alive_timeout: float = 5,
+        max_requests: int = 100,
+        max_body_size: int = RequestBody.MAX_SIZE,
+        spool_size: int = RequestBody.SPOOL_SIZE,
+    ) -> None:
+        self.address = address
+        self.router = router
+        self.error_routes = error_routes
+        self.file_cache = file_cache
+        self.response_cache = response_cache
+        self.compressor = compressor
+        self.timeout = timeout
+        self.keep_alive_timeout = keep_alive_timeout
+        self.max_requests = max_requests
+        self.max_body_size = max_body_size
+        self.spool_size = spool_size
+        self.requests_count = 0
+        self.keep_alive = False
+        self.chunked = True
+        self.head = False
+        self.parser = HttpStreamParser()
+        self.body: RequestBody | None = None
+        self.form: Form | None = None
+        self.body_limit = max_body_size
+        self.body_received = 0
+        self.expect_continue = False
+
+    def _add_connection_headers(self, response: Response) -> None:
+        if response.upgrade is not None:
+            return
+        if not self.keep_alive:
+            response.headers[HeaderType.CONNECTION.value] = "close"
+            return
+
+        response.headers[HeaderType.CONNECTION.value] = "keep-alive"
+        response.headers[HeaderType.KEEP_ALIVE.value] = (
+            f"timeout={int(self.keep_alive_timeout)}, "
+            + f"max={self.max_requests - self.requests_count}"
+        )
+
+    def _prepare_stream(self, response: Response) -> None:
+        if response.heartbeat is not None:
+            self.keep_alive = False
+        if response.stream is None or self.chunked:
+            return
+
+        response.headers.pop(HeaderType.TRANSFER_ENCODING.value, None)
+        self.keep_alive = False
+
+    def _omit_body(self, response: Response) -> None:
+        bodyless = response.status_code in Response.BODYLESS_STATUSES
+        if bodyless:
+            response.headers.pop(HeaderType.CONTENT_LENGTH.value, None)
+            response.headers.pop(HeaderType.TRANSFER_ENCODING.value, None)
+        if not (self.head or bodyless):
+            return
+        response.content = None
+        self._release_file(response)
+        response.file_parts = None
+        response.stream = None
+        response.compressor = None
+
+    def _release_file(self, response: Response) -> None:
+        if response.file is not None:
+            response.file.release()
+            response.file = None
+
+    def _encode_chunks(
+        self, chunks: List[Chunk], compressor: StreamCompressor | None = None
+    ) -> bytes:
+        data = b"".join(
+            chunk.encode() if isinstance(chunk, str) else chunk for chunk in chunks
+        )
+        if data and compressor is not None:
+            data = compressor.compress(data)
+        return self._frame_chunk(data)
+
+    def _frame_chunk(self, data: bytes) -> bytes:
+        if not self.chunked or not data:
+            return data
+        return b"%x\r\n%b\r\n" % (len(data), data)
+
+    def _event_stream(
+        self, events: Iterator[Event | str] | AsyncIterator[Event | str]
+    ) -> Iterator[bytes] | AsyncIterator[bytes]:
+        if isinstance(events, AsyncIterator):
+            return self._encode_async_events(events)
+        return self._encode_events(events)
+
+    def _encode_events(self, events: Iterator[Event | str]) -> Iterator[bytes]:
+        try:
+            for event in events:
+                yield self._encode_event(event)
+        finally:
+            getattr(events, "close", lambda: None)()
+
+    async def _encode_async_events(
+        self, events: AsyncIterator[Event | str]
+    ) -> AsyncIterator[bytes]:
+        try:
+            async for event in events:
+                yield self._encode_event(event)
+        finally:
+            if aclose := getattr(events, "aclose", None):
+                await aclose()
+
+    def _encode_event(self, event: Event | str) -> bytes:
+        if isinstance(event, str):
+            event = Event(data=event)
+        elif not isinstance(event, Event):
+            raise TypeError(f"Expected {repr(Event)} or {repr(str)}, got {event!r}.")
+        return event.encode()
+
+    def _last_chunk(self, compressor: StreamCompressor | None = None) -> bytes:
+        data = self._frame_chunk(compressor.finish() if compressor else b"")
+        return data + b"0\r\n\r\n" if self.chunked else data
+
+    def _should_keep_alive(self, request: Request) -> bool:
+        if self.requests_count >= self.max_requests:
+            return False
+
+        connection = request.get_header(HeaderType.CONNECTION.value) or ""
+        tokens = {token.strip().lower() for token in connection.split(",")}
+        if request.version == "HTTP/1.0":
+            return "keep-alive" in tokens
+        return "close" not in tokens
+
+    def _prepare(self, request: Request) -> Tuple[Resource, Dict[str, Any]]:
+        logger.debug(f"Parsed {self.address} request: {request.header()}")
+
+        self.requests_count += 1
+        self.keep_alive = self._should_keep_alive(request)
+        self.chunked = request.version != "HTTP/1.0"
+        self.head = request.method == Method.HEAD
+
+        resource, path_parameters = self._find_resource(request)
+        logger.debug(f"Found {self.address} requested resource.")
+
+        self._start_body(resource, request)
+        return resource, path_parameters
+
+    def _build_kwargs(
+        self, resource: Resource, request: Request, path_parameters: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        if isinstance(resource, FileResource):
+            return {}
+
+        kwargs = resource.plan.build(request=request, path_parameters=path_parameters)
+        logger.debug(f"Loaded {self.address} kwargs.")
+        return kwargs
+
+    def _start_body(self, resource: Resource, request: Request) -> None:
+        self.body_limit = (
+            self.max_body_size
+            if resource.max_body_size is None
+            else resource.max_body_size
+        )
+        self.body_received = 0
+        content_length = self.parser.content_length
+        if content_length is not None and content_length > self.body_limit:
+            raise self._payload_too_large()
+
+        expect = request.get_header(HeaderType.EXPECT.value) or ""
+        self.expect_continue = (
+            request.version != "HTTP/1.0"
+            and expect.lower() == "100-continue"
+            and not self.parser.body_complete
+        )
+
+    def _count_body(self, data: bytes) -> bytes:
+        self.body_received += len(data)
+        if self.body_received > self.body_limit:
+            raise self._payload_too_large()
+        return data
+
+    def _continue_response(self) -> bytes:
+        self.expect_continue = False
+        status = StatusCode.CONTINUE
+        return f"{Response.VERSION} {status.code} {status.message}\r\n\r\n".encode()
+
+    def _spool_file(self) -> tempfile.SpooledTemporaryFile:
+        return tempfile.SpooledTemporaryFile(max_size=self.spool_size)
+
+    def _form_parser(self, request: Request) -> FormParser:
+        content_type = request.get_header(HeaderType.CONTENT_TYPE.value)
+        try:
+            parser = FormParser.create(content_type, spool_size=self.spool_size)
+        except ValueError as error:
+            raise self._form_error(error)
+        if parser is None:
+            raise HttpError(
+                message=f"{self.address} form has unsupported type {content_type}.",
+                status_code=StatusCode.UNSUPPORTED_MEDIA_TYPE,
+            )
+        self.form = parser.form
+        return parser
+
+    def _decode_json(self, request: Request) -> Any:
+        if request.payload is None:
+            return None
+
+        content_type = request.get_header(HeaderType.CONTENT_TYPE.value) or ""
+        media_type = content_type.partition(";")[0].strip().lower()
+        if media_type != ContentType.JSON.value and not media_type.endswith("+json"):
+            raise HttpError(
+                message=f"{self.address} JSON body has type {content_type!r}.",
+                status_code=StatusCode.UNSUPPORTED_MEDIA_TYPE,
+            )
+        try:
+            return JsonUtils.loads(request.payload)
+        except ValueError as error:
+            raise self._bad_request(f"Could not decode {self.address} JSON: {error}")
+
+    def _form_error(self, error: ValueError) -> HttpError:
+        return self._bad_request(f"Could not parse {self.address} form: {error}")
+
+    def _finish_body(self) -> None:
+        if not self.parser.body_complete:
+            self.keep_alive = False
+
+    def _close_body(self) -> None:
+        if self.body is not None:
+            self.body.close()
+            self.body = None
+        if self.form is not None:
+            self.form.close()
+            self.form = None
+
+    def _payload_too_large(self) -> HttpError:
+        return HttpError(
+            message=f"{self.address} request body exceeds {self.body_limit} bytes.",
+            status_code=StatusCode.PAYLOAD_TOO_LARGE,
+        )
+
+    def _add_error_headers(self, error: Exception, response: Response) -> Response:
+        if isinstance(error, HttpError):
+            response.headers.update(error.headers)
+        return response
+
+    def _websocket_handshake(
+        self, resource: WebSocketResource, request: Request
+    ) -> Tuple[Response, str | None]:
+        upgrade = (request.get_header(HeaderType.UPGRADE.value) or "").lower()
+        connection = request.get_header(HeaderType.CONNECTION.value) or ""
+        tokens = {token.strip().lower() for token in connection.split(",")}
+        if upgrade != "websocket" or "upgrade" not in tokens:
+            raise HttpError(
+                message=f"{self.address} request is not a WebSocket upgrade.",
+                status_code=StatusCode.UPGRADE_REQUIRED,
+                headers={HeaderType.UPGRADE.value: "websocket"},
+            )
+
+        version = request.get_header(HeaderType.SEC_WEBSOCKET_VERSION.value)
+        if version != self.WEBSOCKET_VERSION:
+            raise HttpError(
+                message=f"Unsupported WebSocket version {version!r}.",
+                status_code=StatusCode.UPGRADE_REQUIRED,
+                headers={
+                    HeaderType.SEC_WEBSOCKET_VERSION.value: self.WEBSOCKET_VERSION
+                },
+            )
+
+        key = request.get_header(HeaderType.SEC_WEBSOCKET_KEY.value) or ""
+        try:
+            valid = len(base64.b64decode(key, validate=True)) == 16
+        except binascii.Error:
+            valid = False
+        if not valid:
+            raise self._bad_request(f"Invalid WebSocket key from {self.address}.")
+
+        digest = hashlib.sha1((key + self.WEBSOCKET_GUID).encode()).digest()
+        headers = {
+            HeaderType.UPGRADE.value: "websocket",
+            HeaderType.CONNECTION.value: "Upgrade",
+            HeaderType.SEC_WEBSOCKET_ACCEPT.value: base64.b64encode(digest).decode(),
+        }
+
+        offered = request.get_header(HeaderType.SEC_WEBSOCKET_PROTOCOL.value) or ""
+        subprotocol = next(
+            (
+                protocol
+                for protocol in (token.strip() for token in offered.split(","))
+                if protocol in resource.subprotocols
+            ),
+            None,
+        )
+        if subprotocol is not None:
+            headers[HeaderType.SEC_WEBSOCKET_PROTOCOL.value] = subprotocol
+
+        self.keep_alive = False
+        response = Response(status_code=StatusCode.SWITCHING_PROTOCOLS, headers=headers)
+        return response, subprotocol
+
+    def _error_status(self, error: Exception) -> StatusCode:
+        if isinstance(error, HttpError):
+            return error.status_code
+        return StatusCode.INTERNAL_SERVER_ERROR
+
+    def _next_request(self) -> Request | None:
+        try:
+            request = self.parser.next_head()
+        except ValueError as error:
+            raise self._bad_request(f"Could not parse {self.address} request: {error}")
+        return request
+
+    def _read_parsed_body(self) -> bytes:
+        try:
+            return self.parser.read_body()
+        except ValueError as error:
+            raise self._bad_request(f"Could not parse {self.address} body: {error}")
+
+    def _bad_request(self, message: str) -> HttpError:
+        return HttpError(message=message, status_code=StatusCode.BAD_REQUEST)
+
+    def _find_resource(self, request: Request) -> Tuple[Resource, Dict[str, Any]]:
+        return self.router.find(method=request.method, path=request.path)
+
+    def _file_response(self, resource: FileResource, request: Request) -> Response:
+        try:
+            stat, ranges, encoding, path = self._file_target(resource, request)
+            serialized = self._serialized_file(resource, stat, encoding, path)
+            if self._is_not_modified(request, {}, stat.mtime, etag=serialized.etag):
+                return self._not_modified_response(
+                    self._file_headers(resource, stat, encoding)
+                )
+
+            if ranges is not None:
+                return self._range_response(resource, stat, serialized, ranges)
+            response = serialized.copy()
+            if response.content is None and stat.size:
+                response.file = self.file_cache.get(path)
+        except OSError as error:
+            raise HttpError(
+                message=f"Could not open {self.address} requested file: {repr(error)}.",
+                status_code=StatusCode.NOT_FOUND,
+            )
+
+        logger.debug(f"Loaded '{resource.file_path}' for {self.address}.")
+        return response
+
+    def _is_file_serialized(self, resource: FileResource, request: Request) -> bool:
+        try:
+            if self.file_cache.stat(resource.file_path).etag is None:
+                return False
+            stat, _, encoding, path = self._file_target(resource, request)
+            serialized = self._find_serialized_file(resource, stat, encoding, path)
+        except OSError:
+            return True
+        return serialized is not None
+
+    def _file_target(
+        self, resource: FileResource, request: Request
+    ) -> Tuple[FileStat, List[Tuple[int, int]] | None, str | None, str]:
+        stat = self.file_cache.stat(resource.file_path)
+        ranges = self._requested_ranges(resource, request, stat)
+        encoding, path = None, resource.file_path
+        if ranges is None:
+            encoding, path = self._file_encoding(resource, request, stat)
+        return stat, ranges, encoding, path
+
+    def _requested_ranges(
+        self, resource: FileResource, request: Request, stat: FileStat
+    ) -> List[Tuple[int, int]] | None:
+        header = request.get_header(HeaderType.RANGE.value)
+        if (
+            header is None
+            or request.method != Method.GET
+            or resource.success_status != StatusCode.OK
+        ):
+            return None
+
+        if_range = request.get_header(HeaderType.IF_RANGE.value)
+        if if_range is not None and not self._if_range_matches(
+            if_range, resource, stat
+        ):
+            return None
+        return ByteRangeUtils.parse(header, stat.size)
+
+    def _if_range_matches(
+        self, if_range: str, resource: FileResource, stat: FileStat
+    ) -> bool:
+        if_range = if_range.strip()
+        if if_range.startswith('"'):
+            return if_range == self.file_cache.etag(resource.file_path, stat)
+        if if_range.startswith("W/"):
+            return False
+        try:
+            date = DateUtils.from_http_date(if_range)
+        except ValueError:
+            return False
+        return int(stat.mtime) == date.timestamp()
+
+    def _range_response(
+        self,
+        resource: FileResource,
+        stat: FileStat,
+        serialized: SerializedResponse,
+        ranges: List[Tuple[int, int]],
+    ) -> Response:
+        if not ranges:
+            raise HttpError(
+                message=f"{self.address} requested range is not satisfiable.",
+                status_code=StatusCode.RANGE_NOT_SATISFIABLE,
+                headers={
+                    HeaderType.CONTENT_RANGE.value: ByteRangeUtils.unsatisfied_range(
+                        stat.size
+                    )
+                },
+            )
+
+        headers = self._file_headers(resource, stat)
+        content_type = resource.content_type
+        parts: List[bytes | Tuple[int, int]] = []
+        if len(ranges) == 1:
+            start, end = ranges[0]
+            headers[HeaderType.CONTENT_RANGE.value] = ByteRangeUtils.content_range(
+                start, end, stat.size
+            )
+            parts.append((start, end - start + 1))
+        else:
+            boundary = secrets.token_hex(16)
+            headers[HeaderType.CONTENT_TYPE.value] = (
+                f"multipart/byteranges; boundary={boundary}"
+            )
+            content_type = None
+            for start, end in ranges:
+                range_header = ByteRangeUtils.content_range(start, end, stat.size)
+                parts.append(
+                    (
+                        f"--{boundary}\r\n"
+                        + f"{HeaderType.CONTENT_TYPE.value}: "
+                        + f"{resource.content_type.value}\r\n"
+                        + f"{HeaderType.CONTENT_RANGE.value}: {range_header}\r\n\r\n"
+                    ).encode()
+                )
+                parts.append((start, end - start + 1))
+                parts.append(b"\r\n")
+            parts.append(f"--{boundary}--\r\n".encode())
+
+        length = sum(
+            len(part) if isinstance(part, bytes) else part[1] for part in parts
+        )
+        headers[HeaderType.CONTENT_LENGTH.value] = str(length)
+        response = Response(
+            status_code=StatusCode.PARTIAL_CONTENT,
+            headers=headers,
+            content_type=content_type,
+        )
+        if serialized.content is not None:
+            response.content = b"".join(
+                part
+                if isinstance(part, bytes)
+                else serialized.content[part[0] : part[0] + part[1]]
+                for part in parts
+            )
+        else:
+            response.file = self.file_cache.get(resource.file_path)
+            response.file_parts = parts
+
+        logger.debug(f"Loaded {len(ranges)} ranges of '{resource.file_path}'.")
+        return response
+
+    def _file_encoding(
+        self, resource: FileResource, request: Request, stat: FileStat
+    ) -> Tuple[str | None, str]:
+        if not self.compressor.is_compressible(resource.content_type, stat.size):
+            return None, resource.file_path
+
+        encoded_files = self._encoded_files(resource, stat)
+        encodings = tuple(
+            encoding
+            for encoding in Compressor.ENCODINGS
+            if encoding in encoded_files
+            or (
+                encoding in self.compressor.encodings
+                and stat.size <= self.compressor.max_file_size
+            )
+        )
+        encoding = self.compressor.negotiate(
+            request.get_header(HeaderType.ACCEPT_ENCODING.value), encodings
+        )
+        path = encoded_files.get(encoding, resource.file_path)
+        if path != resource.file_path:
+            try:
+                self.file_cache.stat(path)
+            except OSError:
+                resource.encoded_files = None
+                return self._file_encoding(resource, request, stat)
+        return encoding, path
+
+    def _encoded_files(self, resource: FileResource, stat: FileStat) -> Dict[str, str]:
+        encoded_files = resource.encoded_files
+        if encoded_files is not None and encoded_files[0] is stat:
+            return encoded_files[1]
+
+        paths: Dict[str, str] = {}
+        for encoding, extension in Compressor.EXTENSIONS.items():
+            path = resource.file_path + extension
+            try:
+                encoded_stat = self.file_cache.stat(path)
+            except OSError:
+                continue
+            if encoded_stat.mtime >= stat.mtime and encoded_stat.size:
+                paths[encoding] = path
+
+        resource.encoded_files = (stat, paths)
+        logger.debug(f"Found {len(paths)} precompressed '{resource.file_path}' files.")
+        return paths
+
+    def _find_serialized_file(
+        self, resource: FileResource, stat: FileStat, encoding: str | None, path: str
+    ) -> SerializedResponse | None:
+        path_stat = stat
+        if path != resource.file_path:
+            path_stat = self.file_cache.stat(path)
+
+        serialized_file = resource.serialized_files.get(encoding)
+        if (
+            serialized_file is not None
+            and serialized_file[0] is stat
+            and serialized_file[1] is path_stat
+        ):
+            return serialized_file[2]
+        return None
+
+    def _serialized_file(
+        self, resource: FileResource, stat: FileStat, encoding: str | None, path: str
+    ) -> SerializedResponse:
+        serialized = self._find_serialized_file(resource, stat, encoding, path)
+        if serialized is not None:
+            return serialized
+
+        path_stat = stat
+        if path != resource.file_path:
+            path_stat = self.file_cache.stat(path)
+        headers = self._file_headers(resource, stat, encoding)
+        content = None
+        if encoding is not None and path == resource.file_path:
+            content = self.compressor.compress(
+                FileUtils.read(path), encoding, Compressor.FILE_LEVELS[encoding]
+            )
+            logger.debug(f"Compressed '{path}' with {encoding}.")
+        elif path_stat.size <= resource.MAX_IN_MEMORY_SIZE:
+            content = FileUtils.read(path)
+        else:
+            headers[HeaderType.CONTENT_LENGTH.value] = str(path_stat.size)
+
+        serialized = SerializedResponse.from_response(
+            Response(
+                status_code=resource.success_status,
+                headers=headers,
+                content=content,
+                content_type=resource.content_type,
+            )
+        )
+        resource.serialized_files[encoding] = (stat, path_stat, serialized)
+        logger.debug(f"Serialized '{path}' response headers.")
+        return serialized
+
+    def _file_headers(
+        self, resource: FileResource, stat: FileStat, encoding: str | None = None
+    ) -> Dict[str, str]:
+        headers = self._cache_headers(resource)
+        etag = self.file_cache.etag(resource.file_path, stat)
+        headers[HeaderType.ETAG.value] = etag
+        headers[HeaderType.LAST_MODIFIED.value] = stat.last_modified
+        headers[HeaderType.ACCEPT_RANGES.value] = ByteRangeUtils.UNIT
+        if self.compressor.is_compressible(resource.content_type, stat.size):
+            self._add_vary(headers, HeaderType.ACCEPT_ENCODING.value)
+        if encoding is not None:
+            headers[HeaderType.ETAG.value] = ETagUtils.for_encoding(etag, encoding)
+            headers[HeaderType.CONTENT_ENCODING.value] = encoding
+        return headers
+
+    @staticmethod
+    def _add_vary(headers: Dict[str, str], header: str) -> None:
+        vary = headers.get(HeaderType.VARY.value)
+        if vary is None:
+            headers[HeaderType.VARY.value] = header
+        elif header.lower() not in {name.strip().lower() for name in vary.split(",")}:
+            headers[HeaderType.VARY.value] = f"{vary}, {header}"
+
+    def _cache_headers(self, resource: Resource) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        if resource.cache is not None:
+            headers[HeaderType.CACHE_CONTROL.value] = str(resource.cache)
+        if resource.vary:
+            headers[HeaderType.VARY.value] = ", ".join(resource.vary)
+        return headers
+
+    def _cached_response(
+        self, resource: Resource, request: Request
+    ) -> Tuple[Response | None, bool]:
+        serialized = resource.serialized.get(self._response_encoding(resource, request))
+        if serialized is not None:
+            response, revalidate = serialized.copy(), False
+        elif self._is_cacheable(resource, request):
+            cached = self.response_cache.get(self._cache_key(resource, request))
+            if cached is None:
+                return None, False
+            response, revalidate = cached
+        else:
+            return None, False
+
+        logger.debug(f"Found cached response for {self.address} request.")
+        if self._is_not_modified(request, response.headers, etag=response.etag):
+            headers = self._cache_headers(resource)
+            if response.etag is not None:
+                headers[HeaderType.ETAG.value] = response.etag
+            return self._not_modified_response(headers), revalidate
+        return response, revalidate
+
+    def _finalize_response(
+        self, resource: Resource, request: Request, response: Response
+    ) -> Response:
+        self._encode_response(resource, request, response)
+        self._store_response(resource, request, response)
+
+        if self._is_not_modified(request, response.headers):
+            not_modified = self._not_modified_response(response.headers)
+            not_modified.cookies = response.cookies
+            return not_modified
+        return response
+
+    def _encode_response(
+        self, resource: Resource, request: Request, response: Response
+    ) -> None:
+        self._add_etag(resource, response)
+        self._compress_response(resource, request, response)
+
+    def _response_encoding(self, resource: Resource, request: Request) -> str | None:
+        if not self.compressor.is_compressible(resource.content_type):
+            return None
+        return self.compressor.negotiate(
+            request.get_header(HeaderType.ACCEPT_ENCODING.value)
+        )
+
+    def _compress_response(
+        self, resource: Resource, request: Request, response: Response
+    ) -> None:
+        if (
+            response.status_code in Response.BODYLESS_STATUSES
+            or HeaderType.CONTENT_ENCODING.value in response.headers
+        ):
+            return
+        size = None if response.stream is not None else len(response.content or b"")
+        if not self.compressor.is_compressible(resource.content_type, size):
+            return
+
+        self._add_vary(response.headers, HeaderType.ACCEPT_ENCODING.value)
+        encoding = self._response_encoding(resource, request)
+        if encoding is None:
+            return
+
+        response.headers[HeaderType.CONTENT_ENCODING.value] = encoding
+        if etag := response.headers.get(HeaderType.ETAG.value):
+            response.headers[HeaderType.ETAG.value] = ETagUtils.for_encoding(
+                etag, encoding
+            )
+        if response.stream is not None:
+            response.compressor = self.compressor.stream(encoding)
+            return
+
+        response.content = self.compressor.compress(response.content, encoding)
+        response.headers[HeaderType.CONTENT_LENGTH.value] = str(len(response.content))
+        logger.debug(f"Compressed {self.address} response with {encoding}.")
+
+    def _add_etag(self, resource: Resource, response: Response) -> None:
+        if (
+            resource.etag
+            and response.content is not None
+            and response.status_code == resource.success_status
+        ):
+            etag = ETagUtils.from_bytes(response.content)
+            response.headers[HeaderType.ETAG.value] = etag
+
+    def _revalidate_response(
+        self,
+        resource: Resource,
+        request: Request,
+        content: Content,
+        context: ResponseContext,
+    ) -> None:
+        response = self._content_to_response(
+            resource=resource, content=content, context=context
+        )
+        self._encode_response(resource, request, response)
+        self._store_response(resource, request, response)
+        logger.debug(f"Revalidated cached response for {self.address} request.")
+
+    def _end_revalidation(self, resource: Resource, request: Request) -> None:
+        self.response_cache.end_revalidation(self._cache_key(resource, request))
+
+    def _cache_key(self, resource: Resource, request: Request) -> Hashable:
+        return self.response_cache.key(
+            request, resource.vary, self._response_encoding(resource, request)
+        )
+
+    def _is_cacheable(self, resource: Resource, request: Request) -> bool:
+        return (
+            request.method in (Method.GET, Method.HEAD)
+            and request.get_header(HeaderType.AUTHORIZATION.value) is None
+            and self.response_cache.is_cacheable(resource.cache)
+        )
+
+    def _store_response(
+        self, resource: Resource, request: Request, response: Response
+    ) -> None:
+        if (
+            response.status_code != resource.success_status
+            or response.file is not None
+            or response.stream is not None
+        ):
+            return
+
+        if resource.static:
+            encoding = self._response_encoding(resource, request)
+            resource.serialized[encoding] = SerializedResponse.from_response(response)
+            logger.debug(f"Serialized static '{resource.function.__name__}' response.")
+            return
+
+        if not self._is_cacheable(resource, request) or response.cookies:
+            return
+
+        self.response_cache.put(
+            self._cache_key(resource, request),
+            SerializedResponse.from_response(response),
+            resource.cache,
+        )
+        logger.debug(f"Stored response for {self.address} request in cache.")
+
+    def _is_not_modified(
+        self,
+        request: Request,
+        headers: Dict[str, str],
+        mtime: float | None = None,
+        etag: str | None = None,
+    ) -> bool:
+        if request.method not in (Method.GET, Method.HEAD):
+            return False
+
+        etag = etag if etag is not None else headers.get(HeaderType.ETAG.value)
+        if_none_match = request.get_header(HeaderType.IF_NONE_MATCH.value)
+        if if_none_match is not None:
+            return etag is not None and ETagUtils.matches(etag, if_none_match)
+
+        if_modified_since = request.get_header(HeaderType.IF_MODIFIED_SINCE.value)
+        if if_modified_since is None or mtime is None:
+            return False
+        try:
+            since = DateUtils.from_http_date(if_modified_since)
+        except ValueError:
+            return False
+        return int(mtime) <= since.timestamp()
+
+    def _not_modified_response(self, headers: Dict[str, str]) -> Response:
+        logger.debug(f"{self.address} requested resource was not modified.")
+        not_modified_headers = {
+            key: value
+            for key, value in headers.items()
+            if key != HeaderType.CONTENT_LENGTH.value
+        }
+        return Response(
+            status_code=StatusCode.NOT_MODIFIED, headers=not_modified_headers
+        )
+
+    def _execution_error(self, error: Exception) -> HttpError:
+        return HttpError(
+            message=f"Could not execute {self.address} request's resource: {repr(error)}.",
+            status_code=StatusCode.BAD_REQUEST,
+        )
+
+    def _content_to_response(
+        self,
+        resource: Resource,
+        content: Content,
+        context: ResponseContext,
+    ) -> Response:
+        status_code = context.status_code or resource.success_status
+        headers = context.headers
+        stream = None
+        if isinstance(redirect := content, Redirect):
+            status_code = redirect.status_code
+            headers[HeaderType.LOCATION.value] = redirect.location
+            content = None
+
+        elif isinstance(content, str):
+            content = content.encode()
+        elif isinstance(content, (Iterator, AsyncIterator)):
+            stream, content = content, None
+            if isinstance(resource, EventResource):
+                stream = self._event_stream(stream)
+        elif resource.content_type == ContentType.JSON and JsonUtils.is_serializable(
+            content
+        ):
+            try:
+                content = JsonUtils.dumps(content)
+            except TypeError as error:
+                raise HttpError(
+                    message=f"Could not serialize {self.address} response: {error}",
+                    status_code=StatusCode.INTERNAL_SERVER_ERROR,
+                )
+        elif content is not None and not isinstance(content, bytes):
+            raise HttpError(
+                message=f"{self.address} resource function does not "
+                + f"return {repr(str)}, {repr(bytes)}, an iterator or {repr(None)}.",
+                status_code=StatusCode.INTERNAL_SERVER_ERROR,
+            )
+
+        return Response(
+            status_code=status_code,
+            content=content,
+            content_type=resource.content_type,
+            headers={**self._cache_headers(resource), **headers},
+            cookies=context.cookies,
+            stream=stream,
+            heartbeat=getattr(resource, "heartbeat", None),
+        )
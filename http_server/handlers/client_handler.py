@@ -1,31 +1,72 @@
+from .base_handler import BaseHandler
 from .logging_handler import LoggingHandler
-from ..models import HttpError, Response, Resource, Route, Redirect, Cookie, Request
-from ..enums import StatusCode, HeaderType
-from ..utils.http_parser import HttpParser
-from ..types import Content
-
-from typing import Tuple, Dict, Set, Any
-import socket
+from ..models import (
+    HttpError,
+    Response,
+    Resource,
+    FileResource,
+    WebSocketResource,
+    Request,
+    RequestBody,
+    Form,
+    ResponseContext,
+)
+from ..utils.router import Router
+from ..utils.file_cache import FileCache, CachedFile
+from ..utils.response_cache import ResponseCache
+from ..utils.compressor import Compressor, StreamCompressor
+from ..utils.socket_writer import SocketWriter
+from ..enums import StatusCode
+from ..types import Chunk, Content
+
+from typing import AsyncIterator, Iterator, List, Tuple, Dict, Any
+import asyncio
+import errno
 import inspect
+import os
+import selectors
+import socket
+import threading
 
 logger = LoggingHandler.create_logger(__name__)
 
 
-class ClientHandler:
-    CHUNK_SIZE = 2048
+class ClientHandler(BaseHandler):
+    READ_SIZE = 65536
+    SENDFILE_BLOCK_SIZE = 1 << 20
+    SENDFILE_FALLBACK_ERRORS = {errno.EINVAL, errno.ENOSYS, errno.ENOTSOCK}
 
     def __init__(
         self,
         socket: socket.socket,
         address: Tuple[str, int],
-        routes: Dict[Route, Resource],
+        router: Router,
         error_routes: Dict[StatusCode, Resource],
+        file_cache: FileCache,
+        response_cache: ResponseCache,
+        compressor: Compressor,
         timeout: float = 50,
+        keep_alive_timeout: float = 5,
+        max_requests: int = 100,
+        high_water_mark: int = SocketWriter.HIGH_WATER_MARK,
+        max_body_size: int = RequestBody.MAX_SIZE,
+        spool_size: int = RequestBody.SPOOL_SIZE,
     ) -> None:
+        super().__init__(
+            address=address,
+            router=router,
+            error_routes=error_routes,
+            file_cache=file_cache,
+            response_cache=response_cache,
+            compressor=compressor,
+            timeout=timeout,
+            keep_alive_timeout=keep_alive_timeout,
+            max_requests=max_requests,
+            max_body_size=max_body_size,
+            spool_size=spool_size,
+        )
         self.socket = socket
-        self.address = address
-        self.routes = routes
-        self.error_routes = error_routes
+        self.writer = SocketWriter(socket=socket, high_water_mark=high_water_mark)
 
         self.socket.settimeout(timeout)
         logger.debug(f"Initiated {self.__class__.__name__} on {self.address}.")
@@ -33,6 +74,8 @@ class ClientHandler:
     def handle(self) -> None:
         try:
             self._handle()
+            while self._wait_for_request():
+                self._handle()
         except Exception as e:
             logger.error(repr(e))
         finally:
@@ -42,46 +85,190 @@ class ClientHandler:
         self.socket.close()
         logger.debug(f"Closed connection with {self.address}.")
 
+    def _wait_for_request(self) -> bool:
+        if not self.keep_alive:
+            return False
+
+        if self.parser.has_buffered_data():
+            return True
+
+        self.writer.flush()
+        self.socket.settimeout(self.keep_alive_timeout)
+        try:
+            data = self.socket.recv(self.READ_SIZE)
+        except OSError:
+            logger.debug(f"Keep-alive connection with {self.address} timed out.")
+            return False
+        finally:
+            self.socket.settimeout(self.timeout)
+
+        self.parser.feed(data)
+        return bool(data)
+
     def _handle(self) -> None:
+        self.keep_alive = False
+        self.head = False
         response = self._generate_response()
+        self._finish_body()
+        self._prepare_stream(response)
+        self._add_connection_headers(response)
+        self._omit_body(response)
 
-        if len(response.to_bytes()) <= self.CHUNK_SIZE:
-            self._send(response)
-        else:
-            self._send_chunks(response)
+        try:
+            self.writer.writelines(response.to_buffers())
+            if response.file is not None:
+                self._send_file(response.file, response.file_parts)
+                self.writer.flush()
+            if response.stream is not None:
+                self._send_stream(response.stream, response.compressor)
+        finally:
+            self._release_file(response)
+            self._close_body()
 
-    def _send(self, response: Response) -> None:
-        self.socket.send(response.to_bytes())
+        if not self.keep_alive or not self.parser.has_buffered_data():
+            self.writer.flush()
         logger.debug(f"Sent full response for {self.address} request.")
 
-    def _send_chunks(self, response: Response) -> None:
-        response_bytes = response.to_bytes()
+    def _send_file(
+        self, file: CachedFile, parts: List[bytes | Tuple[int, int]] | None = None
+    ) -> None:
+        for part in parts if parts is not None else [(0, file.size)]:
+            if isinstance(part, bytes):
+                self.writer.write(part)
+            else:
+                self._send_file_range(file, *part)
+
+    def _send_file_range(self, file: CachedFile, offset: int, count: int) -> None:
+        sent = 0
+        if hasattr(os, "sendfile") and count >= self.writer.high_water_mark:
+            self.writer.flush()
+            sent = self._sendfile(file, offset, count)
+
+        if sent < count:
+            self.writer.write(file.view()[offset + sent : offset + count])
+            logger.debug(f"Sent '{file.path}' to {self.address} using mmap.")
+        else:
+            logger.debug(f"Sent '{file.path}' to {self.address} using sendfile.")
+
+    def _send_stream(
+        self,
+        stream: Iterator[Chunk] | AsyncIterator[Chunk],
+        compressor: StreamCompressor | None = None,
+    ) -> None:
         count = 0
-        for i in range(0, len(response_bytes), self.CHUNK_SIZE):
-            chunk = response_bytes[i : i + self.CHUNK_SIZE]
-            self.socket.send(chunk)
-            count += 1
-
-        logger.debug(
-            f"Completed sending all response chunks "
-            + f"({count}) for {self.address} request."
-        )
+        chunks = self._iterate(stream)
+        try:
+            for chunk in chunks:
+                if data := self._encode_chunks([chunk], compressor):
+                    self.writer.write(data)
+                    self.writer.flush()
+                    count += 1
+            self.writer.write(self._last_chunk(compressor))
+        except Exception:
+            self.keep_alive = False
+            raise
+        finally:
+            chunks.close()
+
+        logger.debug(f"Streamed {count} chunks to {self.address}.")
+
+    @staticmethod
+    def _iterate(stream: Iterator[Chunk] | AsyncIterator[Chunk]) -> Iterator[Chunk]:
+        if isinstance(stream, Iterator):
+            try:
+                yield from stream
+            finally:
+                getattr(stream, "close", lambda: None)()
+            return
+
+        loop = asyncio.new_event_loop()
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(anext(stream))
+                except StopAsyncIteration:
+                    break
+        finally:
+            if aclose := getattr(stream, "aclose", None):
+                loop.run_until_complete(aclose())
+            loop.close()
+
+    def _sendfile(self, file: CachedFile, offset: int, count: int) -> int:
+        sent = 0
+        with selectors.DefaultSelector() as selector:
+            selector.register(self.socket, selectors.EVENT_WRITE)
+            while sent < count:
+                try:
+                    result = os.sendfile(
+                        self.socket.fileno(),
+                        file.fileno(),
+                        offset + sent,
+                        min(count - sent, self.SENDFILE_BLOCK_SIZE),
+                    )
+                except BlockingIOError:
+                    if not selector.select(self.timeout):
+                        raise socket.timeout("Timed out while sending file.")
+                    continue
+                except OSError as error:
+                    if error.errno in self.SENDFILE_FALLBACK_ERRORS:
+                        break
+                    raise
+                if result == 0:
+                    break
+                sent += result
+        return sent
+
+    def _revalidate(
+        self, resource: Resource, request: Request, kwargs: Dict[str, Any]
+    ) -> None:
+        threading.Thread(
+            target=self._refresh, args=(resource, request, kwargs), daemon=True
+        ).start()
+
+    def _refresh(
+        self, resource: Resource, request: Request, kwargs: Dict[str, Any]
+    ) -> None:
+        try:
+            content, context = self._execute_resource(
+                resource=resource, kwargs=kwargs
+            )
+            self._revalidate_response(
+                resource=resource,
+                request=request,
+                content=content,
+                context=context,
+            )
+        except Exception as error:
+            logger.warning(
+                f"Could not revalidate cached response for {self.address}: "
+                + f"{repr(error)}"
+            )
+        finally:
+            self._end_revalidation(resource=resource, request=request)
 
     def _generate_response(self) -> Response:
         try:
-            raw_request = self._receive_raw_request()
+            request = self._receive_request()
             logger.debug(f"Received {self.address} request.")
 
-            request = self._parse_request(raw_request)
-            logger.debug(f"Parsed {self.address} request: {request.header()}")
-
-            resource = self._find_resource(request)
-            logger.debug(f"Found {self.address} requested resource.")
+            resource, path_parameters = self._prepare(request)
+            self._receive_body(resource, request)
+            kwargs = self._build_kwargs(resource, request, path_parameters)
+            if isinstance(resource, FileResource):
+                return self._file_response(resource, request)
+            if isinstance(resource, WebSocketResource):
+                raise HttpError(
+                    message="WebSocket routes are only served by run_async().",
+                    status_code=StatusCode.NOT_IMPLEMENTED,
+                )
 
-            kwargs = self._load_kwargs(resource=resource, request=request)
-            logger.debug(f"Loaded {self.address} kwargs.")
+            cached, revalidate = self._cached_response(resource, request)
+            if cached is not None:
+                if revalidate:
+                    self._revalidate(resource=resource, request=request, kwargs=kwargs)
+                return cached
 
-            content, headers, cookies = self._execute_resource(
+            content, context = self._execute_resource(
                 resource=resource, kwargs=kwargs
             )
 
@@ -93,8 +280,10 @@ class ClientHandler:
             response = self._content_to_response(
                 resource=resource,
                 content=content,
-                headers=headers,
-                cookies=cookies,
+                context=context,
+            )
+            response = self._finalize_response(
+                resource=resource, request=request, response=response
             )
             logger.debug(f"Response for {self.address} created.")
         except Exception as error:
@@ -102,16 +291,14 @@ class ClientHandler:
                 f"Couldn't create response for {self.address}, "
                 + f"trying to create error response: {repr(error)}"
             )
-            return self._generate_error_response(error=error)
+            response = self._generate_error_response(error=error)
+            return self._add_error_headers(error=error, response=response)
         return response
 
     def _generate_error_response(
         self, error: Exception, max_tries: int = 3
     ) -> Response:
-        if isinstance(error, HttpError):
-            status = error.status_code
-        else:
-            status = StatusCode.INTERNAL_SERVER_ERROR
+        status = self._error_status(error)
 
         if status not in self.error_routes.keys():
             return Response.from_error(status_code=status, error=error)
@@ -119,13 +306,12 @@ class ClientHandler:
         logger.debug(f"Found '{status}' error resource for {self.address}.")
 
         try:
-            content, headers, cookies = self._execute_resource(resource)
+            content, context = self._execute_resource(resource)
             logger.debug(f"{self.address} {status} error content created.")
             response = self._content_to_response(
                 resource=resource,
                 content=content,
-                headers=headers,
-                cookies=cookies,
+                context=context,
             )
             logger.debug(f"{self.address} {status} error response generated.")
         except (HttpError, Exception) as error:
@@ -144,100 +330,91 @@ class ClientHandler:
             )
         return response
 
-    def _receive_raw_request(self, size: int = 4096) -> str:
-        try:
-            raw_request = self.socket.recv(size).decode("utf-8")
-        except socket.error:
-            raise HttpError(
-                message=f"Could not receive data from client at {self.address}.",
-                status_code=StatusCode.BAD_REQUEST,
-            )
-        if not raw_request:
-            raise HttpError(
-                message=f"No data received from client at {self.address}.",
-                status_code=StatusCode.BAD_REQUEST,
-            )
-
-        return raw_request
+    def _receive_request(self) -> Request:
+        while (request := self._next_request()) is None:
+            try:
+                self.writer.flush()
+                data = self.socket.recv(self.READ_SIZE)
+            except socket.error:
+                raise self._bad_request(
+                    f"Could not receive data from client at {self.address}."
+                )
+            if not data:
+                raise self._bad_request(
+                    f"No data received from client at {self.address}."
+                )
+            self.parser.feed(data)
 
-    def _parse_request(self, raw_request: str) -> Request:
-        try:
-            request = HttpParser.parse(raw_request)
-        except ValueError:
-            raise HttpError(
-                message=f"Could not parse {self.address} request.",
-                status_code=StatusCode.BAD_REQUEST,
-            )
         return request
 
-    def _find_resource(self, request: Request) -> Resource:
-        try:
-            resource = self.routes[Route(method=request.method, path=request.path)]
-        except KeyError:
-            raise HttpError(
-                message=f"Could not find {self.address} request's resource.",
-                status_code=StatusCode.NOT_FOUND,
+    def _receive_body(self, resource: Resource, request: Request) -> None:
+        if resource.plan.payload or resource.plan.json_body:
+            request.payload = b"".join(iter(self._read_body_chunk, b"")) or None
+        if resource.plan.json_body:
+            request.json_body = self._decode_json(request)
+        if resource.plan.form:
+            request.form = self._receive_form(request)
+        if not resource.plan.body:
+            for _ in iter(self._read_body_chunk, b""):
+                pass
+        elif resource.spool_body:
+            file = self._spool_file()
+            for chunk in iter(self._read_body_chunk, b""):
+                file.write(chunk)
+            request.body = RequestBody.from_file(file)
+            logger.debug(f"Spooled {self.body_received} body bytes of {self.address}.")
+        else:
+            request.body = RequestBody(
+                read_chunk=self._read_body_chunk, aread_chunk=self._aread_body_chunk
             )
-        return resource
+        self.body = request.body
 
-    def _load_kwargs(self, resource: Resource, request: Request) -> Dict[str, Any]:
-        parameters = set(inspect.signature(resource.function).parameters.keys())
-        if not set(request.parameters.keys()).issubset(parameters):
-            raise AttributeError("Route parameters do not match given parameters.")
+    def _receive_form(self, request: Request) -> Form:
+        parser = self._form_parser(request)
+        try:
+            for chunk in iter(self._read_body_chunk, b""):
+                parser.feed(chunk)
+            form = parser.finish()
+        except ValueError as error:
+            raise self._form_error(error)
+        logger.debug(f"Parsed {parser.parts} form parts of {self.address}.")
+        return form
+
+    def _read_body_chunk(self) -> bytes:
+        while not (data := self._read_parsed_body()):
+            if self.parser.body_complete:
+                return b""
+            if self.expect_continue:
+                self.writer.write(self._continue_response())
+            try:
+                self.writer.flush()
+                data = self.socket.recv(self.READ_SIZE)
+            except socket.error:
+                raise self._bad_request(
+                    f"Could not receive request body from {self.address}."
+                )
+            if not data:
+                raise self._bad_request(
+                    f"Connection with {self.address} closed during request body."
+                )
+            self.parser.feed(data)
 
-        kwargs: Dict[str, Any] = request.parameters
+        return self._count_body(data)
 
-        function_parameters = inspect.signature(resource.function).parameters.keys()
-        if Request.PAYLOAD_KEY in function_parameters:
-            kwargs[Request.PAYLOAD_KEY] = request.payload
-        if Request.HEADERS_KEY in function_parameters:
-            kwargs[Request.HEADERS_KEY] = request.headers
-        if Request.COOKIES_KEY in function_parameters:
-            kwargs[Request.COOKIES_KEY] = request.cookies
-        return kwargs
+    async def _aread_body_chunk(self) -> bytes:
+        return self._read_body_chunk()
 
     def _execute_resource(
         self, resource: Resource, kwargs: Dict[str, Any] | None = None
-    ) -> Tuple[Content, Dict[str, str], Set[Cookie]]:
+    ) -> Tuple[Content, ResponseContext]:
         kwargs = kwargs if kwargs else {}
+        context = ResponseContext()
         try:
-            content = resource.function(**kwargs)
+            with context.activate():
+                content = resource.function(**kwargs)
+                if inspect.iscoroutine(content):
+                    content = asyncio.run(content)
         except (TypeError, AttributeError) as error:
-            raise HttpError(
-                message=f"Could not execute {self.address} request's resource: {repr(error)}.",
-                status_code=StatusCode.BAD_REQUEST,
-            )
-
-        cookies: Set[Cookie] = getattr(resource.function, Response.COOKIES_KEY, set())
-        headers: Dict[str, str] = getattr(resource.function, Response.HEADERS_KEY, {})
-        return content, headers, cookies
+            raise self._execution_error(error)
 
-    def _content_to_response(
-        self,
-        resource: Resource,
-        content: Content,
-        headers: Dict[str, str],
-        cookies: Set[Cookie],
-    ) -> Response:
-        status_code = resource.success_status
-        if isinstance(redirect := content, Redirect):
-            status_code = redirect.status_code
-            headers[HeaderType.LOCATION.value] = redirect.location
-            content = None
-
-        elif isinstance(content, str):
-            content = content.encode()
-        elif content is not None and not isinstance(content, bytes):
-            raise HttpError(
-                message=f"{self.address} resource function does not "
-                + f"return {repr(str)}, {repr(bytes)} or {repr(None)}.",
-                status_code=StatusCode.INTERNAL_SERVER_ERROR,
-            )
-
-        return Response(
-            status_code=status_code,
-            content=content,
-            content_type=resource.content_type,
-            headers=headers,
-            cookies=cookies,
-        )
+        return content, context
@@ -0,0 +1,107 @@
+from .logging_handler import LoggingHandler
+
+from typing import Callable, Set
+import os
+import signal
+import time
+
+logger = LoggingHandler.create_logger(__name__)
+
+
+class SupervisorHandler:
+    RESTART_DELAY = 1
+    SHUTDOWN_TIMEOUT = 10
+
+    def __init__(self, target: Callable[[], None], workers: int) -> None:
+        if not hasattr(os, "fork"):
+            raise RuntimeError("Multiple workers require a platform supporting fork.")
+
+        self.target = target
+        self.workers = workers
+        self.children: Set[int] = set()
+        self.running = False
+
+    def run(self) -> None:
+        self.running = True
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        for _ in range(self.workers):
+            self._spawn()
+        logger.debug(f"Started {self.workers} workers: {sorted(self.children)}.")
+
+        while self.running:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+
+            self.children.discard(pid)
+            if not self.running:
+                break
+
+            logger.warning(
+                f"Worker {pid} exited with code {os.waitstatus_to_exitcode(status)}, "
+                + "restarting."
+            )
+            time.sleep(self.RESTART_DELAY)
+            self._spawn()
+
+        self._shutdown()
+
+    def _spawn(self) -> None:
+        pid = os.fork()
+        if pid:
+            self.children.add(pid)
+            return
+
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        code = 0
+        try:
+            self.target()
+        except KeyboardInterrupt:
+            pass
+        except BaseException as e:
+            logger.error(f"Worker {os.getpid()} crashed: {repr(e)}")
+            code = 1
+        finally:
+            os._exit(code)
+
+    def _stop(self, signum: int, _) -> None:
+        if not self.running:
+            return
+
+        logger.debug(f"Received signal {signum}, stopping workers.")
+        self.running = False
+        self._signal_children(signal.SIGTERM)
+
+    def _signal_children(self, signum: int) -> None:
+        for pid in self.children:
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                pass
+
+    def _shutdown(self) -> None:
+        deadline = time.monotonic() + self.SHUTDOWN_TIMEOUT
+        while self.children and time.monotonic() < deadline:
+            try:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self.children.clear()
+                break
+
+            if pid:
+                self.children.discard(pid)
+            else:
+                time.sleep(0.1)
+
+        if self.children:
+            logger.warning(f"Killing workers {sorted(self.children)}.")
+            self._signal_children(signal.SIGKILL)
+            for pid in self.children:
+                os.waitpid(pid, 0)
+            self.children.clear()
+
+        logger.debug("All workers stopped.")
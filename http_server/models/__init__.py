@@ -1,8 +1,17 @@
 from .cookie import Cookie
 from .redirect import Redirect
 from .http_error import HttpError
+from .request_body import RequestBody
+from .uploaded_file import UploadedFile
+from .form import Form
 from .request import Request
-from .resource import Resource
+from .resource import Resource, FileResource, EventResource, WebSocketResource
+from .event import Event
+from .websocket_error import WebSocketError, WebSocketClosed
+from .websocket import WebSocket
 from .response import Response
+from .response_context import ResponseContext
 from .route import Route
 from .cache_control import CacheControl
+from .call_plan import CallPlan
+from .serialized_response import SerializedResponse
@@ -0,0 +1,109 @@
+from ..enums import StatusCode, HeaderType
+from .http_error import HttpError
+from .request import Request
+
+from typing import Any, Callable, Dict, Union, get_args, get_origin, get_type_hints
+import inspect
+import types
+
+
+def _to_bool(value: str) -> bool:
+    lowered = value.lower()
+    if lowered in ("1", "true", "yes", "on"):
+        return True
+    if lowered in ("0", "false", "no", "off"):
+        return False
+    raise ValueError(f"Invalid boolean value '{value}'.")
+
+
+class CallPlan:
+    COERCIONS: Dict[Any, Callable[[str], Any]] = {
+        int: int,
+        float: float,
+        bool: _to_bool,
+    }
+
+    def __init__(self, function: Callable) -> None:
+        signature = inspect.signature(function)
+        self.parameters = frozenset(signature.parameters.keys())
+        self.payload = Request.PAYLOAD_KEY in self.parameters
+        self.body = Request.BODY_KEY in self.parameters
+        self.form = Request.FORM_KEY in self.parameters
+        self.json_body = Request.JSON_BODY_KEY in self.parameters
+        self.headers = Request.HEADERS_KEY in self.parameters
+        self.cookies = Request.COOKIES_KEY in self.parameters
+        self.last_event_id = Request.LAST_EVENT_ID_KEY in self.parameters
+
+        annotations = self._annotations(function, signature)
+        self.coercions: Dict[str, Callable[[str], Any]] = {}
+        for name, annotation in annotations.items():
+            coercion = self._coercion(annotation)
+            if name in self.parameters and coercion is not None:
+                self.coercions[name] = coercion
+
+    def build(
+        self, request: Request, path_parameters: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        if not self.parameters.issuperset(request.parameters.keys()):
+            raise AttributeError("Route parameters do not match given parameters.")
+
+        kwargs: Dict[str, Any] = {**request.parameters, **path_parameters}
+        for name, coercion in self.coercions.items():
+            value = kwargs.get(name)
+            if isinstance(value, str):
+                try:
+                    kwargs[name] = coercion(value)
+                except ValueError:
+                    raise HttpError(
+                        message=f"Invalid value '{value}' for parameter '{name}'.",
+                        status_code=StatusCode.BAD_REQUEST,
+                    )
+
+        if self.payload:
+            kwargs[Request.PAYLOAD_KEY] = request.payload
+        if self.body:
+            kwargs[Request.BODY_KEY] = request.body
+        if self.form:
+            kwargs[Request.FORM_KEY] = request.form
+        if self.json_body:
+            kwargs[Request.JSON_BODY_KEY] = request.json_body
+        if self.headers:
+            kwargs[Request.HEADERS_KEY] = request.headers
+        if self.cookies:
+            try:
+                kwargs[Request.COOKIES_KEY] = request.cookies
+            except ValueError as error:
+                raise HttpError(
+                    message=f"Invalid cookies: {error}",
+                    status_code=StatusCode.BAD_REQUEST,
+                )
+        if self.last_event_id:
+            kwargs[Request.LAST_EVENT_ID_KEY] = request.get_header(
+                HeaderType.LAST_EVENT_ID.value
+            )
+        return kwargs
+
+    @staticmethod
+    def _annotations(
+        function: Callable, signature: inspect.Signature
+    ) -> Dict[str, Any]:
+        try:
+            return get_type_hints(getattr(function, "function", function))
+        except (NameError, TypeError):
+            return {
+                name: parameter.annotation
+                for name, parameter in signature.parameters.items()
+            }
+
+    @classmethod
+    def _coercion(cls, annotation: Any) -> Callable[[str], Any] | None:
+        if get_origin(annotation) in (Union, types.UnionType):
+            arguments = [
+                argument
+                for argument in get_args(annotation)
+                if argument is not type(None)
+            ]
+            if len(arguments) != 1:
+                return None
+            annotation = arguments[0]
+        return cls.COERCIONS.get(annotation)
@@ -0,0 +1,41 @@
+from datetime import timedelta
+import re
+
+
+class Event:
+    LINE_BREAK = re.compile(r"\r\n|\r|\n")
+
+    def __init__(
+        self,
+        data: str,
+        event: str | None = None,
+        id: str | None = None,
+        retry: timedelta | None = None,
+    ) -> None:
+        for name, value in (("event", event), ("id", id)):
+            if value is not None and ("\n" in value or "\r" in value):
+                raise ValueError(f"{name} attribute must be a single line.")
+
+        self.data = data
+        self.event = event
+        self.id = id
+        self.retry = retry
+
+    def encode(self) -> bytes:
+        lines = []
+        if self.event is not None:
+            lines.append(f"event: {self.event}")
+        if self.id is not None:
+            lines.append(f"id: {self.id}")
+        if self.retry is not None:
+            lines.append(f"retry: {int(self.retry.total_seconds() * 1000)}")
+        lines.extend(f"data: {line}" for line in self.LINE_BREAK.split(self.data))
+        return ("\n".join(lines) + "\n\n").encode()
+
+    def __repr__(self) -> str:
+        return (
+            f"Event(data='{self.data}', "
+            f"event='{self.event}', "
+            f"id='{self.id}', "
+            f"retry={self.retry})"
+        )
@@ -0,0 +1,43 @@
+from .uploaded_file import UploadedFile
+
+from typing import Dict, List
+
+
+class Form:
+    def __init__(self) -> None:
+        self.fields: Dict[str, List[str]] = {}
+        self.files: Dict[str, List[UploadedFile]] = {}
+
+    def add_field(self, name: str, value: str) -> None:
+        self.fields.setdefault(name, []).append(value)
+
+    def add_file(self, file: UploadedFile) -> None:
+        self.files.setdefault(file.name, []).append(file)
+
+    def get(self, name: str, default: str | None = None) -> str | None:
+        values = self.fields.get(name)
+        return values[0] if values else default
+
+    def get_all(self, name: str) -> List[str]:
+        return self.fields.get(name, [])
+
+    def file(self, name: str) -> UploadedFile | None:
+        files = self.files.get(name)
+        return files[0] if files else None
+
+    def close(self) -> None:
+        for files in self.files.values():
+            for file in files:
+                file.close()
+
+    def __getitem__(self, name: str) -> str:
+        values = self.fields.get(name)
+        if not values:
+            raise KeyError(name)
+        return values[0]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.fields or name in self.files
+
+    def __repr__(self) -> str:
+        return f"Form(Fields: {self.fields}, Files: {self.files})"
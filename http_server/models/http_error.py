@@ -1,11 +1,15 @@
 from ..enums.status_codes import StatusCode
 
+from typing import Dict
+
 
 class HttpError(Exception):
     def __init__(
         self,
         message: str,
         status_code: StatusCode,
+        headers: Dict[str, str] | None = None,
     ) -> None:
         super().__init__(message)
         self.status_code = status_code
+        self.headers = headers if headers else {}
@@ -1,14 +1,24 @@
-from ..enums import Method
+from ..enums import Method, HeaderType
 from .cookie import Cookie
+from .request_body import RequestBody
+from .form import Form
 
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl
 
 
 class Request:
+    ENCODING = "utf-8"
     CARRIAGE_RETURN = "\r\n"
     PAYLOAD_KEY = "payload"
+    BODY_KEY = "body"
+    FORM_KEY = "form"
+    JSON_BODY_KEY = "json_body"
     HEADERS_KEY = "headers"
     COOKIES_KEY = "cookies"
+    LAST_EVENT_ID_KEY = "last_event_id"
+    WEBSOCKET_KEY = "websocket"
+    COOKIE = HeaderType.COOKIE.value.lower()
 
     def __init__(
         self,
@@ -18,25 +28,113 @@ class Request:
         parameters: Optional[Dict[str, str]] = None,
         headers: Optional[Dict[str, str]] = None,
         cookies: Optional[Dict[str, Cookie]] = None,
-        payload: Optional[str] = None,
+        payload: Optional[bytes] = None,
+        body: Optional[RequestBody] = None,
+        form: Optional[Form] = None,
+        json_body: Any = None,
+        query: str = "",
+        raw_headers: bytes = b"",
     ) -> None:
         self.method = method
         self.version = version
         self.path = path
-        self.parameters = parameters if parameters else {}
-        self.headers = headers if headers else {}
-        self.cookies = cookies if cookies else {}
+        self.query = query
+        self.raw_headers = raw_headers
         self.payload = payload
+        self.body = body
+        self.form = form
+        self.json_body = json_body
+        self._parameters = parameters
+        self._headers = headers
+        self._cookies = cookies
+        self._header_index: Dict[str, str] | None = None
+        self._cookie_headers: List[str] = []
+
+    @property
+    def parameters(self) -> Dict[str, str]:
+        if self._parameters is None:
+            self._parameters = (
+                dict(self.parse_query(self.query)) if self.query else {}
+            )
+        return self._parameters
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        if self._headers is None:
+            self._parse_headers()
+        return self._headers
+
+    @property
+    def cookies(self) -> Dict[str, Cookie]:
+        if self._cookies is None:
+            if self._headers is None:
+                self._parse_headers()
+            self._cookies = self._parse_cookies(self._cookie_headers)
+        return self._cookies
+
+    @staticmethod
+    def parse_query(query: str) -> List[Tuple[str, str]]:
+        return parse_qsl(query, keep_blank_values=True)
 
     def header(self) -> str:
-        if self.parameters:
+        if self.query:
+            full_path = f"{self.path}?{self.query}"
+        elif self._parameters:
             full_path = f"{self.path}?" + "&".join(
-                [f"{key}={value}" for key, value in self.parameters.items()]
+                [f"{key}={value}" for key, value in self._parameters.items()]
             )
         else:
             full_path = self.path
         return f"{self.method.name} {full_path} {self.version}"
 
+    def get_header(self, name: str) -> str | None:
+        if self._header_index is None:
+            self._header_index = {
+                key.lower(): value for key, value in self.headers.items()
+            }
+        return self._header_index.get(name.lower())
+
+    def cookie_header(self) -> str | None:
+        if self._headers is None:
+            self._parse_headers()
+        if self._cookie_headers:
+            return "; ".join(self._cookie_headers)
+        if self._cookies:
+            return "; ".join(
+                f"{name}={cookie.value}" for name, cookie in self._cookies.items()
+            )
+        return self.get_header(HeaderType.COOKIE.value)
+
+    def _parse_headers(self) -> None:
+        headers: Dict[str, str] = {}
+        index: Dict[str, str] = {}
+        for line in self.raw_headers.decode(self.ENCODING).splitlines():
+            if not line:
+                break
+            key, separator, value = line.partition(":")
+            if not separator or not key or key != key.strip():
+                raise ValueError(f"Incorrect use of headers: {line}")
+            value = value.strip()
+            lowered = key.lower()
+            if lowered == self.COOKIE:
+                self._cookie_headers.append(value)
+            else:
+                headers[key] = value
+                index[lowered] = value
+        self._headers = headers
+        self._header_index = index
+
+    @staticmethod
+    def _parse_cookies(cookie_headers: List[str]) -> Dict[str, Cookie]:
+        cookies = {}
+        for cookie_header in cookie_headers:
+            for pair in cookie_header.split(";"):
+                name, separator, value = pair.strip().partition("=")
+                if not separator:
+                    raise ValueError(f"Could not parse Cookie: {cookie_header}")
+                cookies[name] = Cookie(name=name, value=value)
+        return cookies
+
     def __repr__(self) -> str:
         return (
             f"Request({self.header()}, "
@@ -0,0 +1,51 @@
+from typing import IO, AsyncIterator, Awaitable, Callable, Iterator
+
+
+class RequestBody:
+    MAX_SIZE = 1024 * 1024
+    SPOOL_SIZE = 1024 * 1024
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        read_chunk: Callable[[], bytes],
+        aread_chunk: Callable[[], Awaitable[bytes]],
+        file: IO[bytes] | None = None,
+    ) -> None:
+        self._read_chunk = read_chunk
+        self._aread_chunk = aread_chunk
+        self.file = file
+
+    @classmethod
+    def from_file(cls, file: IO[bytes]) -> "RequestBody":
+        file.seek(0)
+
+        def read_chunk() -> bytes:
+            return file.read(cls.CHUNK_SIZE)
+
+        async def aread_chunk() -> bytes:
+            return read_chunk()
+
+        return cls(read_chunk=read_chunk, aread_chunk=aread_chunk, file=file)
+
+    def __iter__(self) -> Iterator[bytes]:
+        while chunk := self._read_chunk():
+            yield chunk
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        while chunk := await self._aread_chunk():
+            yield chunk
+
+    def read(self) -> bytes:
+        return b"".join(self)
+
+    async def aread(self) -> bytes:
+        return b"".join([chunk async for chunk in self])
+
+    def close(self) -> None:
+        if self.file is not None:
+            self.file.close()
+
+    def __repr__(self) -> str:
+        source = "spooled" if self.file is not None else "streamed"
+        return f"RequestBody({source})"
@@ -1,5 +1,16 @@
 from ..enums import ContentType, StatusCode
 from ..types import Creator
+from ..utils.file import FileUtils
+from ..utils.file_cache import FileStat
+from ..utils.websocket_parser import WebSocketParser
+from .cache_control import CacheControl
+from .call_plan import CallPlan
+from .request import Request
+from .serialized_response import SerializedResponse
+
+from datetime import timedelta
+from typing import Dict, List, Tuple
+import inspect
 
 
 class Resource:
@@ -8,7 +19,93 @@ class Resource:
         function: Creator,
         content_type: ContentType,
         success_status: StatusCode,
+        etag: bool = False,
+        cache: CacheControl | None = None,
+        vary: List[str] | None = None,
+        static: bool = False,
+        max_body_size: int | None = None,
+        spool_body: bool = False,
     ) -> None:
         self.function = function
         self.content_type = content_type
         self.success_status = success_status
+        self.etag = etag or static
+        self.cache = cache
+        self.vary = vary if vary else []
+        self.static = static
+        self.max_body_size = max_body_size
+        self.spool_body = spool_body
+        self.serialized: Dict[str | None, SerializedResponse] = {}
+        self.plan = CallPlan(function)
+
+
+class EventResource(Resource):
+    HEARTBEAT_INTERVAL = timedelta(seconds=15)
+
+    def __init__(
+        self,
+        function: Creator,
+        heartbeat: timedelta = HEARTBEAT_INTERVAL,
+    ) -> None:
+        super().__init__(
+            function=function,
+            content_type=ContentType.EVENT_STREAM,
+            success_status=StatusCode.OK,
+            cache=CacheControl(no_cache=True),
+        )
+        if heartbeat.total_seconds() <= 0:
+            raise ValueError("heartbeat interval must be positive.")
+        self.heartbeat = heartbeat.total_seconds()
+
+
+class WebSocketResource(Resource):
+    def __init__(
+        self,
+        function: Creator,
+        max_message_size: int = WebSocketParser.MAX_MESSAGE_SIZE,
+        subprotocols: List[str] | None = None,
+    ) -> None:
+        if not inspect.iscoroutinefunction(getattr(function, "function", function)):
+            raise ValueError(
+                f"WebSocket route '{function.__name__}' must be a coroutine function."
+            )
+        super().__init__(
+            function=function,
+            content_type=ContentType.BINARY,
+            success_status=StatusCode.SWITCHING_PROTOCOLS,
+        )
+        if Request.WEBSOCKET_KEY not in self.plan.parameters:
+            raise ValueError(
+                f"WebSocket route '{function.__name__}' must accept "
+                + f"a '{Request.WEBSOCKET_KEY}' argument."
+            )
+        self.max_message_size = max_message_size
+        self.subprotocols = subprotocols if subprotocols else []
+
+
+class FileResource(Resource):
+    MAX_IN_MEMORY_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        file_path: str,
+        content_type: ContentType,
+        success_status: StatusCode,
+        cache: CacheControl | None = None,
+    ) -> None:
+        def function() -> bytes:
+            return FileUtils.read(path=file_path)
+
+        function.__name__ = FileUtils.read.__name__
+        super().__init__(
+            function=function,
+            content_type=content_type,
+            success_status=success_status,
+            etag=True,
+            cache=cache,
+        )
+        self.file_path = file_path
+        self.serialized_files: Dict[
+            str | None, Tuple[FileStat, FileStat, SerializedResponse]
+        ] = {}
+        self.encoded_files: Tuple[FileStat, Dict[str, str]] | None = None
@@ -5,8 +5,10 @@ from .cookie import Cookie
 from ..enums import StatusCode, ContentType, HeaderType
 from ..utils.html import HtmlUtils
 from ..utils.date import DateUtils
+from ..utils.file_cache import CachedFile
+from ..utils.compressor import StreamCompressor
 
-from typing import Dict, Set
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Set, Tuple
 import traceback
 
 ERROR_TEMPLATE = """
@@ -38,6 +40,12 @@ class Response:
     CARRIAGE_RETURN = "\r\n"
     HEADERS_KEY = "headers"
     COOKIES_KEY = "cookies"
+    BODYLESS_STATUSES = (
+        StatusCode.CONTINUE,
+        StatusCode.SWITCHING_PROTOCOLS,
+        StatusCode.NO_CONTENT,
+        StatusCode.NOT_MODIFIED,
+    )
 
     def __init__(
         self,
@@ -47,12 +55,24 @@ class Response:
         content: bytes | None = None,
         content_type: ContentType | None = None,
         auto_generated_headers: bool = True,
+        file: CachedFile | None = None,
+        stream: Iterator[bytes | str] | AsyncIterator[bytes | str] | None = None,
+        heartbeat: float | None = None,
+        upgrade: Callable[[], Awaitable[None]] | None = None,
+        compressor: StreamCompressor | None = None,
+        file_parts: List[bytes | Tuple[int, int]] | None = None,
     ) -> None:
         self.status_code = status_code
         self.headers = headers if headers else {}
         self.cookies = cookies if cookies else set()
         self.content = content
         self.content_type = content_type
+        self.file = file
+        self.stream = stream
+        self.heartbeat = heartbeat
+        self.upgrade = upgrade
+        self.compressor = compressor
+        self.file_parts = file_parts
 
         if auto_generated_headers:
             self._generate_headers()
@@ -84,28 +104,40 @@ class Response:
         return response
 
     def _generate_headers(self) -> None:
-        if self.content and HeaderType.CONTENT_LENGTH.value not in self.headers:
-            self.headers[HeaderType.CONTENT_LENGTH.value] = str(len(self.content))
+        if self.stream is not None:
+            self.headers[HeaderType.TRANSFER_ENCODING.value] = "chunked"
+        elif (
+            self.status_code not in self.BODYLESS_STATUSES
+            and HeaderType.CONTENT_LENGTH.value not in self.headers
+        ):
+            if self.file is not None:
+                length = self.file.size
+            else:
+                length = len(self.content) if self.content else 0
+            self.headers[HeaderType.CONTENT_LENGTH.value] = str(length)
 
         if self.content_type and HeaderType.CONTENT_TYPE.value not in self.headers:
             self.headers[HeaderType.CONTENT_TYPE.value] = self.content_type.value
 
         if HeaderType.DATE.value not in self.headers:
-            self.headers[HeaderType.DATE.value] = DateUtils.rfc7321()
+            self.headers[HeaderType.DATE.value] = DateUtils.now()
 
-    def to_bytes(self) -> bytes:
+    def encode_head(self) -> bytes:
         status_line = f"{self.VERSION} {repr(self.status_code)}{self.CARRIAGE_RETURN}"
-        status_line_encoded = status_line.encode()
 
         header_lines = [f"{key}: {value}" for key, value in self.headers.items()]
 
         for cookie in self.cookies:
             header_lines.append(f"{HeaderType.SET_COOKIE.value}: {str(cookie)}")
 
-        headers = self.CARRIAGE_RETURN.join(header_lines) + self.CARRIAGE_RETURN * 2
-        headers_encoded = headers.encode()
+        headers = "".join(line + self.CARRIAGE_RETURN for line in header_lines)
+        return (status_line + headers).encode()
 
-        first_part = status_line_encoded + headers_encoded
+    def to_buffers(self) -> List[bytes]:
+        first_part = self.encode_head() + self.CARRIAGE_RETURN.encode()
         if not self.content:
-            return first_part
-        return first_part + self.content + self.CARRIAGE_RETURN.encode()
+            return [first_part]
+        return [first_part, self.content]
+
+    def to_bytes(self) -> bytes:
+        return b"".join(self.to_buffers())
@@ -0,0 +1,39 @@
+from ..enums import StatusCode
+from .cookie import Cookie
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Set
+
+
+class ResponseContext:
+    _current: ContextVar["ResponseContext"] = ContextVar("response_context")
+
+    def __init__(self) -> None:
+        self.headers: Dict[str, str] = {}
+        self.cookies: Set[Cookie] = set()
+        self.status_code: StatusCode | None = None
+
+    def set_header(self, name: str, value: str) -> None:
+        self.headers[name] = value
+
+    def set_cookie(self, cookie: Cookie) -> None:
+        self.cookies.add(cookie)
+
+    def set_status(self, status_code: StatusCode) -> None:
+        self.status_code = status_code
+
+    @classmethod
+    def current(cls) -> "ResponseContext":
+        try:
+            return cls._current.get()
+        except LookupError:
+            raise RuntimeError("No response context outside of a request.")
+
+    @contextmanager
+    def activate(self) -> Iterator["ResponseContext"]:
+        token = self._current.set(self)
+        try:
+            yield self
+        finally:
+            self._current.reset(token)
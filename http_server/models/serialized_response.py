@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from .response import Response
+from ..enums import StatusCode, HeaderType
+from ..utils.date import DateUtils
+
+from typing import Dict
+
+
+class SerializedResponse(Response):
+    def __init__(
+        self,
+        status_code: StatusCode,
+        head: bytes,
+        content: bytes | None = None,
+        headers: Dict[str, str] | None = None,
+        etag: str | None = None,
+    ) -> None:
+        super().__init__(
+            status_code=status_code,
+            headers=headers,
+            content=content,
+            auto_generated_headers=False,
+        )
+        self.head = head
+        self.etag = etag
+
+    @classmethod
+    def from_response(cls, response: Response) -> SerializedResponse:
+        date = response.headers.pop(HeaderType.DATE.value, None)
+        head = response.encode_head()
+        if date is not None:
+            response.headers[HeaderType.DATE.value] = date
+
+        return SerializedResponse(
+            status_code=response.status_code,
+            head=head,
+            content=response.content,
+            etag=response.headers.get(HeaderType.ETAG.value),
+        )
+
+    @property
+    def size(self) -> int:
+        return len(self.head) + (len(self.content) if self.content else 0)
+
+    def copy(self) -> SerializedResponse:
+        return SerializedResponse(
+            status_code=self.status_code,
+            head=self.head,
+            content=self.content,
+            etag=self.etag,
+        )
+
+    def encode_head(self) -> bytes:
+        date = b"" if HeaderType.DATE.value in self.headers else DateUtils.header()
+        header_lines = [f"{key}: {value}" for key, value in self.headers.items()]
+        headers = "".join(line + self.CARRIAGE_RETURN for line in header_lines)
+        return self.head + date + headers.encode()
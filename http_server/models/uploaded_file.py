@@ -0,0 +1,32 @@
+from typing import IO
+import shutil
+
+
+class UploadedFile:
+    def __init__(
+        self, name: str, filename: str, content_type: str | None, file: IO[bytes]
+    ) -> None:
+        self.name = name
+        self.filename = filename
+        self.content_type = content_type
+        self.file = file
+        self.size = 0
+
+    def write(self, data: bytes) -> None:
+        self.file.write(data)
+        self.size += len(data)
+
+    def read(self) -> bytes:
+        self.file.seek(0)
+        return self.file.read()
+
+    def save(self, path: str) -> None:
+        self.file.seek(0)
+        with open(path, "wb") as file:
+            shutil.copyfileobj(self.file, file)
+
+    def close(self) -> None:
+        self.file.close()
+
+    def __repr__(self) -> str:
+        return f"UploadedFile({self.name!r}, {self.filename!r}, {self.size} bytes)"
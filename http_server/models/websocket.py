@@ -0,0 +1,175 @@
+from ..enums import CloseCode, Opcode
+from ..utils.websocket_parser import Frame, WebSocketParser
+from .request import Request
+from .websocket_error import WebSocketClosed, WebSocketError
+
+from typing import List, NoReturn, Tuple
+import asyncio
+import struct
+
+
+class WebSocket:
+    READ_SIZE = 65536
+    CLOSE_TIMEOUT = 5
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        request: Request,
+        parser: WebSocketParser,
+        subprotocol: str | None = None,
+    ) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.request = request
+        self.parser = parser
+        self.subprotocol = subprotocol
+        self.closed = False
+        self.close_code: int | None = None
+        self.close_reason = ""
+        self._fragments: List[bytes] = []
+        self._fragments_opcode = Opcode.TEXT
+
+    async def receive(self) -> str | bytes:
+        while True:
+            if self.closed or self.close_code is not None:
+                raise WebSocketClosed(
+                    self.close_code or CloseCode.NORMAL, self.close_reason
+                )
+            message = await self._handle_frame(await self._read_frame())
+            if message is not None:
+                return message
+
+    async def send(self, message: str | bytes) -> None:
+        if isinstance(message, str):
+            await self._send_frame(Opcode.TEXT, message.encode())
+        else:
+            await self._send_frame(Opcode.BINARY, bytes(message))
+
+    async def ping(self, payload: bytes = b"") -> None:
+        await self._send_frame(Opcode.PING, payload)
+
+    async def close(self, code: int = CloseCode.NORMAL, reason: str = "") -> None:
+        if self.closed:
+            return
+
+        await self._send_close(code, reason)
+        if self.close_code is not None:
+            return
+        try:
+            await asyncio.wait_for(self._wait_for_close(), self.CLOSE_TIMEOUT)
+        except (asyncio.TimeoutError, WebSocketError):
+            pass
+
+    def __aiter__(self) -> "WebSocket":
+        return self
+
+    async def __anext__(self) -> str | bytes:
+        try:
+            return await self.receive()
+        except WebSocketClosed:
+            raise StopAsyncIteration
+
+    async def _wait_for_close(self) -> None:
+        while self.close_code is None:
+            frame = await self._read_frame()
+            if frame.opcode == Opcode.CLOSE:
+                self.close_code, self.close_reason = self._parse_close(frame.payload)
+
+    async def _read_frame(self) -> Frame:
+        while True:
+            try:
+                frame = self.parser.next_frame()
+            except WebSocketError as error:
+                await self._fail(error.code, str(error))
+            if frame is not None:
+                return frame
+
+            try:
+                data = await self.reader.read(self.READ_SIZE)
+            except ConnectionError:
+                data = b""
+            if not data:
+                self.closed = True
+                self.close_code = CloseCode.ABNORMAL
+                raise WebSocketClosed(CloseCode.ABNORMAL, "Connection lost.")
+            self.parser.feed(data)
+
+    async def _handle_frame(self, frame: Frame) -> str | bytes | None:
+        if frame.opcode == Opcode.PING:
+            await self._send_frame(Opcode.PONG, frame.payload)
+            return None
+        if frame.opcode == Opcode.PONG:
+            return None
+        if frame.opcode == Opcode.CLOSE:
+            try:
+                code, reason = self._parse_close(frame.payload)
+            except WebSocketError as error:
+                await self._fail(error.code, str(error))
+            self.close_code, self.close_reason = code, reason
+            reply = CloseCode.NORMAL if code == CloseCode.NO_STATUS else code
+            await self._send_close(reply, "")
+            raise WebSocketClosed(code, reason)
+
+        if frame.opcode != Opcode.CONTINUATION:
+            self._fragments_opcode = frame.opcode
+        self._fragments.append(frame.payload)
+        if not frame.fin:
+            return None
+
+        payload = b"".join(self._fragments)
+        self._fragments = []
+        if self._fragments_opcode == Opcode.BINARY:
+            return payload
+        try:
+            return payload.decode()
+        except UnicodeDecodeError:
+            await self._fail(CloseCode.INVALID_PAYLOAD, "Text message is not UTF-8.")
+
+    def _parse_close(self, payload: bytes) -> Tuple[int, str]:
+        if not payload:
+            return CloseCode.NO_STATUS, ""
+        if len(payload) < 2:
+            raise WebSocketError("Close frame payload is too short.")
+
+        (code,) = struct.unpack_from("!H", payload)
+        if not CloseCode.is_valid(code):
+            raise WebSocketError(f"Invalid close code {code}.")
+        try:
+            return code, payload[2:].decode()
+        except UnicodeDecodeError:
+            raise WebSocketError(
+                "Close reason is not UTF-8.", CloseCode.INVALID_PAYLOAD
+            )
+
+    async def _fail(self, code: int, reason: str) -> NoReturn:
+        await self._send_close(code, "")
+        self.close_code, self.close_reason = code, reason
+        raise WebSocketClosed(code, reason)
+
+    async def _send_close(self, code: int, reason: str) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            await self._write(
+                WebSocketParser.encode(
+                    Opcode.CLOSE, struct.pack("!H", code) + self._encode_reason(reason)
+                )
+            )
+        except ConnectionError:
+            pass
+
+    @staticmethod
+    def _encode_reason(reason: str) -> bytes:
+        return reason.encode()[:123].decode(errors="ignore").encode()
+
+    async def _send_frame(self, opcode: Opcode, payload: bytes) -> None:
+        if self.closed:
+            raise WebSocketClosed(self.close_code or CloseCode.NORMAL, "")
+        await self._write(WebSocketParser.encode(opcode, payload))
+
+    async def _write(self, data: bytes) -> None:
+        self.writer.write(data)
+        await self.writer.drain()
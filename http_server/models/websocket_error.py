@@ -0,0 +1,13 @@
+from ..enums.close_codes import CloseCode
+
+
+class WebSocketError(Exception):
+    def __init__(self, message: str, code: int = CloseCode.PROTOCOL_ERROR) -> None:
+        super().__init__(message)
+        self.code = code
+
+
+class WebSocketClosed(WebSocketError):
+    def __init__(self, code: int = CloseCode.NORMAL, reason: str = "") -> None:
+        super().__init__(f"WebSocket closed with code {code}: {reason!r}.", code)
+        self.reason = reason
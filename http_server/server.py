@@ -1,11 +1,33 @@
-from .handlers import LoggingHandler, ClientHandler
+from .handlers import (
+    LoggingHandler,
+    ClientHandler,
+    AsyncClientHandler,
+    SupervisorHandler,
+)
 from .enums import Method, ContentType, StatusCode
-from .models import Resource, Route
-from .utils.file import FileUtils
+from .models import (
+    Resource,
+    FileResource,
+    EventResource,
+    WebSocketResource,
+    Route,
+    CacheControl,
+    Request,
+    RequestBody,
+)
+from .utils.file_cache import FileCache
+from .utils.router import Router
+from .utils.websocket_parser import WebSocketParser
+from .utils.static_index import StaticIndex
+from .utils.response_cache import ResponseCache
+from .utils.compressor import Compressor
+from .utils.socket_writer import SocketWriter
 from .types import CreatorType, Creator
 
+from datetime import timedelta
 from typing import Callable, List, Dict
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Executor, ThreadPoolExecutor
+import asyncio
 import socket
 
 logger = LoggingHandler.create_logger(__name__)
@@ -17,14 +39,30 @@ class Server:
         ip: str = "0.0.0.0",
         port: int = 80,
         max_clients: int = 10,
+        keep_alive_timeout: float = 5,
+        max_keep_alive_requests: int = 100,
+        response_cache_size: int = ResponseCache.MAX_BYTES,
+        compression: bool = True,
+        compression_min_size: int = Compressor.MIN_SIZE,
+        write_high_water_mark: int = SocketWriter.HIGH_WATER_MARK,
+        max_body_size: int = RequestBody.MAX_SIZE,
+        body_spool_size: int = RequestBody.SPOOL_SIZE,
     ) -> None:
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         self.socket.bind((ip, port))
         self.socket.listen(max_clients)
 
-        self.routes: Dict[Route, Resource] = {}
+        self.router = Router()
         self.error_routes: Dict[StatusCode, Resource] = {}
+        self.keep_alive_timeout = keep_alive_timeout
+        self.max_keep_alive_requests = max_keep_alive_requests
+        self.file_cache = FileCache()
+        self.response_cache = ResponseCache(max_bytes=response_cache_size)
+        self.compressor = Compressor(enabled=compression, min_size=compression_min_size)
+        self.write_high_water_mark = write_high_water_mark
+        self.max_body_size = max_body_size
+        self.body_spool_size = body_spool_size
 
         logger.debug(
             f"Initiated {self.__class__.__name__} on ({ip}, {port}) with {max_clients} max clients."
@@ -36,6 +74,12 @@ class Server:
         path: str = "/",
         content_type: ContentType = ContentType.HTML,
         success_status: StatusCode = StatusCode.OK,
+        etag: bool = False,
+        cache: CacheControl | None = None,
+        vary: List[str] | None = None,
+        static: bool = False,
+        max_body_size: int | None = None,
+        spool_body: bool = False,
     ) -> Callable[[CreatorType], CreatorType]:
         def decorator(function: CreatorType) -> CreatorType:
             self.add_route(
@@ -44,6 +88,12 @@ class Server:
                 path=path,
                 content_type=content_type,
                 success_status=success_status,
+                etag=etag,
+                cache=cache,
+                vary=vary,
+                static=static,
+                max_body_size=max_body_size,
+                spool_body=spool_body,
             )
 
             return function
@@ -93,13 +143,36 @@ class Server:
         path: str = "/",
         content_type: ContentType = ContentType.HTML,
         success_status: StatusCode = StatusCode.OK,
+        etag: bool = False,
+        cache: CacheControl | None = None,
+        vary: List[str] | None = None,
+        static: bool = False,
+        max_body_size: int | None = None,
+        spool_body: bool = False,
         _debug: bool = True,
     ) -> None:
-        self.routes[Route(method=method, path=path)] = Resource(
+        resource = Resource(
             function=function,
             content_type=content_type,
             success_status=success_status,
+            etag=etag,
+            cache=cache,
+            vary=vary,
+            static=static,
+            max_body_size=max_body_size,
+            spool_body=spool_body,
         )
+        if static and resource.plan.parameters:
+            raise ValueError(
+                f"Static route '{function.__name__}' cannot accept parameters."
+            )
+        if spool_body and not resource.plan.body:
+            raise ValueError(
+                f"Spooled route '{function.__name__}' must accept "
+                + f"a '{Request.BODY_KEY}' argument."
+            )
+
+        self.router.add(Route(method=method, path=path), resource)
 
         if _debug:
             logger.debug(
@@ -107,6 +180,67 @@ class Server:
                 + f"'{function.__name__}' with {content_type.name} content type."
             )
 
+    def sse(
+        self, path: str = "/", heartbeat: timedelta = EventResource.HEARTBEAT_INTERVAL
+    ) -> Callable[[CreatorType], CreatorType]:
+        def decorator(function: CreatorType) -> CreatorType:
+            self.add_event_route(function=function, path=path, heartbeat=heartbeat)
+
+            return function
+
+        return decorator
+
+    def add_event_route(
+        self,
+        function: Creator,
+        path: str = "/",
+        heartbeat: timedelta = EventResource.HEARTBEAT_INTERVAL,
+    ) -> None:
+        self.router.add(
+            Route(method=Method.GET, path=path),
+            EventResource(function=function, heartbeat=heartbeat),
+        )
+
+        logger.debug(
+            f"Added event stream route '{path}' to function '{function.__name__}'."
+        )
+
+    def websocket(
+        self,
+        path: str = "/",
+        max_message_size: int = WebSocketParser.MAX_MESSAGE_SIZE,
+        subprotocols: List[str] | None = None,
+    ) -> Callable[[CreatorType], CreatorType]:
+        def decorator(function: CreatorType) -> CreatorType:
+            self.add_websocket_route(
+                function=function,
+                path=path,
+                max_message_size=max_message_size,
+                subprotocols=subprotocols,
+            )
+
+            return function
+
+        return decorator
+
+    def add_websocket_route(
+        self,
+        function: Creator,
+        path: str = "/",
+        max_message_size: int = WebSocketParser.MAX_MESSAGE_SIZE,
+        subprotocols: List[str] | None = None,
+    ) -> None:
+        self.router.add(
+            Route(method=Method.GET, path=path),
+            WebSocketResource(
+                function=function,
+                max_message_size=max_message_size,
+                subprotocols=subprotocols,
+            ),
+        )
+
+        logger.debug(f"Added WebSocket route '{path}' to '{function.__name__}'.")
+
     def add_file_route(
         self,
         file_path: str,
@@ -114,18 +248,16 @@ class Server:
         path: str = "/",
         content_type: ContentType = ContentType.HTML,
         success_status: StatusCode = StatusCode.OK,
+        cache: CacheControl | None = None,
     ) -> None:
-        def function():
-            return FileUtils.read(path=file_path)
-
-        function.__name__ = FileUtils.read.__name__
-        self.add_route(
-            function=function,
-            method=method,
-            path=path,
-            content_type=content_type,
-            success_status=success_status,
-            _debug=False,
+        self.router.add(
+            Route(method=method, path=path),
+            FileResource(
+                file_path=file_path,
+                content_type=content_type,
+                success_status=success_status,
+                cache=cache,
+            ),
         )
 
         logger.debug(
@@ -133,6 +265,14 @@ class Server:
             + f"file contents with {content_type.name} content type."
         )
 
+    def mount_static(
+        self, url_prefix: str, directory: str, cache: CacheControl | None = None
+    ) -> None:
+        index = StaticIndex(url_prefix=url_prefix, directory=directory, cache=cache)
+        self.router.mount(index)
+
+        logger.debug(f"Mounted '{directory}' on '{index.url_prefix}/'.")
+
     def _run(self, max_workers: int) -> None:
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             while True:
@@ -147,16 +287,82 @@ class Server:
                 client_handler = ClientHandler(
                     socket=socket,
                     address=address,
-                    routes=self.routes,
+                    router=self.router,
                     error_routes=self.error_routes,
+                    file_cache=self.file_cache,
+                    response_cache=self.response_cache,
+                    compressor=self.compressor,
+                    keep_alive_timeout=self.keep_alive_timeout,
+                    max_requests=self.max_keep_alive_requests,
+                    high_water_mark=self.write_high_water_mark,
+                    max_body_size=self.max_body_size,
+                    spool_size=self.body_spool_size,
                 )
 
                 executor.submit(client_handler.handle)
 
-    def run(self, max_workers: int = 5) -> None:
+    def run(self, max_workers: int = 5, workers: int = 1) -> None:
+        resources = self.router.routes.values()
+        if any(isinstance(resource, EventResource) for resource in resources):
+            logger.warning(
+                "Event stream routes hold a worker thread for every connected "
+                + "client when served with run(), prefer run_async()."
+            )
+        if any(isinstance(resource, WebSocketResource) for resource in resources):
+            logger.warning("WebSocket routes are only served by run_async().")
+        self._start(target=lambda: self._run(max_workers=max_workers), workers=workers)
+
+    async def _handle_async(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        executor: Executor,
+    ) -> None:
+        logger.debug(f"Accepted connection from {writer.get_extra_info('peername')}.")
+
+        client_handler = AsyncClientHandler(
+            reader=reader,
+            writer=writer,
+            router=self.router,
+            error_routes=self.error_routes,
+            file_cache=self.file_cache,
+            response_cache=self.response_cache,
+            compressor=self.compressor,
+            executor=executor,
+            keep_alive_timeout=self.keep_alive_timeout,
+            max_requests=self.max_keep_alive_requests,
+            high_water_mark=self.write_high_water_mark,
+            max_body_size=self.max_body_size,
+            spool_size=self.body_spool_size,
+        )
+
+        await client_handler.handle()
+
+    async def _run_async(self, max_workers: int) -> None:
+        self.socket.setblocking(False)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            server = await asyncio.start_server(
+                lambda reader, writer: self._handle_async(reader, writer, executor),
+                sock=self.socket,
+            )
+            async with server:
+                await server.serve_forever()
+
+    def run_async(self, max_workers: int = 5, workers: int = 1) -> None:
+        self._start(
+            target=lambda: asyncio.run(self._run_async(max_workers=max_workers)),
+            workers=workers,
+        )
+
+    def _start(self, target: Callable[[], None], workers: int) -> None:
         try:
-            self._run(max_workers=max_workers)
+            if workers > 1:
+                SupervisorHandler(target=target, workers=workers).run()
+            else:
+                target()
         except KeyboardInterrupt:
+            pass
+        finally:
             self.close()
 
     def close(self) -> None:
@@ -1,9 +1,22 @@
-from typing import Callable, TypeVar
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    TypeVar,
+)
 
 from .decorators import _InjectedFunction
 from .models.redirect import Redirect
 
 
-Content = str | bytes | None | Redirect
-Creator = Callable[..., Content] | _InjectedFunction
+Chunk = str | bytes
+Json = Dict[str, Any] | List[Any]
+Content = (
+    str | bytes | None | Redirect | Json | Iterator[Chunk] | AsyncIterator[Chunk]
+)
+Creator = Callable[..., Content] | Callable[..., Awaitable[Content]] | _InjectedFunction
 CreatorType = TypeVar("CreatorType", bound=Creator)
@@ -1,3 +1,8 @@
 from .file import FileUtils
 from .date import DateUtils
-from .html import HtmlUtils
+from .html import HtmlUtils, Markup
+from .etag import ETagUtils
+from .json import JsonUtils
+from .template import Template, TemplateCache
+from .file_cache import FileCache, CachedFile, FileStat
+from .byte_range import ByteRangeUtils
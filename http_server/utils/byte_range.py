@@ -0,0 +1,61 @@
+from typing import List, Tuple
+
+
+class ByteRangeUtils:
+    UNIT = "bytes"
+    MAX_RANGES = 16
+
+    @classmethod
+    def parse(cls, header: str, size: int) -> List[Tuple[int, int]] | None:
+        unit, _, specs = header.partition("=")
+        if unit.strip().lower() != cls.UNIT:
+            return None
+
+        specs = [spec.strip() for spec in specs.split(",") if spec.strip()]
+        if not specs or len(specs) > cls.MAX_RANGES:
+            return None
+
+        ranges: List[Tuple[int, int]] = []
+        for spec in specs:
+            first, dash, last = (part.strip() for part in spec.partition("-"))
+            if not dash or not cls._is_number(first) or not cls._is_number(last):
+                return None
+
+            if not first:
+                if not last:
+                    return None
+                suffix = int(last)
+                if suffix and size:
+                    ranges.append((max(size - suffix, 0), size - 1))
+                continue
+
+            start = int(first)
+            end = int(last) if last else size - 1
+            if last and end < start:
+                return None
+            if start < size:
+                ranges.append((start, min(end, size - 1)))
+
+        return cls._merge(ranges)
+
+    @classmethod
+    def content_range(cls, start: int, end: int, size: int) -> str:
+        return f"{cls.UNIT} {start}-{end}/{size}"
+
+    @classmethod
+    def unsatisfied_range(cls, size: int) -> str:
+        return f"{cls.UNIT} */{size}"
+
+    @staticmethod
+    def _is_number(string: str) -> bool:
+        return not string or (string.isascii() and string.isdigit())
+
+    @staticmethod
+    def _merge(ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        merged: List[Tuple[int, int]] = []
+        for start, end in sorted(ranges):
+            if merged and start <= merged[-1][1] + 1:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return merged
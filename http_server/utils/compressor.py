@@ -0,0 +1,128 @@
+from ..enums import ContentType
+
+from typing import Dict, Tuple
+import functools
+import zlib
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+class Compressor:
+    GZIP = "gzip"
+    BROTLI = "br"
+    ENCODINGS = (BROTLI, GZIP)
+    ALIASES = {"x-gzip": GZIP}
+    EXTENSIONS = {BROTLI: ".br", GZIP: ".gz"}
+    LEVELS = {BROTLI: 4, GZIP: 6}
+    FILE_LEVELS = {BROTLI: 9, GZIP: 9}
+    GZIP_WBITS = 31
+    MIN_SIZE = 1024
+    MAX_FILE_SIZE = 8 * 1024 * 1024
+    COMPRESSIBLE_TYPES = frozenset(
+        {
+            ContentType.HTML,
+            ContentType.CSS,
+            ContentType.JS,
+            ContentType.JSON,
+            ContentType.SVG,
+            ContentType.ICO,
+            ContentType.TEXT,
+            ContentType.CSV,
+            ContentType.XML,
+            ContentType.WASM,
+            ContentType.MANIFEST,
+        }
+    )
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        min_size: int = MIN_SIZE,
+        max_file_size: int = MAX_FILE_SIZE,
+    ) -> None:
+        self.min_size = min_size
+        self.max_file_size = max_file_size
+        self.encodings: Tuple[str, ...] = ()
+        if enabled:
+            self.encodings = tuple(
+                encoding
+                for encoding in self.ENCODINGS
+                if encoding != self.BROTLI or brotli is not None
+            )
+
+    def is_compressible(
+        self, content_type: ContentType | None, size: int | None = None
+    ) -> bool:
+        return (
+            bool(self.encodings)
+            and content_type in self.COMPRESSIBLE_TYPES
+            and (size is None or size >= self.min_size)
+        )
+
+    def negotiate(
+        self, accept_encoding: str | None, encodings: Tuple[str, ...] | None = None
+    ) -> str | None:
+        if not accept_encoding:
+            return None
+        return self._negotiate(
+            accept_encoding, self.encodings if encodings is None else encodings
+        )
+
+    def compress(self, data: bytes, encoding: str, level: int | None = None) -> bytes:
+        level = self.LEVELS[encoding] if level is None else level
+        if encoding == self.BROTLI:
+            return brotli.compress(data, quality=level)
+        compressor = zlib.compressobj(level, zlib.DEFLATED, self.GZIP_WBITS)
+        return compressor.compress(data) + compressor.flush()
+
+    def stream(self, encoding: str) -> "StreamCompressor":
+        return StreamCompressor(encoding=encoding, level=self.LEVELS[encoding])
+
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def _negotiate(
+        cls, accept_encoding: str, encodings: Tuple[str, ...]
+    ) -> str | None:
+        qualities: Dict[str, float] = {}
+        for token in accept_encoding.split(","):
+            name, _, parameters = token.partition(";")
+            name = name.strip().lower()
+            quality = 1.0
+            for parameter in parameters.split(";"):
+                key, _, value = parameter.partition("=")
+                if key.strip().lower() == "q":
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        quality = 0.0
+            qualities[cls.ALIASES.get(name, name)] = quality
+
+        default = qualities.get("*", 0.0)
+        best, best_quality = None, 0.0
+        for encoding in encodings:
+            quality = qualities.get(encoding, default)
+            if quality > best_quality:
+                best, best_quality = encoding, quality
+        return best
+
+
+class StreamCompressor:
+    def __init__(self, encoding: str, level: int) -> None:
+        self.encoding = encoding
+        if encoding == Compressor.BROTLI:
+            self._brotli = brotli.Compressor(quality=level)
+        else:
+            self._zlib = zlib.compressobj(level, zlib.DEFLATED, Compressor.GZIP_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        if self.encoding == Compressor.BROTLI:
+            return self._brotli.process(data) + self._brotli.flush()
+        return self._zlib.compress(data) + self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == Compressor.BROTLI:
+            return self._brotli.finish()
+        return self._zlib.flush(zlib.Z_FINISH)
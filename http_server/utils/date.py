@@ -1,11 +1,86 @@
+from typing import Tuple
 from datetime import datetime, timezone
+from email.utils import mktime_tz, parsedate_tz
+import functools
+import time
 
 
 class DateUtils:
-    @staticmethod
-    def rfc7321(date: datetime = datetime.now(timezone.utc)) -> str:
-        return date.strftime("%a, %d %b %Y %H:%M:%S GMT")
+    WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+    MONTHS = (
+        "Jan",
+        "Feb",
+        "Mar",
+        "Apr",
+        "May",
+        "Jun",
+        "Jul",
+        "Aug",
+        "Sep",
+        "Oct",
+        "Nov",
+        "Dec",
+    )
+    MONTH_NUMBERS = {month: index for index, month in enumerate(MONTHS, start=1)}
+    _now: Tuple[int, str, bytes] = (0, "", b"")
+
+    @classmethod
+    def rfc7321(cls, date: datetime | None = None) -> str:
+        if date is None:
+            return cls.now()
+        return cls._format(date.utctimetuple())
+
+    @classmethod
+    def now(cls) -> str:
+        return cls._current()[1]
+
+    @classmethod
+    def header(cls) -> bytes:
+        return cls._current()[2]
+
+    @classmethod
+    def _current(cls) -> Tuple[int, str, bytes]:
+        current = cls._now
+        second = int(time.time())
+        if current[0] != second:
+            date = cls._format(time.gmtime(second))
+            current = (second, date, f"Date: {date}\r\n".encode())
+            cls._now = current
+        return current
+
+    @classmethod
+    def _format(cls, date: time.struct_time) -> str:
+        return (
+            f"{cls.WEEKDAYS[date.tm_wday]}, {date.tm_mday:02d} "
+            + f"{cls.MONTHS[date.tm_mon - 1]} {date.tm_year} "
+            + f"{date.tm_hour:02d}:{date.tm_min:02d}:{date.tm_sec:02d} GMT"
+        )
 
     @staticmethod
     def from_rfc7321(string: str) -> datetime:
         return datetime.strptime(string, "%a, %d-%b-%Y %H:%M:%S GMT")
+
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def from_http_date(cls, string: str) -> datetime:
+        parts = string.split(" ")
+        if len(parts) == 6 and parts[0][:-1] in cls.WEEKDAYS and parts[5] == "GMT":
+            _, day, month, year, clock, _ = parts
+            numbers = [day, year, *clock.split(":")]
+            if month in cls.MONTH_NUMBERS and len(numbers) == 5:
+                if all(number.isascii() and number.isdigit() for number in numbers):
+                    day, year, hour, minute, second = map(int, numbers)
+                    return datetime(
+                        year,
+                        cls.MONTH_NUMBERS[month],
+                        day,
+                        hour,
+                        minute,
+                        second,
+                        tzinfo=timezone.utc,
+                    )
+
+        parsed = parsedate_tz(string)
+        if parsed is None:
+            raise ValueError(f"Invalid HTTP date '{string}'.")
+        return datetime.fromtimestamp(mktime_tz(parsed), timezone.utc)
@@ -0,0 +1,28 @@
+import hashlib
+
+
+class ETagUtils:
+    DIGEST_SIZE = 16
+    READ_SIZE = 1 << 20
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> str:
+        digest = hashlib.blake2b(data, digest_size=cls.DIGEST_SIZE).hexdigest()
+        return f'"{digest}"'
+
+    @classmethod
+    def from_file(cls, path: str) -> str:
+        hash = hashlib.blake2b(digest_size=cls.DIGEST_SIZE)
+        with open(path, "rb") as file:
+            while chunk := file.read(cls.READ_SIZE):
+                hash.update(chunk)
+        return f'"{hash.hexdigest()}"'
+
+    @staticmethod
+    def for_encoding(etag: str, encoding: str) -> str:
+        return f'{etag[:-1]}-{encoding}"'
+
+    @staticmethod
+    def matches(etag: str, if_none_match: str) -> bool:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or etag.removeprefix("W/") in tags
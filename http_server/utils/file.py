@@ -1,3 +1,9 @@
+from ..enums.content_types import ContentType, EXTENSION_TO_CONTENT_TYPE
+from .template import TemplateCache
+
+import os
+
+
 class FileUtils:
     @staticmethod
     def read(path: str) -> bytes:
@@ -6,10 +12,9 @@ class FileUtils:
 
     @staticmethod
     def template(path: str, **kwargs: str) -> bytes:
-        with open(path, "r") as template:
-            content = template.read()
+        return TemplateCache.get(path).render(kwargs).encode()
 
-        for key, value in kwargs.items():
-            content = content.replace(f"[{key}]", value)
-
-        return content.encode()
+    @staticmethod
+    def content_type(path: str) -> ContentType:
+        extension = os.path.splitext(path)[1].lower()
+        return EXTENSION_TO_CONTENT_TYPE.get(extension, ContentType.BINARY)
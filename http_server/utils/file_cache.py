@@ -0,0 +1,162 @@
+from .date import DateUtils
+from .etag import ETagUtils
+
+from typing import BinaryIO, Tuple
+from collections import OrderedDict
+from datetime import datetime, timezone
+import mmap
+import os
+import threading
+import time
+
+
+class FileStat:
+    def __init__(self, stat: os.stat_result) -> None:
+        self.size = stat.st_size
+        self.mtime = stat.st_mtime
+        self.identity: Tuple[int, int, int] = (
+            stat.st_ino,
+            stat.st_size,
+            stat.st_mtime_ns,
+        )
+        self.last_modified = DateUtils.rfc7321(
+            datetime.fromtimestamp(stat.st_mtime, timezone.utc)
+        )
+        self.etag: str | None = None
+        self.checked_at = time.monotonic()
+
+
+class CachedFile:
+    def __init__(self, path: str, file: BinaryIO, stat: FileStat) -> None:
+        self.path = path
+        self.file = file
+        self.stat = stat
+        self.size = stat.size
+        self._view: memoryview | None = None
+        self._mapped: mmap.mmap | None = None
+        self._users = 0
+        self._evicted = False
+        self._lock = threading.Lock()
+
+    def fileno(self) -> int:
+        return self.file.fileno()
+
+    def view(self) -> memoryview:
+        if self._view is None:
+            if self.size == 0:
+                self._view = memoryview(b"")
+            else:
+                self._mapped = mmap.mmap(self.fileno(), 0, access=mmap.ACCESS_READ)
+                self._view = memoryview(self._mapped)
+        return self._view
+
+    def acquire(self) -> "CachedFile":
+        with self._lock:
+            self._users += 1
+        return self
+
+    def release(self) -> None:
+        with self._lock:
+            self._users -= 1
+            closing = self._evicted and not self._users
+        if closing:
+            self._close()
+
+    def evict(self) -> None:
+        with self._lock:
+            self._evicted = True
+            closing = not self._users
+        if closing:
+            self._close()
+
+    def _close(self) -> None:
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._mapped is not None:
+            try:
+                self._mapped.close()
+            except BufferError:
+                pass
+            self._mapped = None
+        self.file.close()
+
+
+class FileCache:
+    MAX_FILES = 128
+    MAX_STATS = 65536
+    STAT_INTERVAL = 1
+
+    def __init__(
+        self,
+        max_files: int = MAX_FILES,
+        max_stats: int = MAX_STATS,
+        stat_interval: float = STAT_INTERVAL,
+    ) -> None:
+        self.max_files = max_files
+        self.max_stats = max_stats
+        self.stat_interval = stat_interval
+        self._stats: OrderedDict[str, FileStat] = OrderedDict()
+        self._files: OrderedDict[str, CachedFile] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def stat(self, path: str) -> FileStat:
+        with self._lock:
+            cached = self._stats.get(path)
+            if cached is not None:
+                self._stats.move_to_end(path)
+                if time.monotonic() - cached.checked_at < self.stat_interval:
+                    return cached
+
+        stat = FileStat(os.stat(path))
+        if cached is not None and cached.identity == stat.identity:
+            cached.checked_at = stat.checked_at
+            return cached
+
+        self._store_stat(path, stat)
+        return stat
+
+    def get(self, path: str) -> CachedFile:
+        stat = self.stat(path)
+        with self._lock:
+            cached = self._files.get(path)
+            if cached is not None and cached.stat is stat:
+                self._files.move_to_end(path)
+                return cached.acquire()
+
+        file = open(path, "rb")
+        opened_stat = FileStat(os.fstat(file.fileno()))
+        if opened_stat.identity != stat.identity:
+            stat = opened_stat
+            self._store_stat(path, stat)
+        cached = CachedFile(path=path, file=file, stat=stat).acquire()
+        evicted = []
+        with self._lock:
+            if (previous := self._files.pop(path, None)) is not None:
+                evicted.append(previous)
+            self._files[path] = cached
+            while len(self._files) > self.max_files:
+                evicted.append(self._files.popitem(last=False)[1])
+        for evicted_file in evicted:
+            evicted_file.evict()
+        return cached
+
+    def etag(self, path: str, stat: FileStat) -> str:
+        if stat.etag is None:
+            stat.etag = ETagUtils.from_file(path)
+        return stat.etag
+
+    def clear(self) -> None:
+        with self._lock:
+            files = list(self._files.values())
+            self._stats.clear()
+            self._files.clear()
+        for file in files:
+            file.evict()
+
+    def _store_stat(self, path: str, stat: FileStat) -> None:
+        with self._lock:
+            self._stats[path] = stat
+            self._stats.move_to_end(path)
+            while len(self._stats) > self.max_stats:
+                self._stats.popitem(last=False)
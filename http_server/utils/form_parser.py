@@ -0,0 +1,245 @@
+from ..enums.content_types import ContentType
+from ..models.form import Form
+from ..models.request import Request
+from ..models.uploaded_file import UploadedFile
+
+from typing import Dict, Tuple
+from abc import ABC, abstractmethod
+from urllib.parse import unquote
+import re
+import tempfile
+
+
+class FormParser(ABC):
+    ENCODING = "utf-8"
+    MAX_FIELD_SIZE = 1024 * 1024
+    MAX_PARTS = 1000
+    PARAMETER = re.compile(r';\s*([^\s;=]+)\s*=\s*("(?:[^"\\]|\\.)*"|[^;]*)')
+
+    def __init__(
+        self, max_field_size: int = MAX_FIELD_SIZE, max_parts: int = MAX_PARTS
+    ) -> None:
+        self.max_field_size = max_field_size
+        self.max_parts = max_parts
+        self.parts = 0
+        self.form = Form()
+
+    @classmethod
+    def create(cls, content_type: str | None, spool_size: int) -> "FormParser | None":
+        content_type = content_type or ContentType.FORM.value
+        media_type = content_type.partition(";")[0].strip().lower()
+        if media_type == ContentType.FORM.value:
+            return UrlEncodedParser()
+        if media_type == ContentType.MULTIPART.value:
+            boundary = cls.parameters(content_type).get("boundary")
+            if not boundary:
+                raise ValueError("Multipart form has no boundary.")
+            return MultipartParser(boundary=boundary, spool_size=spool_size)
+        return None
+
+    @classmethod
+    def parameters(cls, header: str) -> Dict[str, str]:
+        parameters = {}
+        for key, value in cls.PARAMETER.findall(header):
+            if value.startswith('"'):
+                value = value[1:-1].replace('\\"', '"')
+            parameters[key.lower()] = value.strip()
+        return parameters
+
+    @abstractmethod
+    def feed(self, data: bytes) -> None:
+        pass
+
+    @abstractmethod
+    def finish(self) -> Form:
+        pass
+
+    def _count_part(self) -> None:
+        self.parts += 1
+        if self.parts > self.max_parts:
+            raise ValueError(f"Form has more than {self.max_parts} parts.")
+
+
+class UrlEncodedParser(FormParser):
+    def __init__(self, max_field_size: int = FormParser.MAX_FIELD_SIZE) -> None:
+        super().__init__(max_field_size=max_field_size)
+        self._pending = bytearray()
+
+    def feed(self, data: bytes) -> None:
+        start, end = data.find(b"&"), data.rfind(b"&")
+        if start == -1:
+            self._append(data)
+            return
+
+        self._append(data[:start])
+        self._pending += data[start:end]
+        self._add_fields()
+        self._append(data[end + 1 :])
+
+    def finish(self) -> Form:
+        self._add_fields()
+        return self.form
+
+    def _append(self, data: bytes) -> None:
+        self._pending += data
+        if len(self._pending) > self.max_field_size:
+            raise ValueError("Form field is too large.")
+
+    def _add_fields(self) -> None:
+        query = self._pending.decode(self.ENCODING)
+        self._pending.clear()
+        for name, value in Request.parse_query(query):
+            self._count_part()
+            self.form.add_field(name, value)
+
+
+class MultipartParser(FormParser):
+    MAX_HEADERS_SIZE = 16 * 1024
+    HEADERS_END = b"\r\n\r\n"
+    LINE_END = b"\r\n"
+    FINAL = b"--"
+
+    _PREAMBLE = 0
+    _BOUNDARY = 1
+    _HEADERS = 2
+    _DATA = 3
+    _EPILOGUE = 4
+
+    def __init__(
+        self,
+        boundary: str,
+        spool_size: int,
+        max_field_size: int = FormParser.MAX_FIELD_SIZE,
+        max_parts: int = FormParser.MAX_PARTS,
+    ) -> None:
+        super().__init__(max_field_size=max_field_size, max_parts=max_parts)
+        self.delimiter = self.LINE_END + b"--" + boundary.encode(self.ENCODING)
+        self.spool_size = spool_size
+        self.buffer = bytearray(self.LINE_END)
+        self._state = self._PREAMBLE
+        self._file: UploadedFile | None = None
+        self._field: Tuple[str, bytearray] | None = None
+
+    def feed(self, data: bytes) -> None:
+        self.buffer += data
+        while self._step():
+            pass
+
+    def finish(self) -> Form:
+        if self._state != self._EPILOGUE:
+            raise ValueError("Multipart form is incomplete.")
+        return self.form
+
+    def _step(self) -> bool:
+        if self._state == self._PREAMBLE:
+            return self._skip_preamble()
+        if self._state == self._BOUNDARY:
+            return self._parse_boundary()
+        if self._state == self._HEADERS:
+            return self._parse_headers()
+        if self._state == self._DATA:
+            return self._parse_data()
+        self.buffer.clear()
+        return False
+
+    def _skip_preamble(self) -> bool:
+        index = self.buffer.find(self.delimiter)
+        if index == -1:
+            del self.buffer[: max(0, len(self.buffer) - len(self.delimiter) + 1)]
+            return False
+        del self.buffer[: index + len(self.delimiter)]
+        self._state = self._BOUNDARY
+        return True
+
+    def _parse_boundary(self) -> bool:
+        if self.buffer.startswith(self.FINAL):
+            self._state = self._EPILOGUE
+            return True
+        end = self.buffer.find(self.LINE_END)
+        if end == -1:
+            if len(self.buffer) > self.MAX_HEADERS_SIZE:
+                raise ValueError("Multipart boundary line is too long.")
+            return False
+        if self.buffer[:end].strip(b" \t"):
+            raise ValueError("Multipart boundary is followed by data.")
+        del self.buffer[: end + len(self.LINE_END)]
+        self._state = self._HEADERS
+        return True
+
+    def _parse_headers(self) -> bool:
+        if self.buffer.startswith(self.LINE_END):
+            end, length = 0, len(self.LINE_END)
+        else:
+            end, length = self.buffer.find(self.HEADERS_END), len(self.HEADERS_END)
+        if end == -1:
+            if len(self.buffer) > self.MAX_HEADERS_SIZE:
+                raise ValueError("Multipart part headers are too large.")
+            return False
+
+        headers: Dict[str, str] = {}
+        for line in self.buffer[:end].decode(self.ENCODING).split("\r\n"):
+            name, separator, value = line.partition(":")
+            if not separator:
+                raise ValueError(f"Invalid multipart header: {line}")
+            headers[name.strip().lower()] = value.strip()
+        del self.buffer[: end + length]
+        self._start_part(headers)
+        self._state = self._DATA
+        return True
+
+    def _start_part(self, headers: Dict[str, str]) -> None:
+        self._count_part()
+        disposition = headers.get("content-disposition", "")
+        options = self.parameters(disposition)
+        name = options.get("name")
+        if disposition.partition(";")[0].strip().lower() != "form-data" or not name:
+            raise ValueError("Multipart part is not a named form-data part.")
+
+        filename = options.get("filename")
+        if "filename*" in options:
+            _, _, encoded = options["filename*"].partition("''")
+            filename = unquote(encoded)
+        if filename is None:
+            self._field = (name, bytearray())
+            return
+
+        self._file = UploadedFile(
+            name=name,
+            filename=filename,
+            content_type=headers.get("content-type"),
+            file=tempfile.SpooledTemporaryFile(max_size=self.spool_size),
+        )
+        self.form.add_file(self._file)
+
+    def _parse_data(self) -> bool:
+        index = self.buffer.find(self.delimiter)
+        if index == -1:
+            self._write(max(0, len(self.buffer) - len(self.delimiter) + 1))
+            return False
+
+        self._write(index)
+        del self.buffer[: len(self.delimiter)]
+        self._end_part()
+        self._state = self._BOUNDARY
+        return True
+
+    def _write(self, size: int) -> None:
+        if not size:
+            return
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        if self._file is not None:
+            self._file.write(data)
+            return
+
+        value = self._field[1]
+        value += data
+        if len(value) > self.max_field_size:
+            raise ValueError("Form field is too large.")
+
+    def _end_part(self) -> None:
+        if self._field is not None:
+            name, value = self._field
+            self.form.add_field(name, value.decode(self.ENCODING))
+        self._field = None
+        self._file = None
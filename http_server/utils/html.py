@@ -1,17 +1,58 @@
+from typing import Iterable, List, Tuple
+
+
+class Markup(str):
+    pass
+
+
 class HtmlUtils:
-    @staticmethod
-    def string_to_html(string: str) -> str:
-        replacements = {
-            "&": "&amp;",
-            "'": "&#39;",
-            '"': "&quot;",
-            "\t": "&emsp;",
-            "<": "&lt;",
-            ">": "&gt;",
-            "\n": "<br>",
-        }
-
-        for escape, html in replacements.items():
-            string = string.replace(escape, html)
+    ESCAPES: Tuple[Tuple[str, str], ...] = (
+        ("&", "&amp;"),
+        ("<", "&lt;"),
+        (">", "&gt;"),
+        ('"', "&quot;"),
+        ("'", "&#39;"),
+    )
+    TEXT_ESCAPES = ESCAPES + (("\t", "&emsp;"), ("\n", "<br>"))
+    SEPARATOR = "\x00"
+
+    @classmethod
+    def escape(cls, value: object) -> str:
+        if isinstance(value, Markup):
+            return value
+        return cls._replace(value if isinstance(value, str) else str(value))
+
+    @classmethod
+    def escape_many(cls, values: Iterable[object]) -> List[str]:
+        escaped = [
+            value if isinstance(value, str) else str(value)
+            for value in values
+        ]
+        indexes = [
+            index
+            for index, value in enumerate(escaped)
+            if not isinstance(value, Markup)
+        ]
+        if len(indexes) < 2:
+            return [cls.escape(value) for value in escaped]
+
+        joined = cls.SEPARATOR.join(escaped[index] for index in indexes)
+        if joined.count(cls.SEPARATOR) != len(indexes) - 1:
+            return [cls.escape(value) for value in escaped]
+
+        for index, value in zip(indexes, cls._replace(joined).split(cls.SEPARATOR)):
+            escaped[index] = value
+        return escaped
+
+    @classmethod
+    def string_to_html(cls, string: str) -> str:
+        return cls._replace(string, cls.TEXT_ESCAPES)
 
+    @classmethod
+    def _replace(
+        cls, string: str, escapes: Tuple[Tuple[str, str], ...] | None = None
+    ) -> str:
+        for character, entity in escapes or cls.ESCAPES:
+            if character in string:
+                string = string.replace(character, entity)
         return string
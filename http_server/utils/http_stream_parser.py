@@ -0,0 +1,162 @@
+from ..enums.header_types import HeaderType
+from ..models.request import Request
+from .http_parser import HttpParser
+
+
+class HttpStreamParser:
+    HEADERS_END = b"\r\n\r\n"
+    LINE_END = b"\r\n"
+    MAX_HEADERS_SIZE = 65536
+    MAX_CHUNK_LINE_SIZE = 1024
+    HEX_DIGITS = b"0123456789abcdefABCDEF"
+
+    _HEADERS = 0
+    _BODY = 1
+    _CHUNK_SIZE = 2
+    _CHUNK_DATA = 3
+    _CHUNK_END = 4
+    _TRAILERS = 5
+    _DONE = 6
+
+    def __init__(self, max_headers_size: int = MAX_HEADERS_SIZE) -> None:
+        self.max_headers_size = max_headers_size
+        self.buffer = bytearray()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._state = self._HEADERS
+        self._scanned = 0
+        self._request: Request | None = None
+        self._body = bytearray()
+        self._remaining = 0
+        self._trailers_size = 0
+        self.content_length: int | None = None
+
+    def feed(self, data: bytes) -> None:
+        self.buffer += data
+
+    def has_buffered_data(self) -> bool:
+        return bool(self.buffer)
+
+    @property
+    def body_complete(self) -> bool:
+        return self._state == self._DONE
+
+    def next_request(self) -> Request | None:
+        request = self.next_head()
+        if request is None:
+            return None
+        self._body += self.read_body()
+        if not self.body_complete:
+            return None
+
+        request.payload = bytes(self._body) if self._body else None
+        self._reset()
+        return request
+
+    def next_head(self) -> Request | None:
+        if self._state == self._DONE:
+            self._reset()
+        if self._state == self._HEADERS and not self._parse_headers():
+            return None
+        return self._request
+
+    def read_body(self) -> bytes:
+        if self._state == self._BODY:
+            return self._read_content()
+        if self._state in (self._HEADERS, self._DONE):
+            return b""
+        return self._read_chunks()
+
+    def _parse_headers(self) -> bool:
+        end = self.buffer.find(self.HEADERS_END, self._scanned)
+        if end == -1:
+            if len(self.buffer) > self.max_headers_size:
+                raise ValueError("Request headers are too large.")
+            self._scanned = max(0, len(self.buffer) - len(self.HEADERS_END) + 1)
+            return False
+        if end > self.max_headers_size:
+            raise ValueError("Request headers are too large.")
+
+        self._request = HttpParser.parse_head(bytes(self.buffer[:end]))
+        del self.buffer[: end + len(self.HEADERS_END)]
+
+        transfer_encoding = self._request.get_header(
+            HeaderType.TRANSFER_ENCODING.value
+        )
+        content_length = self._request.get_header(HeaderType.CONTENT_LENGTH.value)
+        if transfer_encoding is not None:
+            if transfer_encoding.split(",")[-1].strip().lower() != "chunked":
+                raise ValueError(f"Unsupported transfer encoding: {transfer_encoding}")
+            self._state = self._CHUNK_SIZE
+        elif content_length is not None:
+            if not content_length.isdigit():
+                raise ValueError(f"Invalid content length: {content_length}")
+            self.content_length = self._remaining = int(content_length)
+            self._state = self._BODY if self._remaining else self._DONE
+        else:
+            self._state = self._DONE
+        return True
+
+    def _read_content(self) -> bytes:
+        data = bytes(self.buffer[: self._remaining])
+        del self.buffer[: len(data)]
+        self._remaining -= len(data)
+        if not self._remaining:
+            self._state = self._DONE
+        return data
+
+    def _read_chunks(self) -> bytes:
+        chunks = []
+        while True:
+            if self._state == self._CHUNK_SIZE:
+                line = self._read_line()
+                if line is None:
+                    break
+                size = line.split(b";")[0].strip()
+                if not size or size.strip(self.HEX_DIGITS):
+                    raise ValueError(f"Invalid chunk size: {size!r}")
+                self._remaining = int(size, 16)
+                self._state = self._CHUNK_DATA if self._remaining else self._TRAILERS
+
+            elif self._state == self._CHUNK_DATA:
+                if not self.buffer:
+                    break
+                chunks.append(bytes(self.buffer[: self._remaining]))
+                del self.buffer[: len(chunks[-1])]
+                self._remaining -= len(chunks[-1])
+                if not self._remaining:
+                    self._state = self._CHUNK_END
+
+            elif self._state == self._CHUNK_END:
+                if len(self.buffer) < len(self.LINE_END):
+                    break
+                if self.buffer[: len(self.LINE_END)] != self.LINE_END:
+                    raise ValueError("Chunk data is not terminated by CRLF.")
+                del self.buffer[: len(self.LINE_END)]
+                self._state = self._CHUNK_SIZE
+
+            elif self._state == self._TRAILERS:
+                line = self._read_line()
+                if line is None:
+                    break
+                if not line:
+                    self._state = self._DONE
+                    break
+                self._trailers_size += len(line) + len(self.LINE_END)
+                if self._trailers_size > self.max_headers_size:
+                    raise ValueError("Request trailers are too large.")
+            else:
+                break
+        return b"".join(chunks)
+
+    def _read_line(self) -> bytes | None:
+        end = self.buffer.find(self.LINE_END)
+        if end == -1:
+            if len(self.buffer) > self.MAX_CHUNK_LINE_SIZE:
+                raise ValueError("Chunk line is too long.")
+            return None
+
+        line = bytes(self.buffer[:end])
+        del self.buffer[: end + len(self.LINE_END)]
+        return line
@@ -0,0 +1,66 @@
+from typing import Any
+from datetime import date, time
+import dataclasses
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+class JsonUtils:
+    ORJSON = "orjson"
+    UJSON = "ujson"
+    JSON = "json"
+    BACKEND = ORJSON if orjson is not None else UJSON if ujson is not None else JSON
+    SEPARATORS = (",", ":")
+
+    @staticmethod
+    def default(value: Any) -> Any:
+        if dataclasses.is_dataclass(value) and not isinstance(value, type):
+            return {
+                field.name: getattr(value, field.name)
+                for field in dataclasses.fields(value)
+            }
+        if isinstance(value, (date, time)):
+            return value.isoformat()
+        raise TypeError(f"Object of type {type(value).__name__} is not serializable.")
+
+    ENCODER = json.JSONEncoder(
+        ensure_ascii=False, separators=SEPARATORS, default=default
+    )
+
+    @classmethod
+    def dumps(cls, value: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(
+                value, default=cls.default, option=orjson.OPT_NON_STR_KEYS
+            )
+        if ujson is not None:
+            return ujson.dumps(
+                value,
+                ensure_ascii=False,
+                escape_forward_slashes=False,
+                default=cls.default,
+            ).encode()
+        return cls.ENCODER.encode(value).encode()
+
+    @staticmethod
+    def loads(data: bytes | str) -> Any:
+        if orjson is not None:
+            return orjson.loads(data)
+        if ujson is not None:
+            return ujson.loads(data)
+        return json.loads(data)
+
+    @staticmethod
+    def is_serializable(value: Any) -> bool:
+        return isinstance(value, (dict, list, tuple, int, float)) or (
+            dataclasses.is_dataclass(value) and not isinstance(value, type)
+        )
@@ -0,0 +1,106 @@
+from ..models.cache_control import CacheControl
+from ..models.request import Request
+from ..models.serialized_response import SerializedResponse
+
+from typing import Hashable, List, Tuple
+from collections import OrderedDict
+import threading
+import time
+
+
+class CacheEntry:
+    def __init__(
+        self, response: SerializedResponse, ttl: float, stale_ttl: float
+    ) -> None:
+        self.response = response
+        self.expires_at = time.monotonic() + ttl
+        self.stale_until = self.expires_at + stale_ttl
+        self.revalidating = False
+
+
+class ResponseCache:
+    MAX_BYTES = 64 * 1024 * 1024
+    MAX_ENTRY_RATIO = 8
+
+    def __init__(self, max_bytes: int = MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_cacheable(cache: CacheControl | None) -> bool:
+        if cache is None or cache.no_store or cache.no_cache or cache.private:
+            return False
+        ttl = cache.s_maxage if cache.s_maxage is not None else cache.max_age
+        return cache.public and ttl is not None and ttl > 0
+
+    @staticmethod
+    def key(
+        request: Request, vary: List[str], encoding: str | None = None
+    ) -> Hashable:
+        return (
+            request.method,
+            request.path,
+            tuple(sorted(request.parameters.items())),
+            tuple(ResponseCache._vary_value(request, header) for header in vary),
+            encoding,
+        )
+
+    @staticmethod
+    def _vary_value(request: Request, header: str) -> str | None:
+        if header.lower() == Request.COOKIE:
+            return request.cookie_header()
+        return request.get_header(header)
+
+    def get(self, key: Hashable) -> Tuple[SerializedResponse, bool] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            now = time.monotonic()
+            if now >= entry.stale_until:
+                self._remove(key)
+                return None
+
+            self._entries.move_to_end(key)
+            revalidate = now >= entry.expires_at and not entry.revalidating
+            if revalidate:
+                entry.revalidating = True
+            return entry.response.copy(), revalidate
+
+    def put(
+        self, key: Hashable, response: SerializedResponse, cache: CacheControl
+    ) -> None:
+        if response.size > self.max_bytes // self.MAX_ENTRY_RATIO:
+            return
+
+        ttl = cache.s_maxage if cache.s_maxage is not None else cache.max_age
+        entry = CacheEntry(
+            response=response,
+            ttl=ttl or 0,
+            stale_ttl=cache.stale_while_revalidate or 0,
+        )
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = entry
+            self.size += response.size
+            while self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def end_revalidation(self, key: Hashable) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.revalidating = False
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry.response.size
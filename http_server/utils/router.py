@@ -0,0 +1,203 @@
+from ..enums import Method, StatusCode, HeaderType
+from ..models.http_error import HttpError
+from ..models.resource import Resource
+from ..models.route import Route
+from .static_index import StaticIndex
+
+from typing import Any, Callable, Dict, List, Tuple
+from urllib.parse import unquote
+
+
+def _to_str(segment: str) -> str | None:
+    return unquote(segment) if segment else None
+
+
+def _to_int(segment: str) -> int | None:
+    return int(segment) if segment.isascii() and segment.isdigit() else None
+
+
+def _to_float(segment: str) -> float | None:
+    try:
+        return float(segment)
+    except ValueError:
+        return None
+
+
+class _Node:
+    def __init__(
+        self, name: str | None = None, converter: Callable[[str], Any] | None = None
+    ) -> None:
+        self.name = name
+        self.converter = converter
+        self.children: Dict[str, _Node] = {}
+        self.parameters: List[_Node] = []
+        self.wildcard: _Node | None = None
+        self.resources: Dict[Method, Resource] = {}
+
+
+class Router:
+    CONVERTERS: Dict[str, Callable[[str], Any]] = {
+        "str": _to_str,
+        "int": _to_int,
+        "float": _to_float,
+    }
+    WILDCARD_CONVERTER = "path"
+
+    def __init__(self) -> None:
+        self.routes: Dict[Route, Resource] = {}
+        self._static: Dict[Route, Resource] = {}
+        self._root = _Node()
+        self.static_indexes: List[StaticIndex] = []
+
+    def add(self, route: Route, resource: Resource) -> None:
+        node = self._root
+        segments = route.path.split("/")[1:]
+        dynamic = False
+        for index, segment in enumerate(segments):
+            if not (segment.startswith("{") and segment.endswith("}")):
+                node = node.children.setdefault(segment, _Node())
+                continue
+
+            dynamic = True
+            name, _, converter_name = segment[1:-1].partition(":")
+            converter_name = converter_name or "str"
+            if not name.isidentifier():
+                raise ValueError(f"Invalid path parameter '{name}' in {route}.")
+
+            if converter_name == self.WILDCARD_CONVERTER:
+                if index != len(segments) - 1:
+                    raise ValueError(f"Wildcard parameter must be last in {route}.")
+                if node.wildcard is None:
+                    node.wildcard = _Node(name=name)
+                node = node.wildcard
+                continue
+
+            if converter_name not in self.CONVERTERS:
+                raise ValueError(f"Unknown converter '{converter_name}' in {route}.")
+            converter = self.CONVERTERS[converter_name]
+            for parameter in node.parameters:
+                if parameter.name == name and parameter.converter is converter:
+                    node = parameter
+                    break
+            else:
+                parameter = _Node(name=name, converter=converter)
+                node.parameters.append(parameter)
+                node = parameter
+
+        node.resources[route.method] = resource
+        self.routes[route] = resource
+        if not dynamic:
+            self._static[route] = resource
+
+    def mount(self, index: StaticIndex) -> None:
+        self.static_indexes.append(index)
+
+    def find(self, method: Method, path: str) -> Tuple[Resource, Dict[str, Any]]:
+        resource = self._static.get(Route(method=method, path=path))
+        if resource is None and method == Method.HEAD:
+            resource = self._static.get(Route(method=Method.GET, path=path))
+        if resource is None and method in (Method.GET, Method.HEAD):
+            resource = self._resolved_static(path)
+        if resource is not None:
+            return resource, {}
+
+        parameters: Dict[str, Any] = {}
+        fallback: List[_Node] = []
+        node = self._match(
+            self._root, path.split("/")[1:], 0, method, parameters, fallback
+        )
+        if node is not None:
+            return self._resource(node, method), parameters
+
+        static = self._find_static(path)
+        if static is not None and method in (Method.GET, Method.HEAD):
+            return static, {}
+
+        methods = set(fallback[0].resources) if fallback else set()
+        if static is not None:
+            methods.add(Method.GET)
+        if methods:
+            if Method.GET in methods:
+                methods.add(Method.HEAD)
+            allowed = ", ".join(sorted(allowed.value for allowed in methods))
+            raise HttpError(
+                message=f"Method {method.value} is not allowed for '{path}'.",
+                status_code=StatusCode.METHOD_NOT_ALLOWED,
+                headers={HeaderType.ALLOW.value: allowed},
+            )
+        raise HttpError(
+            message=f"Could not find a resource for '{path}'.",
+            status_code=StatusCode.NOT_FOUND,
+        )
+
+    def _resolved_static(self, path: str) -> Resource | None:
+        for index in self.static_indexes:
+            resource = index.get(path)
+            if resource is not None:
+                return resource
+        return None
+
+    def _find_static(self, path: str) -> Resource | None:
+        for index in self.static_indexes:
+            resource = index.find(path)
+            if resource is not None:
+                return resource
+        return None
+
+    def _match(
+        self,
+        node: _Node,
+        segments: List[str],
+        index: int,
+        method: Method,
+        parameters: Dict[str, Any],
+        fallback: List[_Node],
+    ) -> _Node | None:
+        if index == len(segments):
+            return self._accept(node, method, fallback)
+
+        segment = segments[index]
+        child = node.children.get(segment)
+        if child is not None:
+            found = self._match(
+                child, segments, index + 1, method, parameters, fallback
+            )
+            if found is not None:
+                return found
+
+        for parameter in node.parameters:
+            value = parameter.converter(segment) if parameter.converter else None
+            if value is None:
+                continue
+            parameters[parameter.name] = value
+            found = self._match(
+                parameter, segments, index + 1, method, parameters, fallback
+            )
+            if found is not None:
+                return found
+            del parameters[parameter.name]
+
+        wildcard = node.wildcard
+        if wildcard is not None and (rest := "/".join(segments[index:])):
+            found = self._accept(wildcard, method, fallback)
+            if found is not None:
+                parameters[wildcard.name] = unquote(rest)
+            return found
+        return None
+
+    @staticmethod
+    def _resource(node: _Node, method: Method) -> Resource | None:
+        resource = node.resources.get(method)
+        if resource is None and method == Method.HEAD:
+            return node.resources.get(Method.GET)
+        return resource
+
+    @classmethod
+    def _accept(
+        cls, node: _Node, method: Method, fallback: List[_Node]
+    ) -> _Node | None:
+        if cls._resource(node, method) is not None:
+            return node
+        if node.resources and not fallback:
+            fallback.append(node)
+        return None
@@ -0,0 +1,51 @@
+from typing import Deque, List
+from collections import deque
+from itertools import islice
+import socket
+
+
+class SocketWriter:
+    HIGH_WATER_MARK = 64 * 1024
+    MAX_BUFFERS = 1024
+
+    def __init__(
+        self, socket: socket.socket, high_water_mark: int = HIGH_WATER_MARK
+    ) -> None:
+        self.socket = socket
+        self.high_water_mark = high_water_mark
+        self.buffers: Deque[memoryview] = deque()
+        self.size = 0
+
+    def write(self, data: bytes | memoryview) -> None:
+        buffer = memoryview(data)
+        if not buffer.nbytes:
+            return
+        self.buffers.append(buffer.cast("B") if buffer.format != "B" else buffer)
+        self.size += buffer.nbytes
+        if self.size >= self.high_water_mark:
+            self.flush()
+
+    def writelines(self, buffers: List[bytes]) -> None:
+        for buffer in buffers:
+            self.write(buffer)
+
+    def flush(self) -> None:
+        while self.buffers:
+            buffers = list(islice(self.buffers, self.MAX_BUFFERS))
+            if hasattr(self.socket, "sendmsg"):
+                sent = self.socket.sendmsg(buffers)
+            else:
+                sent = self.socket.send(buffers[0])
+            if sent == 0:
+                raise ConnectionError("Socket connection broken.")
+            self._consume(sent)
+
+    def _consume(self, sent: int) -> None:
+        self.size -= sent
+        while sent:
+            buffer = self.buffers[0]
+            if buffer.nbytes > sent:
+                self.buffers[0] = buffer[sent:]
+                return
+            sent -= buffer.nbytes
+            self.buffers.popleft()
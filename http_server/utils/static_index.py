@@ -0,0 +1,83 @@
+from ..enums import StatusCode
+from ..models.resource import FileResource
+from ..models.cache_control import CacheControl
+from .file import FileUtils
+
+from collections import OrderedDict
+from urllib.parse import unquote
+import os
+import threading
+
+
+class StaticIndex:
+    INDEX_FILE = "index.html"
+    MAX_FILES = 256
+
+    def __init__(
+        self,
+        url_prefix: str,
+        directory: str,
+        cache: CacheControl | None = None,
+        max_files: int = MAX_FILES,
+    ) -> None:
+        if not os.path.isdir(directory):
+            raise ValueError(f"'{directory}' is not a directory.")
+
+        self.url_prefix = url_prefix.rstrip("/")
+        self.directory = os.path.abspath(directory)
+        self.cache = cache
+        self.max_files = max_files
+        self.files: OrderedDict[str, FileResource] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path: str) -> FileResource | None:
+        file_path = self._file_path(path)
+        if file_path is None:
+            return None
+        return self._cached(file_path)
+
+    def find(self, path: str) -> FileResource | None:
+        file_path = self._file_path(path)
+        if file_path is None:
+            return None
+        resource = self._cached(file_path)
+        if resource is not None:
+            return resource
+        if not os.path.isfile(file_path):
+            return None
+
+        resource = FileResource(
+            file_path=file_path,
+            content_type=FileUtils.content_type(file_path),
+            success_status=StatusCode.OK,
+            cache=self.cache,
+        )
+        with self._lock:
+            resource = self.files.setdefault(file_path, resource)
+            while len(self.files) > self.max_files:
+                self.files.popitem(last=False)
+        return resource
+
+    def _cached(self, file_path: str) -> FileResource | None:
+        with self._lock:
+            resource = self.files.get(file_path)
+            if resource is not None:
+                self.files.move_to_end(file_path)
+            return resource
+
+    def _file_path(self, path: str) -> str | None:
+        if not path.startswith(f"{self.url_prefix}/"):
+            return None
+
+        segments = unquote(path[len(self.url_prefix) + 1 :]).split("/")
+        if not segments[-1]:
+            segments[-1] = self.INDEX_FILE
+        for segment in segments:
+            if (
+                not segment
+                or segment.startswith(".")
+                or "\\" in segment
+                or "\x00" in segment
+            ):
+                return None
+        return os.path.join(self.directory, *segments)
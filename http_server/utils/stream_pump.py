@@ -0,0 +1,79 @@
+from typing import AsyncIterator, Iterator, List
+import asyncio
+import threading
+
+
+class StreamPump:
+    MAX_PENDING_SIZE = 256 * 1024
+
+    def __init__(
+        self,
+        stream: Iterator[str | bytes],
+        loop: asyncio.AbstractEventLoop,
+        max_pending_size: int = MAX_PENDING_SIZE,
+    ) -> None:
+        self.stream = stream
+        self.loop = loop
+        self.max_pending_size = max_pending_size
+        self.condition = threading.Condition()
+        self.pending: List[str | bytes] = []
+        self.pending_size = 0
+        self.waiter: asyncio.Future | None = None
+        self.error: BaseException | None = None
+        self.done = False
+        self.closed = False
+
+    def run(self) -> None:
+        try:
+            for chunk in self.stream:
+                with self.condition:
+                    if self.closed:
+                        break
+                    self.pending.append(chunk)
+                    self.pending_size += len(chunk)
+                    self._wake()
+                    while (
+                        self.pending_size >= self.max_pending_size and not self.closed
+                    ):
+                        self.condition.wait()
+        except BaseException as error:
+            self.error = error
+        finally:
+            getattr(self.stream, "close", lambda: None)()
+            with self.condition:
+                self.done = True
+                self._wake()
+
+    async def batches(self) -> AsyncIterator[List[str | bytes]]:
+        while True:
+            with self.condition:
+                batch, self.pending, self.pending_size = self.pending, [], 0
+                self.condition.notify()
+                if not batch:
+                    if self.done:
+                        break
+                    waiter = self.waiter = self.loop.create_future()
+
+            if batch:
+                yield batch
+            else:
+                await waiter
+
+        if self.error is not None:
+            raise self.error
+
+    def close(self) -> None:
+        with self.condition:
+            self.closed = True
+            self.condition.notify()
+
+    def _wake(self) -> None:
+        if self.waiter is None:
+            return
+        waiter, self.waiter = self.waiter, None
+        self.loop.call_soon_threadsafe(self._set_waiter, waiter)
+
+    @staticmethod
+    def _set_waiter(waiter: asyncio.Future) -> None:
+        if not waiter.done():
+            waiter.set_result(None)
@@ -0,0 +1,65 @@
+from .html import HtmlUtils
+
+from typing import Any, Dict, List, Tuple
+from collections import OrderedDict
+import os
+import re
+import threading
+
+
+class Template:
+    PLACEHOLDER = re.compile(r"\[(\w+)\]")
+
+    def __init__(self, source: str) -> None:
+        parts = self.PLACEHOLDER.split(source)
+        self.head = parts[0]
+        self.slots: List[Tuple[str, str, str]] = [
+            (name, f"[{name}]", literal)
+            for name, literal in zip(parts[1::2], parts[2::2])
+        ]
+        self.names = list(dict.fromkeys(parts[1::2]))
+
+    def render(self, values: Dict[str, Any], autoescape: bool = True) -> str:
+        names = [name for name in self.names if name in values]
+        if autoescape:
+            rendered = HtmlUtils.escape_many(values[name] for name in names)
+        else:
+            rendered = [str(values[name]) for name in names]
+        substitutions = dict(zip(names, rendered))
+
+        parts = [self.head]
+        for name, placeholder, literal in self.slots:
+            parts.append(substitutions.get(name, placeholder))
+            parts.append(literal)
+        return "".join(parts)
+
+
+class TemplateCache:
+    MAX_TEMPLATES = 256
+    _templates: OrderedDict[str, Tuple[Tuple[int, int, int], Template]] = OrderedDict()
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls, path: str) -> Template:
+        stat = os.stat(path)
+        identity = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        with cls._lock:
+            cached = cls._templates.get(path)
+            if cached is not None and cached[0] == identity:
+                cls._templates.move_to_end(path)
+                return cached[1]
+
+        with open(path, "r") as file:
+            template = Template(file.read())
+
+        with cls._lock:
+            cls._templates[path] = (identity, template)
+            cls._templates.move_to_end(path)
+            while len(cls._templates) > cls.MAX_TEMPLATES:
+                cls._templates.popitem(last=False)
+        return template
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._templates.clear()
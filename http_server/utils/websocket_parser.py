@@ -0,0 +1,132 @@
+from ..enums.close_codes import CloseCode
+from ..enums.opcodes import Opcode
+from ..models.websocket_error import WebSocketError
+
+from typing import Tuple
+import struct
+
+
+class Frame:
+    def __init__(self, fin: bool, opcode: Opcode, payload: bytes) -> None:
+        self.fin = fin
+        self.opcode = opcode
+        self.payload = payload
+
+    def __repr__(self) -> str:
+        return f"Frame({self.opcode.name}, fin={self.fin}, {len(self.payload)} bytes)"
+
+
+class WebSocketParser:
+    MAX_MESSAGE_SIZE = 1024 * 1024
+    MAX_CONTROL_PAYLOAD = 125
+
+    def __init__(self, max_message_size: int = MAX_MESSAGE_SIZE) -> None:
+        self.max_message_size = max_message_size
+        self.buffer = bytearray()
+        self._message_opcode: Opcode | None = None
+        self._message_size = 0
+        self._header: Tuple[bool, Opcode, bytes, int, int] | None = None
+
+    def feed(self, data: bytes) -> None:
+        self.buffer += data
+
+    def next_frame(self) -> Frame | None:
+        if self._header is None:
+            self._header = self._parse_header()
+            if self._header is None:
+                return None
+
+        fin, opcode, mask, offset, length = self._header
+        if len(self.buffer) < offset + length:
+            return None
+
+        payload = self.unmask(bytes(self.buffer[offset : offset + length]), mask)
+        del self.buffer[: offset + length]
+        self._header = None
+        return Frame(fin=fin, opcode=opcode, payload=payload)
+
+    def _parse_header(self) -> Tuple[bool, Opcode, bytes, int, int] | None:
+        if len(self.buffer) < 2:
+            return None
+
+        first, second = self.buffer[0], self.buffer[1]
+        if first & 0x70:
+            raise WebSocketError("Reserved bits must not be set.")
+        if not second & 0x80:
+            raise WebSocketError("Client frames must be masked.")
+        try:
+            opcode = Opcode(first & 0x0F)
+        except ValueError:
+            raise WebSocketError(f"Unknown opcode {first & 0x0F}.")
+        fin = bool(first & 0x80)
+
+        length, offset = second & 0x7F, 2
+        if length == 126:
+            if len(self.buffer) < 4:
+                return None
+            (length,) = struct.unpack_from("!H", self.buffer, 2)
+            offset = 4
+        elif length == 127:
+            if len(self.buffer) < 10:
+                return None
+            (length,) = struct.unpack_from("!Q", self.buffer, 2)
+            if length >> 63:
+                raise WebSocketError("Frame length must not use the top bit.")
+            offset = 10
+
+        if len(self.buffer) < offset + 4:
+            return None
+        mask = bytes(self.buffer[offset : offset + 4])
+        self._validate(fin, opcode, length)
+        return fin, opcode, mask, offset + 4, length
+
+    def _validate(self, fin: bool, opcode: Opcode, length: int) -> None:
+        if opcode.is_control:
+            if not fin:
+                raise WebSocketError("Control frames must not be fragmented.")
+            if length > self.MAX_CONTROL_PAYLOAD:
+                raise WebSocketError("Control frame payload is too long.")
+            return
+
+        if opcode == Opcode.CONTINUATION:
+            if self._message_opcode is None:
+                raise WebSocketError("Continuation frame without a message.")
+            size = self._message_size + length
+        else:
+            if self._message_opcode is not None:
+                raise WebSocketError("New message before the previous one ended.")
+            size = length
+
+        if size > self.max_message_size:
+            raise WebSocketError(
+                f"Message exceeds {self.max_message_size} bytes.",
+                CloseCode.MESSAGE_TOO_BIG,
+            )
+
+        if fin:
+            self._message_opcode, self._message_size = None, 0
+        else:
+            self._message_opcode = self._message_opcode or opcode
+            self._message_size = size
+
+    @staticmethod
+    def unmask(payload: bytes, mask: bytes) -> bytes:
+        length = len(payload)
+        if not length:
+            return payload
+        key = (mask * (length // 4 + 1))[:length]
+        return (
+            int.from_bytes(payload, "little") ^ int.from_bytes(key, "little")
+        ).to_bytes(length, "little")
+
+    @staticmethod
+    def encode(opcode: Opcode, payload: bytes = b"", fin: bool = True) -> bytes:
+        first = (0x80 if fin else 0) | opcode
+        length = len(payload)
+        if length < 126:
+            header = struct.pack("!BB", first, length)
+        elif length < 1 << 16:
+            header = struct.pack("!BBH", first, 126, length)
+        else:
+            header = struct.pack("!BBQ", first, 127, length)
+        return header + payload
@@ -0,0 +1,70 @@
+from http_server import Server
+
+from typing import Callable, Dict, Tuple
+import logging
+import socket
+import threading
+
+import pytest
+
+logging.disable(logging.CRITICAL)
+
+
+class Client:
+    def __init__(self, address: Tuple[str, int]) -> None:
+        self.socket = socket.create_connection(address, timeout=5)
+        self.file = self.socket.makefile("rb")
+
+    def send(self, *requests: bytes) -> None:
+        self.socket.sendall(b"".join(requests))
+
+    def receive(self, head: bool = False) -> Tuple[int, Dict[str, str], bytes]:
+        status = int(self.file.readline().split()[1])
+        headers: Dict[str, str] = {}
+        while (line := self.file.readline()) not in (b"\r\n", b""):
+            name, _, value = line.decode().partition(":")
+            headers[name.strip()] = value.strip()
+        length = 0 if head else int(headers.get("Content-Length", 0))
+        return status, headers, self.file.read(length)
+
+    def request(
+        self, path: str = "/", method: str = "GET", **headers: str
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        self.send(encode_request(path, method, **headers))
+        return self.receive(head=method == "HEAD")
+
+    def is_closed(self) -> bool:
+        return self.file.read(1) == b""
+
+    def close(self) -> None:
+        self.file.close()
+        self.socket.close()
+
+
+def encode_request(path: str = "/", method: str = "GET", **headers: str) -> bytes:
+    lines = [f"{method} {path} HTTP/1.1", "Host: localhost"]
+    lines += [f"{name.replace('_', '-')}: {value}" for name, value in headers.items()]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode()
+
+
+@pytest.fixture
+def server() -> Server:
+    return Server(ip="127.0.0.1", port=0)
+
+
+@pytest.fixture(params=["run", "run_async"])
+def connect(request, server: Server) -> Callable[[], Client]:
+    clients = []
+    started = []
+
+    def connect() -> Client:
+        if not started:
+            target = getattr(server, request.param)
+            threading.Thread(target=target, daemon=True).start()
+            started.append(True)
+        clients.append(Client(server.socket.getsockname()))
+        return clients[-1]
+
+    yield connect
+    for client in clients:
+        client.close()
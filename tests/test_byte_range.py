@@ -0,0 +1,30 @@
+from http_server.utils.byte_range import ByteRangeUtils
+
+
+def test_parse_single_ranges():
+    assert ByteRangeUtils.parse("bytes=0-9", 100) == [(0, 9)]
+    assert ByteRangeUtils.parse("bytes=90-", 100) == [(90, 99)]
+    assert ByteRangeUtils.parse("bytes=-10", 100) == [(90, 99)]
+    assert ByteRangeUtils.parse("bytes=-500", 100) == [(0, 99)]
+    assert ByteRangeUtils.parse("bytes=50-500", 100) == [(50, 99)]
+
+
+def test_parse_merges_overlapping_ranges():
+    assert ByteRangeUtils.parse("bytes=20-29, 0-9, 5-14, 15-16", 100) == [
+        (0, 16),
+        (20, 29),
+    ]
+
+
+def test_parse_unsatisfiable_ranges():
+    assert ByteRangeUtils.parse("bytes=100-", 100) == []
+    assert ByteRangeUtils.parse("bytes=-0", 100) == []
+    assert ByteRangeUtils.parse("bytes=0-", 0) == []
+
+
+def test_parse_ignores_invalid_headers():
+    assert ByteRangeUtils.parse("items=0-9", 100) is None
+    assert ByteRangeUtils.parse("bytes=9-0", 100) is None
+    assert ByteRangeUtils.parse("bytes=a-b", 100) is None
+    assert ByteRangeUtils.parse("bytes=-", 100) is None
+    assert ByteRangeUtils.parse("bytes=" + ",".join(["0-1"] * 17), 100) is None
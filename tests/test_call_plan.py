@@ -0,0 +1,59 @@
+from http_server.decorators import inject
+from http_server.enums import Method, StatusCode
+from http_server.models import CallPlan, HttpError, Request
+
+import pytest
+
+
+def create_request(parameters: dict) -> Request:
+    return Request(
+        method=Method.GET,
+        version="HTTP/1.1",
+        path="/",
+        parameters=parameters,
+        headers={"Host": "localhost"},
+        payload=b"data",
+    )
+
+
+def test_injections_and_coercions():
+    def function(
+        a: int, b: float | None, flag: bool, name: str, payload: bytes, headers: dict
+    ) -> str:
+        return ""
+
+    plan = CallPlan(function)
+    kwargs = plan.build(
+        create_request({"a": "1", "b": "2.5", "flag": "yes", "name": "x"}), {}
+    )
+    assert kwargs == {
+        "a": 1,
+        "b": 2.5,
+        "flag": True,
+        "name": "x",
+        "payload": b"data",
+        "headers": {"Host": "localhost"},
+    }
+
+
+def test_invalid_values_and_unknown_parameters():
+    def function(a: int) -> str:
+        return ""
+
+    plan = CallPlan(function)
+    with pytest.raises(HttpError) as error:
+        plan.build(create_request({"a": "x"}), {})
+    assert error.value.status_code == StatusCode.BAD_REQUEST
+
+    with pytest.raises(AttributeError):
+        plan.build(create_request({"b": "1"}), {})
+
+
+def test_injected_function():
+    @inject(cookies=True)
+    def function(cookies: dict, count: int) -> str:
+        return ""
+
+    plan = CallPlan(function)
+    assert plan.cookies and not plan.payload
+    assert plan.build(create_request({}), {"count": "3"})["count"] == 3
@@ -0,0 +1,39 @@
+from http_server.enums import ContentType
+from http_server.utils.compressor import Compressor
+
+import zlib
+
+
+def test_negotiate_prefers_highest_quality():
+    compressor = Compressor()
+    encodings = (Compressor.BROTLI, Compressor.GZIP)
+    assert compressor.negotiate("gzip, br", encodings) == Compressor.BROTLI
+    assert compressor.negotiate("gzip, br;q=0.5", encodings) == Compressor.GZIP
+    assert compressor.negotiate("x-gzip", encodings) == Compressor.GZIP
+    assert compressor.negotiate("*;q=0.1, br;q=0", encodings) == Compressor.GZIP
+
+
+def test_negotiate_without_acceptable_encoding():
+    compressor = Compressor()
+    assert compressor.negotiate(None) is None
+    assert compressor.negotiate("identity") is None
+    assert compressor.negotiate("gzip;q=0") is None
+    assert Compressor(enabled=False).negotiate("gzip") is None
+
+
+def test_is_compressible_checks_type_and_size():
+    compressor = Compressor(min_size=100)
+    assert compressor.is_compressible(ContentType.HTML, 100)
+    assert compressor.is_compressible(ContentType.JS)
+    assert not compressor.is_compressible(ContentType.HTML, 99)
+    assert not compressor.is_compressible(ContentType.PNG, 1000)
+    assert not compressor.is_compressible(ContentType.EVENT_STREAM)
+
+
+def test_stream_output_is_decodable_after_every_chunk():
+    stream = Compressor().stream(Compressor.GZIP)
+    decompressor = zlib.decompressobj(Compressor.GZIP_WBITS)
+    for chunk in (b"first,", b"second,", b"third"):
+        assert decompressor.decompress(stream.compress(chunk)) == chunk
+    assert decompressor.decompress(stream.finish()) == b""
+    assert decompressor.eof
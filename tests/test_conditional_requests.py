@@ -0,0 +1,51 @@
+def test_file_route_revalidation(server, connect, tmp_path):
+    file = tmp_path / "page.html"
+    file.write_bytes(b"<p>page</p>")
+    server.add_file_route(str(file), path="/page")
+
+    client = connect()
+    status, headers, body = client.request("/page")
+    etag, last_modified = headers["ETag"], headers["Last-Modified"]
+    assert status == 200 and body == b"<p>page</p>"
+
+    for conditions in (
+        {"If_None_Match": etag},
+        {"If_None_Match": f'"other", W/{etag}'},
+        {"If_None_Match": "*"},
+        {"If_Modified_Since": last_modified},
+    ):
+        status, headers, body = client.request("/page", **conditions)
+        assert status == 304 and body == b""
+        assert headers["ETag"] == etag and "Content-Length" not in headers
+
+    for conditions in (
+        {"If_None_Match": '"other"'},
+        {"If_None_Match": '"other"', "If_Modified_Since": last_modified},
+        {"If_Modified_Since": "Thu, 01 Jan 1970 00:00:00 GMT"},
+        {"If_Modified_Since": "yesterday"},
+    ):
+        status, headers, body = client.request("/page", **conditions)
+        assert status == 200 and body == b"<p>page</p>"
+
+
+def test_function_route_revalidation(server, connect):
+    @server.route(path="/tagged", etag=True)
+    def tagged() -> str:
+        return "tagged"
+
+    @server.route(path="/untagged")
+    def untagged() -> str:
+        return "untagged"
+
+    client = connect()
+    status, headers, body = client.request("/tagged")
+    etag = headers["ETag"]
+    assert status == 200 and body == b"tagged"
+
+    status, headers, body = client.request("/tagged", If_None_Match=etag)
+    assert status == 304 and body == b"" and headers["ETag"] == etag
+    assert client.request("/tagged", method="HEAD", If_None_Match=etag)[0] == 304
+    assert client.request("/tagged", If_None_Match='"other"')[0] == 200
+
+    status, headers, body = client.request("/untagged", If_None_Match="*")
+    assert status == 200 and "ETag" not in headers
@@ -0,0 +1,31 @@
+from http_server.utils import DateUtils
+
+from datetime import datetime, timezone
+import time
+
+import pytest
+
+
+def test_rfc7321_defaults_to_the_current_time():
+    assert DateUtils.rfc7321() == DateUtils.now()
+    assert DateUtils.header() == f"Date: {DateUtils.now()}\r\n".encode()
+    now = DateUtils.from_http_date(DateUtils.now()).timestamp()
+    assert abs(now - time.time()) < 2
+
+
+def test_rfc7321_formats_dates():
+    date = datetime(1994, 11, 6, 8, 49, 37, tzinfo=timezone.utc)
+    assert DateUtils.rfc7321(date) == "Sun, 06 Nov 1994 08:49:37 GMT"
+
+
+def test_from_http_date_accepts_all_formats():
+    expected = datetime(1994, 11, 6, 8, 49, 37, tzinfo=timezone.utc)
+    assert DateUtils.from_http_date("Sun, 06 Nov 1994 08:49:37 GMT") == expected
+    assert DateUtils.from_http_date("Sunday, 06-Nov-94 08:49:37 GMT") == expected
+    assert DateUtils.from_http_date("Sun Nov  6 08:49:37 1994") == expected
+
+
+@pytest.mark.parametrize("string", ["", "yesterday", "Sun, 06 Foo 1994 08:49:37 GMT"])
+def test_from_http_date_rejects_invalid_dates(string):
+    with pytest.raises(ValueError):
+        DateUtils.from_http_date(string)
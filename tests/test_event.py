@@ -0,0 +1,29 @@
+from http_server.models import Event
+
+from datetime import timedelta
+
+import pytest
+
+
+def test_event_encoding():
+    event = Event(
+        data="first\nsecond", event="update", id="7", retry=timedelta(seconds=2)
+    )
+    assert event.encode() == (
+        b"event: update\nid: 7\nretry: 2000\ndata: first\ndata: second\n\n"
+    )
+    assert Event(data="").encode() == b"data: \n\n"
+
+
+def test_event_fields_must_be_single_lines():
+    with pytest.raises(ValueError):
+        Event(data="data", id="1\n2")
+
+
+def test_event_data_splits_only_on_sse_line_breaks():
+    assert Event(data="a\u2028b\x0cc").encode() == (
+        "data: a\u2028b\x0cc\n\n".encode()
+    )
+    assert Event(data="a\r\nb\rc\n").encode() == (
+        b"data: a\ndata: b\ndata: c\ndata: \n\n"
+    )
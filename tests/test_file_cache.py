@@ -0,0 +1,47 @@
+from http_server.utils.file_cache import FileCache
+
+import os
+
+
+def test_evicted_files_are_closed_once_released(tmp_path):
+    cache = FileCache(max_files=1)
+    first, second = tmp_path / "first", tmp_path / "second"
+    first.write_bytes(b"first")
+    second.write_bytes(b"second")
+
+    first_file = cache.get(str(first))
+    assert bytes(first_file.view()) == b"first"
+    second_file = cache.get(str(second))
+    assert not first_file.file.closed
+
+    first_file.release()
+    assert first_file.file.closed
+    second_file.release()
+    assert not second_file.file.closed
+
+    cache.clear()
+    assert second_file.file.closed
+
+
+def test_changed_files_are_invalidated(tmp_path):
+    cache = FileCache(stat_interval=0)
+    path = tmp_path / "file.txt"
+    path.write_bytes(b"before")
+    stat = cache.stat(str(path))
+    etag = cache.etag(str(path), stat)
+    cached = cache.get(str(path))
+    cached.release()
+    assert cache.stat(str(path)) is stat and cache.get(str(path)) is cached
+    cached.release()
+
+    path.write_bytes(b"after!")
+    mtime = stat.identity[2] + 1_000_000_000
+    os.utime(path, ns=(mtime, mtime))
+    changed = cache.stat(str(path))
+    assert changed is not stat and changed.mtime > stat.mtime
+    assert cache.etag(str(path), changed) != etag
+
+    reopened = cache.get(str(path))
+    assert reopened is not cached and cached.file.closed
+    assert bytes(reopened.view()) == b"after!"
+    reopened.release()
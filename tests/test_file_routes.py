@@ -0,0 +1,66 @@
+from http_server.enums import ContentType
+from http_server.models import FileResource
+from http_server.utils.etag import ETagUtils
+
+import asyncio
+import errno
+import os
+import threading
+
+import pytest
+
+
+def test_cold_files_are_serialized_off_the_event_loop(
+    server, connect, tmp_path, monkeypatch
+):
+    threads = []
+    from_file = ETagUtils.from_file
+
+    def record_thread(path: str) -> str:
+        threads.append(threading.current_thread().name)
+        return from_file(path)
+
+    monkeypatch.setattr(ETagUtils, "from_file", record_thread)
+    file = tmp_path / "page.html"
+    file.write_bytes(b"<p>page</p>" * 1000)
+    server.add_file_route(str(file), path="/page")
+
+    client = connect()
+    for encoding in ("gzip", "identity", "gzip"):
+        status, headers, body = client.request("/page", Accept_Encoding=encoding)
+        assert status == 200 and len(body) == int(headers["Content-Length"])
+    assert len(threads) == 1
+    assert threads[0].startswith("ThreadPoolExecutor")
+
+
+@pytest.mark.parametrize("sendfile_available", [True, False])
+def test_large_files_are_sent_with_sendfile_or_mmap(
+    server, connect, tmp_path, monkeypatch, sendfile_available
+):
+    fallbacks = []
+
+    def unavailable_sendfile(*args) -> int:
+        fallbacks.append(args)
+        raise OSError(errno.EINVAL, "sendfile is unavailable")
+
+    async def unavailable_loop_sendfile(*args, **kwargs) -> int:
+        fallbacks.append(args)
+        raise asyncio.SendfileNotAvailableError()
+
+    if not sendfile_available:
+        monkeypatch.setattr(os, "sendfile", unavailable_sendfile)
+        monkeypatch.setattr(
+            asyncio.BaseEventLoop, "sendfile", unavailable_loop_sendfile
+        )
+    data = os.urandom(FileResource.MAX_IN_MEMORY_SIZE * 4)
+    file = tmp_path / "data.bin"
+    file.write_bytes(data)
+    server.add_file_route(str(file), path="/data", content_type=ContentType.BINARY)
+
+    client = connect()
+    for _ in range(2):
+        status, _, body = client.request("/data")
+        assert status == 200 and body == data
+    status, headers, body = client.request("/data", Range="bytes=10-19,-5")
+    assert status == 206 and data[10:20] in body and data[-5:] in body
+    assert bool(fallbacks) != sendfile_available
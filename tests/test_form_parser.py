@@ -0,0 +1,78 @@
+from http_server.utils.form_parser import FormParser, MultipartParser
+
+import pytest
+
+BOUNDARY = "----boundary"
+MULTIPART = (
+    b"preamble\r\n"
+    b"------boundary\r\n"
+    b'Content-Disposition: form-data; name="title"\r\n\r\n'
+    b"hello w\xc3\xb6rld\r\n"
+    b"------boundary\r\n"
+    b'Content-Disposition: form-data; name="upload"; filename="a \\"b\\".txt"\r\n'
+    b"Content-Type: text/plain\r\n\r\n"
+    b"line\r\n------boundar\r\nline\r\n"
+    b"------boundary--\r\n"
+    b"epilogue"
+)
+
+
+def test_urlencoded_fields_across_chunks():
+    parser = FormParser.create("application/x-www-form-urlencoded", spool_size=0)
+    for chunk in (b"a=1&a=", b"2&b=%E2%82", b"%AC+x=y&empty"):
+        parser.feed(chunk)
+    form = parser.finish()
+    assert form.get_all("a") == ["1", "2"]
+    assert form["b"] == "€ x=y"
+    assert form["empty"] == ""
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, len(MULTIPART)])
+def test_multipart_fields_and_files(chunk_size):
+    parser = FormParser.create(
+        f"multipart/form-data; boundary={BOUNDARY}", spool_size=4
+    )
+    assert isinstance(parser, MultipartParser)
+    for index in range(0, len(MULTIPART), chunk_size):
+        parser.feed(MULTIPART[index : index + chunk_size])
+    form = parser.finish()
+
+    assert form["title"] == "hello wörld"
+    upload = form.file("upload")
+    assert upload is not None
+    assert upload.filename == 'a "b".txt' and upload.content_type == "text/plain"
+    content = b"line\r\n------boundar\r\nline"
+    assert upload.read() == content and upload.size == len(content)
+    form.close()
+
+
+def test_multipart_errors():
+    assert FormParser.create("text/plain", spool_size=0) is None
+    with pytest.raises(ValueError):
+        FormParser.create("multipart/form-data", spool_size=0)
+
+    parser = FormParser.create(
+        f"multipart/form-data; boundary={BOUNDARY}", spool_size=0
+    )
+    parser.feed(MULTIPART[:100])
+    with pytest.raises(ValueError):
+        parser.finish()
+
+
+def test_urlencoded_field_size_across_chunks():
+    parser = FormParser.create("application/x-www-form-urlencoded", spool_size=0)
+    parser.max_field_size = 10
+    parser.feed(b"a=1&big=123")
+    with pytest.raises(ValueError):
+        parser.feed(b"45678&b=2&c=123456789012")
+
+    parser = FormParser.create("application/x-www-form-urlencoded", spool_size=0)
+    parser.max_field_size = 10
+    parser.feed(b"a=1&big=12345")
+    with pytest.raises(ValueError):
+        parser.feed(b"6789&b=2")
+
+
+def test_form_parser_is_abstract():
+    with pytest.raises(TypeError):
+        FormParser()
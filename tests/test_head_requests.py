@@ -0,0 +1,25 @@
+from http_server.models import CacheControl
+
+from datetime import timedelta
+
+
+def test_head_is_served_by_get_routes(server, connect, tmp_path):
+    cache = CacheControl(public=True, max_age=timedelta(seconds=60))
+
+    @server.route(path="/page", cache=cache)
+    def page() -> str:
+        return "x" * 100
+
+    file = tmp_path / "file.txt"
+    file.write_bytes(b"y" * 200)
+    server.add_file_route(str(file), path="/file")
+
+    client = connect()
+    for path, length in (("/page", 100), ("/file", 200), ("/page", 100)):
+        status, headers, _ = client.request(path, method="HEAD")
+        assert status == 200
+        assert headers["Content-Length"] == str(length)
+
+    assert client.request("/missing", method="HEAD")[0] == 404
+    status, headers, body = client.request("/page")
+    assert status == 200 and body == b"x" * 100
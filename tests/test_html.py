@@ -0,0 +1,21 @@
+from http_server.utils import HtmlUtils, Markup
+
+
+def test_escape():
+    assert HtmlUtils.escape("<a href=\"x\">'&'</a>") == (
+        "&lt;a href=&quot;x&quot;&gt;&#39;&amp;&#39;&lt;/a&gt;"
+    )
+    assert HtmlUtils.escape("&amp;") == "&amp;amp;"
+    assert HtmlUtils.escape(42) == "42"
+    assert HtmlUtils.escape(Markup("<b>")) == "<b>"
+
+
+def test_escape_many_matches_escape():
+    values = ["<a>", Markup("<b>"), 3, "plain", "x\x00<y>", ""]
+    assert HtmlUtils.escape_many(values) == [HtmlUtils.escape(v) for v in values]
+    assert HtmlUtils.escape_many(["<a>", "&"]) == ["&lt;a&gt;", "&amp;"]
+    assert HtmlUtils.escape_many([]) == []
+
+
+def test_string_to_html():
+    assert HtmlUtils.string_to_html("a <b>\n\t&") == "a &lt;b&gt;<br>&emsp;&amp;"
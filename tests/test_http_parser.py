@@ -2,6 +2,7 @@ import pytest
 from http_server.models import Request, Cookie
 from http_server.enums import Method
 from http_server.utils.http_parser import HttpParser
+from http_server.utils.http_stream_parser import HttpStreamParser
 
 
 def test_get_index():
@@ -54,5 +55,101 @@ def test_invalid_request():
 
 def test_invalid_cookie():
     string = "GET / HTTP/1.1\r\nHost: www.example.com\r\nCookie: =\r\n"
+    request = HttpParser.parse(string)
     with pytest.raises(ValueError):
-        HttpParser.parse(string)
+        request.cookies
+
+
+def test_stream_request_split_across_feeds():
+    parser = HttpStreamParser()
+    parser.feed(b"GET / HTTP/1.1\r\nHo")
+    assert parser.next_request() is None
+    parser.feed(b"st: www.example.com\r\n\r\n")
+    expected = Request(
+        method=Method.GET,
+        version="HTTP/1.1",
+        path="/",
+        headers={"Host": "www.example.com"},
+    )
+    assert parser.next_request() == expected
+
+
+def test_stream_content_length_binary_payload():
+    payload = b"\x00\r\n\xff\n" * 2000
+    parser = HttpStreamParser()
+    parser.feed(b"POST /upload HTTP/1.1\r\nContent-Length: %d\r\n\r\n" % len(payload))
+    parser.feed(payload[:4096])
+    assert parser.next_request() is None
+    parser.feed(payload[4096:])
+    request = parser.next_request()
+    assert request is not None
+    assert request.payload == payload
+    assert not parser.has_buffered_data()
+
+
+def test_stream_chunked_payload():
+    parser = HttpStreamParser()
+    parser.feed(
+        b"POST / HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n"
+        b"5;ext=1\r\nhello\r\n6\r\n world\r\n0\r\nTrailer: x\r\n\r\n"
+    )
+    request = parser.next_request()
+    assert request is not None
+    assert request.payload == b"hello world"
+
+
+def test_stream_pipelined_requests():
+    parser = HttpStreamParser()
+    parser.feed(
+        b"POST /a HTTP/1.1\r\nContent-Length: 3\r\n\r\nabc"
+        b"GET /b HTTP/1.1\r\n\r\n"
+    )
+    first = parser.next_request()
+    second = parser.next_request()
+    assert first is not None and first.path == "/a" and first.payload == b"abc"
+    assert second is not None and second.path == "/b" and second.payload is None
+    assert parser.next_request() is None
+
+
+def test_stream_headers_too_large():
+    parser = HttpStreamParser(max_headers_size=64)
+    parser.feed(b"GET / HTTP/1.1\r\nX-Long: " + b"a" * 128)
+    with pytest.raises(ValueError):
+        parser.next_request()
+
+
+def test_stream_trailers_too_large():
+    parser = HttpStreamParser(max_headers_size=64)
+    parser.feed(b"POST / HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n0\r\n")
+    for _ in range(8):
+        parser.feed(b"X-Trailer: " + b"a" * 8 + b"\r\n")
+    with pytest.raises(ValueError):
+        parser.next_request()
+
+
+def test_stream_invalid_chunk_size():
+    parser = HttpStreamParser()
+    parser.feed(b"POST / HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\nzz\r\n")
+    with pytest.raises(ValueError):
+        parser.next_request()
+
+
+def test_stream_body_is_read_incrementally():
+    parser = HttpStreamParser()
+    parser.feed(b"POST / HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n6\r\nhel")
+    request = parser.next_head()
+    assert request is not None and request.payload is None
+    assert parser.read_body() == b"hel"
+    assert parser.read_body() == b"" and not parser.body_complete
+    parser.feed(b"lo \r\n5\r\nworld\r\n0\r\n\r\nGET /next HTTP/1.1\r\n\r\n")
+    assert parser.read_body() == b"lo world"
+    assert parser.body_complete
+    next_request = parser.next_head()
+    assert next_request is not None and next_request.path == "/next"
+    assert parser.body_complete
+
+
+def test_parameters_are_percent_decoded():
+    request = HttpParser.parse("GET /search?q=a%20b+c&token=x=y&flag HTTP/1.1\r\n")
+    assert request.path == "/search"
+    assert request.parameters == {"q": "a b c", "token": "x=y", "flag": ""}
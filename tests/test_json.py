@@ -0,0 +1,50 @@
+from http_server.utils import json as json_utils
+from http_server.utils import JsonUtils
+
+from dataclasses import dataclass
+from datetime import datetime
+
+import pytest
+
+
+@dataclass
+class Point:
+    x: int
+    label: str
+
+
+VALUE = {
+    "points": [Point(x=1, label="€/a")],
+    "when": datetime(2024, 1, 2, 3, 4, 5),
+    "flags": (True, None, 1.5),
+    1: "one",
+}
+EXPECTED = (
+    '{"points":[{"x":1,"label":"€/a"}],"when":"2024-01-02T03:04:05",'
+    '"flags":[true,null,1.5],"1":"one"}'
+).encode()
+
+
+@pytest.mark.parametrize("backend", ["orjson", "ujson", "json"])
+def test_backends_serialize_alike(monkeypatch, backend):
+    for name in ("orjson", "ujson"):
+        if name != backend:
+            monkeypatch.setattr(json_utils, name, None)
+    if getattr(json_utils, backend, True) is None:
+        pytest.skip(f"{backend} is not installed.")
+
+    assert JsonUtils.dumps(VALUE) == EXPECTED
+    assert JsonUtils.loads(EXPECTED)["points"] == [{"x": 1, "label": "€/a"}]
+    with pytest.raises(TypeError):
+        JsonUtils.dumps({"value": object()})
+    with pytest.raises(ValueError):
+        JsonUtils.loads(b"{")
+
+
+def test_is_serializable():
+    assert JsonUtils.is_serializable({"a": 1})
+    assert JsonUtils.is_serializable([1, 2])
+    assert JsonUtils.is_serializable(Point(x=1, label=""))
+    assert not JsonUtils.is_serializable(Point)
+    assert not JsonUtils.is_serializable("text")
+    assert not JsonUtils.is_serializable(None)
@@ -0,0 +1,78 @@
+from http_server.enums import StatusCode
+from tests.conftest import encode_request
+
+
+def test_requests_are_served_on_one_connection(server, connect):
+    @server.route(path="/echo/{text}")
+    def echo(text: str) -> str:
+        return text
+
+    client = connect()
+    for text in ("a", "b"):
+        status, headers, body = client.request(f"/echo/{text}")
+        assert status == 200 and body == text.encode()
+        assert headers["Connection"] == "keep-alive"
+
+    client.send(*(encode_request(f"/echo/{text}") for text in "cdef"))
+    assert [client.receive()[2] for _ in "cdef"] == [b"c", b"d", b"e", b"f"]
+
+
+def test_max_requests_closes_the_connection(server, connect):
+    server.max_keep_alive_requests = 2
+
+    @server.route(path="/")
+    def index() -> str:
+        return "index"
+
+    client = connect()
+    assert client.request()[1]["Keep-Alive"].endswith("max=1")
+    client.send(encode_request(), encode_request())
+    status, headers, body = client.receive()
+    assert status == 200 and headers["Connection"] == "close"
+    assert client.is_closed()
+
+
+def test_connection_close_is_honored(server, connect):
+    @server.route(path="/")
+    def index() -> str:
+        return "index"
+
+    client = connect()
+    client.send(encode_request(Connection="close"), encode_request())
+    status, headers, body = client.receive()
+    assert body == b"index" and headers["Connection"] == "close"
+    assert client.is_closed()
+
+    client = connect()
+    client.send(b"GET / HTTP/1.0\r\n\r\n")
+    assert client.receive()[1]["Connection"] == "close"
+    assert client.is_closed()
+
+    client = connect()
+    client.send(b"GET / HTTP/1.0\r\nConnection: keep-alive\r\n\r\n")
+    assert client.receive()[1]["Connection"] == "keep-alive"
+    assert client.request()[2] == b"index"
+
+
+def test_no_content_responses_are_not_framed(server, connect):
+    @server.route(path="/empty", success_status=StatusCode.NO_CONTENT)
+    def empty() -> str:
+        return ""
+
+    @server.route(path="/ignored", success_status=StatusCode.NO_CONTENT)
+    def ignored() -> str:
+        return "ignored"
+
+    @server.route(path="/")
+    def index() -> str:
+        return "index"
+
+    client = connect()
+    client.send(encode_request("/empty"), encode_request("/ignored"), encode_request())
+    for _ in range(2):
+        status, headers, body = client.receive()
+        assert status == 204 and body == b""
+        assert "Content-Length" not in headers
+        assert "Transfer-Encoding" not in headers
+        assert headers["Connection"] == "keep-alive"
+    assert client.receive()[2] == b"index"
@@ -0,0 +1,58 @@
+from http_server.enums import StatusCode
+from http_server.models import CallPlan, HttpError
+from http_server.utils.http_parser import HttpParser
+
+import pytest
+
+
+def test_parsing_is_deferred_until_access():
+    request = HttpParser.parse(
+        b"GET /items?page=2&q=a+b HTTP/1.1\r\nHost: x\r\nCookie: id=1\r\n\r\n"
+    )
+    assert request.path == "/items"
+    assert request.header() == "GET /items?page=2&q=a+b HTTP/1.1"
+    assert request._parameters is None
+    assert request._headers is None
+    assert request._cookies is None
+
+    assert request.parameters == {"page": "2", "q": "a b"}
+    assert request.headers == {"Host": "x"}
+    assert request._cookies is None
+    assert request.cookies["id"].value == "1"
+
+
+def test_case_insensitive_header_lookup():
+    request = HttpParser.parse(
+        b"GET / HTTP/1.1\r\ncontent-TYPE: text/plain\r\nX-Token: a:b\r\n\r\n"
+    )
+    assert request.get_header("Content-Type") == "text/plain"
+    assert request.get_header("x-token") == "a:b"
+    assert request.get_header("Accept") is None
+
+
+def test_multiple_cookies_in_one_header():
+    request = HttpParser.parse(
+        b"GET / HTTP/1.1\r\ncookie: a=1; b=2\r\nCookie: c=3\r\n\r\n"
+    )
+    assert {name: cookie.value for name, cookie in request.cookies.items()} == {
+        "a": "1",
+        "b": "2",
+        "c": "3",
+    }
+    assert request.get_header("Cookie") is None
+
+
+def test_invalid_headers_raise_on_access():
+    request = HttpParser.parse(b"GET / HTTP/1.1\r\nBroken\r\n\r\n")
+    with pytest.raises(ValueError):
+        request.get_header("Host")
+
+
+def test_invalid_cookies_are_bad_request():
+    def function(cookies: dict) -> str:
+        return ""
+
+    request = HttpParser.parse(b"GET / HTTP/1.1\r\nCookie: novalue\r\n\r\n")
+    with pytest.raises(HttpError) as error:
+        CallPlan(function).build(request, {})
+    assert error.value.status_code == StatusCode.BAD_REQUEST
@@ -0,0 +1,62 @@
+from http_server.enums import Method
+from http_server.models import RequestBody
+
+import asyncio
+import tempfile
+
+
+def test_spooled_body_is_iterated_in_chunks():
+    file = tempfile.SpooledTemporaryFile(max_size=16)
+    file.write(b"x" * (RequestBody.CHUNK_SIZE + 1))
+    body = RequestBody.from_file(file)
+    assert [len(chunk) for chunk in body] == [RequestBody.CHUNK_SIZE, 1]
+    body.close()
+    assert file.closed
+
+
+def test_streamed_body_reads_until_empty_chunk():
+    chunks = [b"first,", b"second", b""]
+
+    async def aread_chunk() -> bytes:
+        return chunks.pop(0)
+
+    body = RequestBody(read_chunk=lambda: b"", aread_chunk=aread_chunk)
+    assert asyncio.run(body.aread()) == b"first,second"
+    assert body.read() == b""
+
+
+def test_content_length_is_ignored_with_transfer_encoding(server, connect):
+    @server.route(Method.POST, "/echo")
+    def echo(payload: bytes | None) -> bytes:
+        return payload or b""
+
+    client = connect()
+    client.send(
+        b"POST /echo HTTP/1.1\r\nHost: localhost\r\nContent-Length: zz\r\n"
+        b"Transfer-Encoding: chunked\r\n\r\n5\r\nhello\r\n0\r\n\r\n"
+    )
+    status, _, body = client.receive()
+    assert status == 200 and body == b"hello"
+
+    server.max_body_size = 4
+    client = connect()
+    client.send(
+        b"POST /echo HTTP/1.1\r\nHost: localhost\r\nContent-Length: 1\r\n"
+        b"Transfer-Encoding: chunked\r\n\r\n5\r\nhello\r\n0\r\n\r\n"
+    )
+    assert client.receive()[0] == 413
+
+
+def test_oversized_trailers_are_rejected(server, connect):
+    @server.route(Method.POST, "/echo")
+    def echo(payload: bytes | None) -> bytes:
+        return payload or b""
+
+    client = connect()
+    trailers = b"X-Trailer: " + b"a" * 1000 + b"\r\n"
+    client.send(
+        b"POST /echo HTTP/1.1\r\nHost: localhost\r\n"
+        b"Transfer-Encoding: chunked\r\n\r\n5\r\nhello\r\n0\r\n" + trailers * 70
+    )
+    assert client.receive()[0] == 400
+    assert client.is_closed()
@@ -0,0 +1,94 @@
+from datetime import timedelta
+from http_server.enums import Method, StatusCode
+from http_server.models import CacheControl, Request, SerializedResponse
+from http_server.utils.response_cache import ResponseCache
+
+import time
+
+
+def create_response(size: int) -> SerializedResponse:
+    return SerializedResponse(
+        status_code=StatusCode.OK, head=b"HTTP/1.1 200 Ok\r\n", content=b"a" * size
+    )
+
+
+def test_cacheable_directives():
+    assert ResponseCache.is_cacheable(
+        CacheControl(public=True, max_age=timedelta(seconds=10))
+    )
+    assert not ResponseCache.is_cacheable(CacheControl(public=True))
+    assert not ResponseCache.is_cacheable(
+        CacheControl(public=True, no_store=True, max_age=timedelta(seconds=10))
+    )
+    assert not ResponseCache.is_cacheable(
+        CacheControl(private=True, max_age=timedelta(seconds=10))
+    )
+
+
+def test_key_includes_parameters_and_vary_headers():
+    first = Request(
+        method=Method.GET,
+        version="HTTP/1.1",
+        path="/",
+        parameters={"a": "1"},
+        headers={"Accept-Language": "en"},
+    )
+    second = Request(
+        method=Method.GET,
+        version="HTTP/1.1",
+        path="/",
+        parameters={"a": "1"},
+        headers={"Accept-Language": "fr"},
+    )
+    assert ResponseCache.key(first, []) == ResponseCache.key(second, [])
+    assert ResponseCache.key(first, ["Accept-Language"]) != ResponseCache.key(
+        second, ["Accept-Language"]
+    )
+
+
+def test_lru_eviction_by_size():
+    cache = ResponseCache(max_bytes=1000)
+    control = CacheControl(public=True, max_age=timedelta(seconds=10))
+    for key in range(10):
+        cache.put(key, create_response(100), control)
+
+    assert cache.size <= 1000
+    assert cache.get(0) is None
+    assert cache.get(9) is not None
+
+
+def test_stale_while_revalidate():
+    cache = ResponseCache()
+    control = CacheControl(
+        public=True,
+        max_age=timedelta(seconds=0.05),
+        stale_while_revalidate=timedelta(seconds=10),
+    )
+    cache.put("key", create_response(10), control)
+    time.sleep(0.1)
+
+    first = cache.get("key")
+    second = cache.get("key")
+    assert first is not None and first[1]
+    assert second is not None and not second[1]
+
+
+def test_cookie_vary_is_cached_per_cookie(server, connect):
+    calls = []
+
+    @server.route(
+        path="/",
+        cache=CacheControl(public=True, max_age=timedelta(seconds=60)),
+        vary=["Cookie"],
+    )
+    def index(cookies: dict) -> str:
+        calls.append(True)
+        user = cookies.get("user")
+        return f"hello {user.value if user else 'anonymous'}"
+
+    alice, bob, anonymous = connect(), connect(), connect()
+    assert alice.request(Cookie="user=alice")[2] == b"hello alice"
+    assert bob.request(Cookie="user=bob")[2] == b"hello bob"
+    assert anonymous.request()[2] == b"hello anonymous"
+    assert alice.request(Cookie="user=alice")[2] == b"hello alice"
+    assert len(calls) == 3
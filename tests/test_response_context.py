@@ -0,0 +1,37 @@
+from http_server.decorators import inject
+from http_server.models import Cookie, ResponseContext
+
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+
+import pytest
+
+
+@inject(cookies=True, headers=True)
+def handler(value: str) -> str:
+    handler.cookies.add(Cookie(name="value", value=value))
+    handler.headers["X-Value"] = value
+    return value
+
+
+def execute(value: str) -> ResponseContext:
+    context = ResponseContext()
+    with context.activate():
+        handler(value)
+    return context
+
+
+def test_contexts_are_isolated_between_threads():
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        contexts = list(executor.map(execute, [str(index) for index in range(32)]))
+
+    for index, context in enumerate(contexts):
+        assert context.headers == {"X-Value": str(index)}
+        assert [cookie.value for cookie in context.cookies] == [str(index)]
+
+
+def test_no_context_outside_of_a_request():
+    with pytest.raises(RuntimeError):
+        contextvars.Context().run(ResponseContext.current)
+    with pytest.raises(AttributeError):
+        inject(cookies=True)(lambda: None).headers
@@ -0,0 +1,82 @@
+from http_server.enums import Method, StatusCode, ContentType
+from http_server.models import HttpError, Resource, Route
+from http_server.utils.router import Router
+
+import pytest
+
+
+def create_resource() -> Resource:
+    return Resource(
+        function=lambda: None,
+        content_type=ContentType.HTML,
+        success_status=StatusCode.OK,
+    )
+
+
+def test_static_and_typed_parameters():
+    router = Router()
+    index = create_resource()
+    user = create_resource()
+    named = create_resource()
+    router.add(Route(method=Method.GET, path="/"), index)
+    router.add(Route(method=Method.GET, path="/users/{id:int}"), user)
+    router.add(Route(method=Method.GET, path="/users/{name}"), named)
+
+    assert router.find(Method.GET, "/") == (index, {})
+    assert router.find(Method.GET, "/users/42") == (user, {"id": 42})
+    assert router.find(Method.GET, "/users/a%20b") == (named, {"name": "a b"})
+
+
+def test_backtracking_and_wildcard():
+    router = Router()
+    edit = create_resource()
+    files = create_resource()
+    router.add(Route(method=Method.GET, path="/users/me/settings"), create_resource())
+    router.add(Route(method=Method.GET, path="/users/{id}/edit"), edit)
+    router.add(Route(method=Method.GET, path="/files/{path:path}"), files)
+
+    assert router.find(Method.GET, "/users/me/edit") == (edit, {"id": "me"})
+    assert router.find(Method.GET, "/files/a/b.txt") == (files, {"path": "a/b.txt"})
+
+
+def test_not_found_and_method_not_allowed():
+    router = Router()
+    router.add(Route(method=Method.GET, path="/items/{id:int}"), create_resource())
+    router.add(Route(method=Method.POST, path="/items/{id:int}"), create_resource())
+
+    with pytest.raises(HttpError) as error:
+        router.find(Method.GET, "/items/abc")
+    assert error.value.status_code == StatusCode.NOT_FOUND
+
+    with pytest.raises(HttpError) as error:
+        router.find(Method.PUT, "/items/1")
+    assert error.value.status_code == StatusCode.METHOD_NOT_ALLOWED
+    assert error.value.headers == {"Allow": "GET, HEAD, POST"}
+
+
+
+def test_head_falls_back_to_get():
+    router = Router()
+    index = create_resource()
+    item = create_resource()
+    head = create_resource()
+    router.add(Route(method=Method.GET, path="/"), index)
+    router.add(Route(method=Method.GET, path="/items/{id:int}"), item)
+    router.add(Route(method=Method.GET, path="/head"), create_resource())
+    router.add(Route(method=Method.HEAD, path="/head"), head)
+
+    assert router.find(Method.HEAD, "/") == (index, {})
+    assert router.find(Method.HEAD, "/items/1") == (item, {"id": 1})
+    assert router.find(Method.HEAD, "/head") == (head, {})
+
+    router.add(Route(method=Method.POST, path="/form"), create_resource())
+    with pytest.raises(HttpError) as error:
+        router.find(Method.HEAD, "/form")
+    assert error.value.headers == {"Allow": "POST"}
+
+def test_invalid_routes():
+    router = Router()
+    with pytest.raises(ValueError):
+        router.add(Route(method=Method.GET, path="/{id:uuid}"), create_resource())
+    with pytest.raises(ValueError):
+        router.add(Route(method=Method.GET, path="/{rest:path}/x"), create_resource())
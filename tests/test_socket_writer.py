@@ -0,0 +1,32 @@
+from http_server.utils.socket_writer import SocketWriter
+
+
+class PartialSocket:
+    def __init__(self, max_send: int) -> None:
+        self.max_send = max_send
+        self.data = bytearray()
+        self.calls = 0
+
+    def sendmsg(self, buffers) -> int:
+        self.calls += 1
+        sent = b"".join(bytes(buffer) for buffer in buffers)[: self.max_send]
+        self.data += sent
+        return len(sent)
+
+
+def test_flush_retries_partial_writes():
+    socket = PartialSocket(max_send=7)
+    writer = SocketWriter(socket=socket)
+    writer.writelines([b"head\r\n\r\n", b"", b"x" * 50, b"tail"])
+    writer.flush()
+    assert socket.data == b"head\r\n\r\n" + b"x" * 50 + b"tail"
+    assert writer.size == 0 and not writer.buffers
+
+
+def test_buffers_until_high_water_mark():
+    socket = PartialSocket(max_send=1 << 20)
+    writer = SocketWriter(socket=socket, high_water_mark=10)
+    writer.write(b"12345")
+    assert socket.calls == 0
+    writer.write(b"67890")
+    assert socket.calls == 1 and socket.data == b"1234567890"
@@ -0,0 +1,84 @@
+from http_server.enums import ContentType
+from http_server.utils.static_index import StaticIndex
+
+import pytest
+
+
+@pytest.fixture
+def site(tmp_path):
+    (tmp_path / "site" / "docs").mkdir(parents=True)
+    (tmp_path / "site" / "index.html").write_text("home")
+    (tmp_path / "site" / "docs" / "index.html").write_text("docs")
+    (tmp_path / "site" / "docs" / "a b.css").write_text("body {}")
+    (tmp_path / "site" / ".env").write_text("SECRET=1")
+    (tmp_path / "secret.txt").write_text("secret")
+    return tmp_path / "site"
+
+
+def test_files_and_index_pages_are_resolved(site):
+    index = StaticIndex(url_prefix="/static/", directory=str(site))
+    assert index.find("/static/").file_path == str(site / "index.html")
+    assert index.find("/static/docs/").file_path == str(site / "docs" / "index.html")
+    assert index.find("/static/docs") is None
+
+    stylesheet = index.find("/static/docs/a%20b.css")
+    assert stylesheet.content_type == ContentType.CSS
+    assert index.find("/static/docs/a%20b.css") is stylesheet
+
+    (site / "late.js").write_text("late")
+    assert index.find("/static/late.js").file_path == str(site / "late.js")
+
+
+def test_encodings_of_one_file_share_a_resource(site):
+    index = StaticIndex(url_prefix="/static", directory=str(site))
+    resource = index.find("/static/index.html")
+    for path in ("/static/%69ndex.html", "/static/index%2Ehtml", "/static/"):
+        assert index.get(path) is resource
+        assert index.find(path) is resource
+    assert list(index.files) == [str(site / "index.html")]
+
+
+def test_resolved_files_are_bounded(site):
+    index = StaticIndex(url_prefix="/static", directory=str(site), max_files=2)
+    for name in "abc":
+        (site / f"{name}.txt").write_text(name)
+        index.find(f"/static/{name}.txt")
+    assert list(index.files) == [str(site / "b.txt"), str(site / "c.txt")]
+    assert index.get("/static/a.txt") is None
+    assert index.find("/static/a.txt").file_path == str(site / "a.txt")
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/static/../secret.txt",
+        "/static/%2e%2e/secret.txt",
+        "/static/docs/..%2f..%2fsecret.txt",
+        "/static/.env",
+        "/static//etc/passwd",
+        "/static/docs%5c..%5c..%5csecret.txt",
+        "/static/index.html%00.css",
+        "/other/index.html",
+    ],
+)
+def test_paths_outside_the_directory_are_rejected(site, path):
+    index = StaticIndex(url_prefix="/static", directory=str(site))
+    assert index.find(path) is None
+
+
+def test_mounted_files_are_served(server, connect, site):
+    server.mount_static(url_prefix="/static", directory=str(site))
+    client = connect()
+    assert client.request("/static/docs/")[2] == b"docs"
+    assert client.request("/static/../secret.txt")[0] == 404
+    assert client.request("/static/%2e%2e/secret.txt")[0] == 404
+
+    (site / "late.txt").write_text("late")
+    status, headers, body = client.request("/static/late.txt")
+    assert status == 200 and body == b"late"
+    status, headers, _ = client.request("/static/late.txt", method="POST")
+    assert status == 405 and headers["Allow"] == "GET, HEAD"
+
+    for path in ("/static/late.txt", "/static/l%61te.txt", "/static/late%2etxt"):
+        assert client.request(path)[2] == b"late"
+    assert len(server.router.static_indexes[0].files) == 2
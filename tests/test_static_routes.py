@@ -0,0 +1,48 @@
+from http_server.enums import Method
+
+import pytest
+
+
+def test_static_route_is_serialized_once_per_encoding(server, connect):
+    calls = []
+
+    @server.route(path="/", static=True)
+    def index() -> str:
+        calls.append(True)
+        return "<p>index</p>" * 100
+
+    client = connect()
+    for _ in range(3):
+        status, headers, body = client.request(Accept_Encoding="identity")
+        assert status == 200 and body == b"<p>index</p>" * 100
+    assert len(calls) == 1
+
+    for _ in range(3):
+        status, headers, body = client.request(Accept_Encoding="gzip")
+        assert status == 200 and headers["Content-Encoding"] == "gzip"
+    assert len(calls) == 2
+
+    resource, _ = server.router.find(Method.GET, "/")
+    assert set(resource.serialized) == {None, "gzip"}
+    assert resource.serialized[None].content == b"<p>index</p>" * 100
+
+
+def test_static_route_cannot_accept_parameters(server):
+    with pytest.raises(ValueError):
+
+        @server.route(path="/{name}", static=True)
+        def greet(name: str) -> str:
+            return name
+
+
+def test_file_route_serialization_is_reused(server, connect, tmp_path):
+    file = tmp_path / "page.html"
+    file.write_bytes(b"<p>page</p>")
+    server.add_file_route(str(file), path="/page")
+    resource, _ = server.router.find(Method.GET, "/page")
+
+    client = connect()
+    assert client.request("/page", Accept_Encoding="identity")[2] == b"<p>page</p>"
+    serialized = resource.serialized_files[None][2]
+    assert client.request("/page", Accept_Encoding="identity")[2] == b"<p>page</p>"
+    assert resource.serialized_files[None][2] is serialized
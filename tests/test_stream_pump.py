@@ -0,0 +1,30 @@
+from http_server.utils.stream_pump import StreamPump
+
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+
+import pytest
+
+
+async def collect(stream, max_pending_size: int = StreamPump.MAX_PENDING_SIZE):
+    loop = asyncio.get_running_loop()
+    pump = StreamPump(stream=stream, loop=loop, max_pending_size=max_pending_size)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = loop.run_in_executor(executor, pump.run)
+        chunks = [chunk async for batch in pump.batches() for chunk in batch]
+        await future
+    return chunks
+
+
+def test_pump_yields_every_chunk_in_order():
+    chunks = [b"%d" % index for index in range(1000)]
+    assert asyncio.run(collect(iter(chunks), max_pending_size=16)) == chunks
+
+
+def test_pump_raises_producer_errors():
+    def stream():
+        yield b"data"
+        raise RuntimeError("failed")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(collect(stream()))
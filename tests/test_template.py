@@ -0,0 +1,32 @@
+from http_server.utils import FileUtils, Markup, Template, TemplateCache
+
+import os
+
+
+def test_render_escapes_values_and_keeps_unknown_placeholders():
+    template = Template("<p>[name]</p>[items][0]<i>[name]</i>")
+    escaped = "&lt;b&gt;&amp;&#39;&quot;"
+    assert (
+        template.render({"name": "<b>&'\"", "items": Markup("<ul></ul>")})
+        == f"<p>{escaped}</p><ul></ul>[0]<i>{escaped}</i>"
+    )
+    assert template.render({"name": "<b>"}, autoescape=False) == (
+        "<p><b></p>[items][0]<i><b></i>"
+    )
+
+
+def test_values_are_not_substituted_twice():
+    template = Template("[a] [b]")
+    assert template.render({"a": "[b]", "b": "x"}) == "[b] x"
+
+
+def test_cache_reloads_modified_templates(tmp_path):
+    path = tmp_path / "index.html"
+    path.write_text("<h1>[title]</h1>")
+    assert FileUtils.template(str(path), title="a") == b"<h1>a</h1>"
+    assert TemplateCache.get(str(path)) is TemplateCache.get(str(path))
+
+    path.write_text("<h2>[title]</h2>")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert FileUtils.template(str(path), title="b") == b"<h2>b</h2>"
@@ -0,0 +1,64 @@
+from http_server.enums import CloseCode, Opcode
+from http_server.models import WebSocketError
+from http_server.utils.websocket_parser import WebSocketParser
+
+import struct
+
+import pytest
+
+MASK = b"\x01\x02\x03\x04"
+
+
+def create_frame(opcode: int, payload: bytes, fin: bool = True) -> bytes:
+    first = (0x80 if fin else 0) | opcode
+    if len(payload) < 126:
+        header = struct.pack("!BB", first, 0x80 | len(payload))
+    else:
+        header = struct.pack("!BBH", first, 0x80 | 126, len(payload))
+    return header + MASK + WebSocketParser.unmask(payload, MASK)
+
+
+def test_partial_and_extended_frames():
+    parser = WebSocketParser()
+    data = create_frame(Opcode.BINARY, b"a" * 300) + create_frame(Opcode.TEXT, b"hi")
+    frames = []
+    for index in range(len(data)):
+        parser.feed(data[index : index + 1])
+        if (frame := parser.next_frame()) is not None:
+            frames.append((index, frame.opcode, frame.payload))
+
+    assert frames == [
+        (307, Opcode.BINARY, b"a" * 300),
+        (len(data) - 1, Opcode.TEXT, b"hi"),
+    ]
+
+
+def test_fragmentation_rules_and_size_limit():
+    parser = WebSocketParser(max_message_size=8)
+    parser.feed(
+        create_frame(Opcode.TEXT, b"abcd", fin=False)
+        + create_frame(Opcode.PING, b"")
+        + create_frame(Opcode.CONTINUATION, b"efgh")
+    )
+    assert [parser.next_frame().opcode for _ in range(3)] == [
+        Opcode.TEXT,
+        Opcode.PING,
+        Opcode.CONTINUATION,
+    ]
+
+    parser.feed(create_frame(Opcode.CONTINUATION, b"x"))
+    with pytest.raises(WebSocketError):
+        parser.next_frame()
+
+    parser = WebSocketParser(max_message_size=8)
+    parser.feed(create_frame(Opcode.TEXT, b"123456789"))
+    with pytest.raises(WebSocketError) as error:
+        parser.next_frame()
+    assert error.value.code == CloseCode.MESSAGE_TOO_BIG
+
+
+def test_unmasked_frames_are_rejected():
+    parser = WebSocketParser()
+    parser.feed(WebSocketParser.encode(Opcode.TEXT, b"hi"))
+    with pytest.raises(WebSocketError):
+        parser.next_frame()
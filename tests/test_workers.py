@@ -0,0 +1,63 @@
+from http_server import Server
+from http_server.handlers import SupervisorHandler
+
+import os
+import signal
+import threading
+import time
+
+import pytest
+
+
+@pytest.mark.parametrize("method", ["run", "run_async"])
+def test_workers_are_handed_to_supervisor(server, monkeypatch, method):
+    workers = []
+    monkeypatch.setattr(
+        SupervisorHandler, "run", lambda self: workers.append(self.workers)
+    )
+
+    getattr(server, method)(workers=3)
+    assert workers == [3]
+    assert server.socket.fileno() == -1
+
+
+def test_single_worker_runs_in_process(server, monkeypatch):
+    def supervise(self, target, workers) -> None:
+        raise AssertionError("Single worker should not fork.")
+
+    calls = []
+    monkeypatch.setattr(SupervisorHandler, "__init__", supervise)
+    monkeypatch.setattr(Server, "_run", lambda self, max_workers: calls.append(True))
+
+    server.run(workers=1)
+    assert calls == [True]
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires fork.")
+def test_supervisor_forks_every_worker():
+    read_fd, write_fd = os.pipe()
+
+    def target() -> None:
+        os.write(write_fd, f"{os.getpid()}\n".encode())
+        time.sleep(10)
+
+    def stop() -> None:
+        with os.fdopen(read_fd) as pipe:
+            pids.extend(int(pipe.readline()) for _ in range(3))
+        while len(supervisor.children) < 3:
+            time.sleep(0.01)
+        os.kill(os.getpid(), signal.SIGTERM)
+
+    pids = []
+    handlers = signal.getsignal(signal.SIGTERM), signal.getsignal(signal.SIGINT)
+    threading.Thread(target=stop, daemon=True).start()
+    supervisor = SupervisorHandler(target=target, workers=3)
+    try:
+        supervisor.run()
+    finally:
+        signal.signal(signal.SIGTERM, handlers[0])
+        signal.signal(signal.SIGINT, handlers[1])
+        os.close(write_fd)
+
+    assert len(set(pids)) == 3 and os.getpid() not in pids
+    assert supervisor.children == set()